@@ -1,4 +1,6 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import json
+import multiprocessing
 import os
 import numpy as np
 import pyqtgraph as pg
@@ -23,9 +25,12 @@ from utils.gui_styles import GUIStyles
 from utils.layout_utilities import clear_layout_widgets, draw_layout_separator
 from components.lin_log_control import LinLogControl
 from utils.resource_path import resource_path
+from utils.fit_cache import fit_result_cache
 from utils.fitting_utilities import (
     convert_fitting_result_into_json_serializable_item,
-    fit_decay_curve,
+    fit_decay_curve_job,
+    fit_decay_curves_job,
+    init_fitting_process,
 )
 import settings.settings as s
 
@@ -111,6 +116,10 @@ class FittingDecayConfigPopup(QWidget):
         self.roi_regions = {}  # Store ROI regions for multi-file mode
         self.cached_counts_data = {}
         self.cached_fitted_data = {}
+        # Process pool reused by every fitting run of the popup, see get_fitting_pool
+        self.fitting_pool = None
+        self.fitting_pool_workers = max(1, os.cpu_count() or 1)
+        self.fitting_stop_event = None
         self.file_colors = [
             "#f72828",
             "#00FF00",
@@ -396,14 +405,23 @@ class FittingDecayConfigPopup(QWidget):
         loading_row.addWidget(self.loading_text)
         loading_row.addSpacing(5)
         loading_row.addWidget(self.gif_label)
+        self.cache_stats_text = QLabel("")
+        self.cache_stats_text.setStyleSheet(
+            "font-family: Montserrat; font-size: 12px; color: #a9a9a9"
+        )
+        loading_row.addWidget(self.cache_stats_text)
         self.loading_text.setVisible(False)
         self.gif_label.setVisible(False)
+        self.cache_stats_text.setVisible(False)
         return loading_row
 
     def start_fitting(self):
         clear_layout_widgets(self.errors_layout)
+        self.cancel_fitting()
+        self.loading_text.setText("Processing data...")
         self.loading_text.setVisible(True)
         self.gif_label.setVisible(True)
+        self.cache_stats_text.setVisible(False)
         self.worker = FittingWorker(
             self.data,
             self.roi_checkboxes,
@@ -411,11 +429,82 @@ class FittingDecayConfigPopup(QWidget):
             self.cut_data_y,
             self.y_data_shift,
             self.roi_regions,  # Pass ROI regions for multi-file mode
+            self.get_fitting_pool(),
+            self.fitting_pool_workers,
+            self.fitting_stop_event,
         )
         self.worker.fitting_done.connect(self.handle_fitting_done)
+        self.worker.progress.connect(self.handle_fitting_progress)
         self.worker.error_occurred.connect(self.handle_error)
         self.worker.start()
 
+    def get_fitting_pool(self):
+        """
+        Returns the process pool of the fitting jobs, starting it on first use.
+
+        Returns:
+            ProcessPoolExecutor: The pool, whose workers share self.fitting_stop_event.
+        """
+        if self.fitting_pool is None:
+            self.fitting_stop_event = multiprocessing.Event()
+            self.fitting_pool = ProcessPoolExecutor(
+                max_workers=self.fitting_pool_workers,
+                initializer=init_fitting_process,
+                initargs=(self.fitting_stop_event,),
+            )
+        return self.fitting_pool
+
+    def shutdown_fitting_pool(self):
+        """Stops the process pool of the fitting jobs, if started."""
+        if self.fitting_pool is not None:
+            self.fitting_pool.shutdown(wait=False, cancel_futures=True)
+            self.fitting_pool = None
+            self.fitting_stop_event = None
+
+    def cancel_fitting(self):
+        """
+        Cancels the running fitting, if any, and waits for the worker to stop.
+
+        The running jobs abort at their next model evaluation, so the wait is short.
+        """
+        worker = getattr(self, "worker", None)
+        if worker is not None and worker.isRunning():
+            worker.fitting_done.disconnect(self.handle_fitting_done)
+            worker.cancel()
+            worker.wait()
+
+    def show_cache_stats(self):
+        """Shows the fit cache hits and misses of the last fitting run."""
+        worker = getattr(self, "worker", None)
+        if worker is None:
+            return
+        hits = worker.cache_stats["hits"]
+        misses = worker.cache_stats["misses"]
+        self.cache_stats_text.setText(f"Fit cache: {hits} hits, {misses} misses")
+        self.cache_stats_text.setVisible(True)
+
+    @pyqtSlot(int, int)
+    def handle_fitting_progress(self, completed, total):
+        """
+        Slot to show the progress of the fitting process.
+
+        Args:
+            completed (int): The number of curves fitted so far.
+            total (int): The total number of curves to fit.
+        """
+        self.loading_text.setText(f"Processing data... ({completed}/{total})")
+
+    def closeEvent(self, event):
+        """
+        Cancels any running fitting and stops the process pool when the popup is closed.
+
+        Args:
+            event: The close event.
+        """
+        self.cancel_fitting()
+        self.shutdown_fitting_pool()
+        super().closeEvent(event)
+
     def process_fitting_results(self, results):
         """
         Processes and displays the fitting results received from the worker.
@@ -550,6 +639,7 @@ class FittingDecayConfigPopup(QWidget):
         """
         self.loading_text.setVisible(False)
         self.gif_label.setVisible(False)
+        self.show_cache_stats()
         # Process results
         self.process_fitting_results(results)
         # Enable and style the export button
@@ -568,6 +658,8 @@ class FittingDecayConfigPopup(QWidget):
         """
         self.loading_text.setVisible(False)
         self.gif_label.setVisible(False)
+        # The pool may be broken (e.g. a worker process died), start a new one next time
+        self.shutdown_fitting_pool()
         self.display_error(error_message, "")
 
     def display_spectroscopy_curve(self, plot_widget, channel):
@@ -1922,16 +2014,33 @@ class FittingWorker(QThread):
     A worker thread to perform the decay curve fitting in the background.
 
     This prevents the GUI from freezing during the potentially long fitting process.
+    Curves already fitted with the same data and settings are taken from the
+    fit result cache. Curves sharing the same time axis are split in up to one
+    batch per core of at least s.FIT_BATCH_MIN_CURVES curves, and each batch is
+    fitted at once with fit_decay_curves; below that size the vectorized fit is
+    not faster, so the curves are fitted one by one with fit_decay_curve. The
+    fitting path is chosen per time axis before the cache lookup and is part of
+    the cache key, so a result is only reused for the path that produced it.
+    The jobs run in parallel on the process pool of the popup, whose workers
+    share a stop event: cancelling sets it, so the running jobs abort at their
+    next model evaluation instead of computing until done.
 
     Signals:
-        fitting_done (pyqtSignal): Emitted when fitting is complete, carrying a list of results.
+        fitting_done (pyqtSignal): Emitted when fitting is complete, carrying a list of results
+            in the same order as the input data, whatever the completion order.
+        result_ready (pyqtSignal): Emitted as soon as a job completes, with its input index and result.
+        progress (pyqtSignal): Emitted after each completed job with (completed, total).
         error_occurred (pyqtSignal): Emitted if an error occurs during fitting.
+        cancelled (pyqtSignal): Emitted if the fitting is cancelled before completion.
     """
 
     fitting_done = pyqtSignal(
         list
     )  # Emit a list of tuples (chart title (channel),  fitting result)
+    result_ready = pyqtSignal(int, dict)
+    progress = pyqtSignal(int, int)
     error_occurred = pyqtSignal(str)  # Emit an error message
+    cancelled = pyqtSignal()
 
     def __init__(
         self,
@@ -1941,6 +2050,9 @@ class FittingWorker(QThread):
         cut_data_y,
         y_data_shift,
         roi_regions,
+        executor,
+        max_workers,
+        stop_event,
         parent=None,
     ):
         """
@@ -1953,6 +2065,9 @@ class FittingWorker(QThread):
             cut_data_y (dict): A dictionary of y-data, cut by ROI (for single file mode).
             y_data_shift (int): A global time shift to apply to the data.
             roi_regions (dict): A dictionary of ROI regions (min, max) for each channel.
+            executor (ProcessPoolExecutor): The process pool running the fitting jobs.
+            max_workers (int): The number of processes of the pool.
+            stop_event (multiprocessing.Event): The stop event shared by the pool workers.
             parent (QObject, optional): The parent object. Defaults to None.
         """
         super().__init__(parent)
@@ -1962,6 +2077,16 @@ class FittingWorker(QThread):
         self.cut_data_y = cut_data_y
         self.y_data_shift = y_data_shift
         self.roi_regions = roi_regions
+        self.executor = executor
+        self.max_workers = max_workers
+        self.stop_event = stop_event
+        self._cancel_requested = False
+        self._cache_keys = {}
+        self.cache_stats = {"hits": 0, "misses": 0}
+
+    def cancel(self):
+        """Requests the cancellation of the jobs not yet completed."""
+        self._cancel_requested = True
 
     def get_data_point(self, data_point, channel):
         """
@@ -2001,36 +2126,180 @@ class FittingWorker(QThread):
         else:
             return data_point["x"], data_point["y"]
 
-    def run(self):
+    def get_roi(self, channel):
         """
-        The main execution method of the thread.
+        Args:
+            channel (int): The channel index.
+
+        Returns:
+            tuple | None: The (min, max) ROI bounds of the channel, None if no ROI is active.
+        """
+        if channel in self.roi_checkboxes and self.roi_checkboxes[channel].isChecked():
+            return self.roi_regions.get(channel)
+        return None
+
+    def group_by_time_axis(self, cached):
+        """
+        Groups the curves to fit by time axis, taking the already fitted ones from the cache.
+
+        A time axis shared by at least s.FIT_BATCH_MIN_CURVES curves is fitted
+        in batches, decided on all its curves so that the cache keys match the
+        path the curves not in the cache are fitted with.
+
+        Args:
+            cached (list): Filled with the (idx, result) pairs found in the cache.
 
-        Iterates through the data for each channel, performs the fitting,
-        and emits the results or an error.
+        Returns:
+            list: (x, batched, [(idx, y), ...]) for each distinct time axis with curves
+                  not in the cache, in input order. Curves whose x and y lengths
+                  differ are alone in their group.
         """
-        results = []
+        groups = {}
         for idx, data_point in enumerate(self.data):
-            try:
-                x, y = self.get_data_point(data_point, data_point["channel_index"])
-                result = fit_decay_curve(
+            x, y = self.get_data_point(data_point, data_point["channel_index"])
+            x, y = np.asarray(x), np.asarray(y)
+            key = (x.shape, x.tobytes()) if len(x) == len(y) else ("single", idx)
+            groups.setdefault(key, (x, []))[1].append((idx, y))
+        uncached_groups = []
+        for x, curves in groups.values():
+            batched = len(curves) >= s.FIT_BATCH_MIN_CURVES
+            uncached = []
+            for idx, y in curves:
+                data_point = self.data[idx]
+                cache_key = fit_result_cache.make_key(
                     x,
                     y,
-                    data_point["channel_index"],
-                    y_shift=data_point["time_shift"],
+                    self.get_roi(data_point["channel_index"]),
+                    data_point["time_shift"],
+                    batched=batched,
                 )
-                # Preserve file_index and file_name from input data
-                if "file_index" in data_point:
-                    result["file_index"] = data_point["file_index"]
-                if "file_name" in data_point:
-                    result["file_name"] = data_point["file_name"]
-                results.append((result))
-            except TimeoutError as te:
-                self.error_occurred.emit(f"An error occurred: {str(te)}")
-                return
-            except Exception as e:
-                import traceback
+                result = fit_result_cache.get(cache_key)
+                if result is not None:
+                    self.cache_stats["hits"] += 1
+                    cached.append((idx, result))
+                    continue
+                self.cache_stats["misses"] += 1
+                self._cache_keys[idx] = cache_key
+                uncached.append((idx, y))
+            if uncached:
+                uncached_groups.append((x, batched, uncached))
+        return uncached_groups
+
+    def submit_jobs(self, executor, max_workers, cached):
+        """
+        Submits the fitting jobs of the curves not in the cache to the pool.
 
-                traceback.print_exc()
-                self.error_occurred.emit(f"An error occurred: {str(e)}")
-                return
+        Args:
+            executor (ProcessPoolExecutor): The process pool.
+            max_workers (int): The number of processes of the pool.
+            cached (list): Filled with the (idx, result) pairs found in the cache.
+
+        Returns:
+            dict: The input indexes of the curves fitted by each future.
+        """
+        futures = {}
+        for x, batched, curves in self.group_by_time_axis(cached):
+            if not batched:
+                for idx, y in curves:
+                    future = executor.submit(
+                        fit_decay_curve_job,
+                        x,
+                        y,
+                        self.data[idx]["channel_index"],
+                        y_shift=self.data[idx]["time_shift"],
+                    )
+                    futures[future] = [idx]
+                continue
+            batches = max(1, min(max_workers, len(curves) // s.FIT_BATCH_MIN_CURVES))
+            batch_size = -(-len(curves) // batches)
+            for start in range(0, len(curves), batch_size):
+                batch = curves[start : start + batch_size]
+                indexes = [idx for idx, _ in batch]
+                future = executor.submit(
+                    fit_decay_curves_job,
+                    x,
+                    np.stack([y for _, y in batch]),
+                    [self.data[idx]["channel_index"] for idx in indexes],
+                )
+                futures[future] = indexes
+        return futures
+
+    def store_result(self, idx, result, results):
+        """
+        Stores the result of a curve and notifies it.
+
+        Args:
+            idx (int): The input index of the curve.
+            result (dict): The fitting result.
+            results (list): The results, in input order.
+        """
+        data_point = self.data[idx]
+        # Preserve file_index and file_name from input data
+        if "file_index" in data_point:
+            result["file_index"] = data_point["file_index"]
+        if "file_name" in data_point:
+            result["file_name"] = data_point["file_name"]
+        results[idx] = result
+        self.result_ready.emit(idx, result)
+
+    def stop_jobs(self, futures):
+        """
+        Stops the jobs of this run: the queued ones are dropped and the running
+        ones abort through the stop event, which is cleared once they have
+        returned so the pool can be reused.
+
+        Args:
+            futures (iterable[Future]): The jobs of this run.
+        """
+        self.stop_event.set()
+        running = [future for future in futures if not future.cancel()]
+        wait(running)
+        self.stop_event.clear()
+
+    def run(self):
+        """
+        The main execution method of the thread.
+
+        Submits the fitting jobs to the process pool, streams each result as its
+        job completes and finally emits all the results in input order, or an error.
+        """
+        total = len(self.data)
+        results = [None] * total
+        if total == 0:
+            self.fitting_done.emit(results)
+            return
+        max_workers = max(1, min(total, self.max_workers))
+        futures = {}
+        try:
+            cached = []
+            futures = self.submit_jobs(self.executor, max_workers, cached)
+            pending = set(futures)
+            completed = 0
+            for idx, result in cached:
+                self.store_result(idx, result, results)
+                completed += 1
+            if cached:
+                self.progress.emit(completed, total)
+            while pending:
+                if self._cancel_requested:
+                    self.stop_jobs(futures)
+                    self.cancelled.emit()
+                    return
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job_results = future.result()
+                    if isinstance(job_results, dict):
+                        job_results = [job_results]
+                    for idx, result in zip(futures[future], job_results):
+                        fit_result_cache.put(self._cache_keys[idx], result)
+                        self.store_result(idx, result, results)
+                        completed += 1
+                    self.progress.emit(completed, total)
+        except Exception as e:
+            import traceback
+
+            traceback.print_exc()
+            self.stop_jobs(futures)
+            self.error_occurred.emit(f"An error occurred: {str(e)}")
+            return
         self.fitting_done.emit(results)
@@ -1,5 +1,6 @@
 import json
 import os
+import weakref
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import (
@@ -24,6 +25,12 @@ class LinLogControl(QWidget):
     It is designed to be placed alongside a pyqtgraph plot to control the
     y-axis scale.
     """
+
+    # Log-scale ticks memoized by exponents, see log_ticks
+    _log_ticks_cache = {}
+    # The ticks last applied to each axis, see set_axis_ticks
+    _applied_ticks = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         window,
@@ -148,7 +155,7 @@ class LinLogControl(QWidget):
             decay_widget.showGrid(x=False, y=True, alpha=0.3)
         y = np.roll(y_data, time_shifts)
         decay_curve.setData(x, y)
-        decay_widget.getAxis("left").setTicks([ticks])
+        LinLogControl.set_axis_ticks(decay_widget.getAxis("left"), ticks)
         PlotsController.set_plot_y_range(decay_widget)
 
 
@@ -315,10 +322,7 @@ class LinLogControl(QWidget):
         log_values, exponents_lin_space_int, max_value = (
             LinLogControl.set_decay_log_mode(y_values)
         )
-        ticks = [
-            (i, LinLogControl.format_power_of_ten(i))
-            for i in exponents_lin_space_int
-        ]
+        ticks = LinLogControl.log_ticks(exponents_lin_space_int)
         return ticks, log_values, max_value
 
     @staticmethod
@@ -342,11 +346,13 @@ class LinLogControl(QWidget):
         return ticks
 
     @staticmethod
-    def calculate_log_ticks(data):
+    def calculate_log_ticks(data, out=None):
         """Calculates logarithmic values and corresponding tick labels for a dataset.
 
         Args:
             data (np.ndarray): The input data array.
+            out (np.ndarray, optional): A reusable float64 buffer for the log values,
+                used when its shape matches the data. Defaults to None.
 
         Returns:
             tuple: A tuple containing:
@@ -355,16 +361,13 @@ class LinLogControl(QWidget):
                 - float: The maximum exponent value from the data.
         """
         log_values, exponents_lin_space_int, max_value = (
-            LinLogControl.set_decay_log_mode(data)
+            LinLogControl.set_decay_log_mode(data, out)
         )
-        ticks = [
-            (i, LinLogControl.format_power_of_ten(i))
-            for i in exponents_lin_space_int
-        ]
+        ticks = LinLogControl.log_ticks(exponents_lin_space_int)
         return log_values, ticks, max_value
 
     @staticmethod
-    def set_decay_log_mode(values):
+    def set_decay_log_mode(values, out=None):
         """
         Converts data values to a logarithmic scale for plotting.
 
@@ -373,22 +376,67 @@ class LinLogControl(QWidget):
 
         Args:
             values (np.ndarray): The input data array.
+            out (np.ndarray, optional): A reusable float64 buffer for the log values,
+                used when its shape matches the data. Defaults to None.
 
         Returns:
             tuple: A tuple containing:
                 - np.ndarray: The log-transformed values.
-                - np.ndarray: An array of integers for tick positions.
+                - np.ndarray: The distinct integer tick positions.
                 - int: The maximum integer exponent.
         """
-        values = np.array(values)
-        values = np.where(values <= 0, 1e-9, values)
-        log_values = np.log10(values)
-        log_values = np.where(log_values < 0, -0.1, log_values)
-        exponents_int = log_values.astype(int)
-        exponents_lin_space_int = np.linspace(
-            0, max(exponents_int), len(exponents_int)
-        ).astype(int)
-        return log_values, exponents_lin_space_int, max(exponents_int)
+        values = np.asarray(values, dtype=np.float64)
+        if out is None or out.shape != values.shape:
+            out = np.empty(values.shape, dtype=np.float64)
+        log_values = np.maximum(values, 1e-9, out=out)
+        np.log10(log_values, out=log_values)
+        log_values[log_values < 0] = -0.1
+        max_log_value = np.nanmax(log_values) if len(log_values) > 0 else 0
+        max_exponent = int(max_log_value) if np.isfinite(max_log_value) else 0
+        if len(log_values) > max_exponent:
+            exponents_lin_space_int = np.arange(max_exponent + 1)
+        else:
+            exponents_lin_space_int = np.unique(
+                np.linspace(0, max_exponent, len(log_values)).astype(int)
+            )
+        return log_values, exponents_lin_space_int, max_exponent
+
+    @staticmethod
+    def log_ticks(exponents):
+        """Returns the (position, label) ticks of a log-scale axis.
+
+        The ticks are memoized by exponents, so the labels are only formatted
+        once. They are returned as a tuple, which callers cannot modify.
+
+        Args:
+            exponents (np.ndarray): The distinct integer tick positions.
+
+        Returns:
+            tuple: A tuple of (position, label) tuples for ticks.
+        """
+        key = tuple(int(i) for i in exponents)
+        ticks = LinLogControl._log_ticks_cache.get(key)
+        if ticks is None:
+            ticks = tuple((i, LinLogControl.format_power_of_ten(i)) for i in key)
+            LinLogControl._log_ticks_cache[key] = ticks
+        return ticks
+
+    @staticmethod
+    def set_axis_ticks(axis, ticks):
+        """Sets the major ticks of an axis, unless they are the ones last applied.
+
+        The ticks of the decay plots must all be set through this method, so
+        the last applied ticks are known without reading the axis state.
+
+        Args:
+            axis (pg.AxisItem): The axis to update.
+            ticks (list | tuple): The (position, label) tuples, e.g. from log_ticks.
+        """
+        ticks = tuple(ticks)
+        if LinLogControl._applied_ticks.get(axis) == ticks:
+            return
+        axis.setTicks([ticks])
+        LinLogControl._applied_ticks[axis] = ticks
 
     @staticmethod
     def format_power_of_ten(i):
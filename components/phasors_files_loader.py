@@ -0,0 +1,87 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+import settings.settings as s
+
+
+class PhasorsFilesLoader(QThread):
+    """
+    A worker thread decoding the files of a PhasorsDataset on a thread pool.
+
+    Signals:
+        file_loaded (pyqtSignal): Emitted with the file index as soon as a file is decoded.
+        file_failed (pyqtSignal): Emitted with the file index and the error message.
+        loading_done (pyqtSignal): Emitted when all the files have been processed.
+    """
+
+    file_loaded = pyqtSignal(int)
+    file_failed = pyqtSignal(int, str)
+    loading_done = pyqtSignal()
+
+    def __init__(self, dataset, max_workers=s.PHASORS_LOAD_WORKERS, parent=None):
+        """
+        Initializes the PhasorsFilesLoader.
+
+        Args:
+            dataset (PhasorsDataset): The files to decode.
+            max_workers (int, optional): The number of decoding threads.
+                                         Defaults to s.PHASORS_LOAD_WORKERS.
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.dataset = dataset
+        self.max_workers = max_workers
+        self._cancel_requested = False
+
+    def cancel(self):
+        """
+        Requests the cancellation of the files not yet decoded.
+
+        The thread is not waited for: it returns at its next poll, and the
+        decodes already running finish on their own without being emitted.
+        """
+        self._cancel_requested = True
+
+    def run(self):
+        """
+        Decodes all the files in order, emitting each one as it completes.
+
+        Every decoded file is pinned in the dataset until the plot releases
+        it, and no new decode is started while the pinned and running decodes
+        reach the dataset cap, so memory stays bounded whether or not the
+        plot is consuming the files.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {}
+        pending = set()
+        next_index = 0
+        while next_index < len(self.dataset) or pending:
+            if self._cancel_requested:
+                executor.shutdown(wait=False, cancel_futures=True)
+                return
+            while (
+                next_index < len(self.dataset)
+                and self.dataset.pinned_count() + len(pending) < self.dataset.max_decoded
+            ):
+                future = executor.submit(self.dataset.load, next_index, True)
+                futures[future] = next_index
+                pending.add(future)
+                next_index += 1
+            if not pending:
+                # Waiting for the plot to release decoded files
+                self.msleep(100)
+                continue
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                if self._cancel_requested:
+                    break
+                file_index = futures.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    self.file_failed.emit(file_index, str(e))
+                    continue
+                self.file_loaded.emit(file_index)
+        executor.shutdown(wait=True)
+        self.loading_done.emit()
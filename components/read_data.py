@@ -12,12 +12,13 @@ Classes:
     ReaderMetadataPopup: Popup window for displaying file metadata
     WorkerSignals: Qt signals for background tasks
     SavePlotTask: Background task for saving plot images
+    FileDecodeSignals: Qt signals for background file decoding
+    DecodeBinFileTask: Background task for decoding binary data files
 """
 
 from functools import partial
 import json
 import os
-import struct
 from matplotlib import pyplot as plt
 import numpy as np
 from components.box_message import BoxMessage
@@ -29,6 +30,13 @@ from utils.channel_name_utils import get_channel_name
 from utils.messages_utilities import MessagesUtilities
 from utils.resource_path import resource_path
 from utils.fitting_utilities import convert_json_serializable_item_into_np_fitting_result
+from utils.bin_readers import DecodeCancelled, sum_channel_curves
+from utils.decoded_file_cache import decoded_file_cache
+from utils.spectroscopy_summary import read_spectroscopy_summary
+from utils.phasors_dataset import PhasorsDataset
+from components.phasors_files_loader import PhasorsFilesLoader
+from components.progress_bar import ProgressBar
+from utils.phasors_store import PhasorPointStore
 from utils.logo_utilities import TitlebarIcon
 import settings.settings as s
 from PyQt6.QtWidgets import (
@@ -76,15 +84,44 @@ class ReadData:
             None: Updates app.reader_data with loaded data
         """
         active_tab = ReadData.get_data_type(tab_selected)
-        file_info = {
-            "spectroscopy": (b"SP01", "Spectroscopy", ReadData.read_spectroscopy_data),
-            "phasors": (b"SPF1", "Phasors", ReadData.read_phasors_data),
-        }
+        file_info = ReadData.bin_file_info()
         if file_type not in file_info:
             return
         result = ReadData.read_bin(window, app, *file_info[file_type], active_tab)
         if not result:
             return
+        ReadData.store_bin_data(app, active_tab, result)
+
+    @staticmethod
+    def bin_file_info():
+        """
+        Get the magic bytes, label and reader of each binary file type.
+
+        Returns:
+            dict: file type -> (magic bytes, label, read data callback)
+        """
+        return {
+            "spectroscopy": (b"SP01", "Spectroscopy", ReadData.read_spectroscopy_data),
+            "phasors": (b"SPF1", "Phasors", ReadData.read_phasors_data),
+        }
+
+    @staticmethod
+    def store_bin_data(app, active_tab, result):
+        """
+        Store the content of a decoded binary file into app.reader_data.
+
+        Must be called from the GUI thread: the whole entry is replaced at once,
+        so the plots never see a partially loaded file.
+
+        Args:
+            app: Main application instance
+            active_tab (str): Data type of the current tab
+            result (tuple): (file_name, file_type, *data, metadata), as returned
+                by read_spectroscopy_data / read_phasors_data
+
+        Returns:
+            None: Updates app.reader_data with loaded data
+        """
         file_name, file_type, *data, metadata = result
         app.reader_data[active_tab]["plots"] = []
         app.reader_data[active_tab]["metadata"] = metadata
@@ -104,7 +141,7 @@ class ReadData:
                 }
         elif file_type == "phasors":
             phasors_data = data[0]
-            app.reader_data[active_tab]["data"]["phasors_data"] = phasors_data
+            app.reader_data[active_tab]["data"]["phasors_data"] = [phasors_data]
             app.reader_data[active_tab]["phasors_metadata"] = metadata
             
             
@@ -185,20 +222,21 @@ class ReadData:
         dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
         filter_pattern = "Bin files (*.bin)"
         dialog.setNameFilter(filter_pattern)
+        max_files = s.PHASORS_READ_MAX_FILES
         file_names, _ = dialog.getOpenFileNames(
             window,
-            f"Load multiple {file_type} files (max 4)",
+            f"Load multiple {file_type} files (max {max_files})",
             "",
             filter_pattern
         )
         
         if not file_names:
             return []
-        if len(file_names) > 4:
+        if len(file_names) > max_files:
             ReadData.show_warning_message(
-                "Too many files", "You can select a maximum of 4 files. Only the first 4 will be loaded."
+                "Too many files", f"You can select a maximum of {max_files} files. Only the first {max_files} will be loaded."
             )
-            file_names = file_names[:4]
+            file_names = file_names[:max_files]
         # Validate each file by checking magic bytes
         valid_files = []
         invalid_count = 0
@@ -615,8 +653,24 @@ class ReadData:
                 )
             
             phasors_data = app.reader_data["phasors"]["data"]["phasors_data"]
-            grouped_data = ReadData.group_phasors_data_without_channels(phasors_data)
-            ReadData.plot_phasors_data(app, grouped_data, max_harmonic, laser_period_ns)
+            if isinstance(phasors_data, PhasorsDataset):
+                if app.phasors_live_plot:
+                    # The pushed files were released from the dataset, replot their stored points
+                    grouped_data = dict(app.all_phasors_points[0])
+                else:
+                    # Plot the files decoded so far, the others are pushed as they complete
+                    app.phasors_pushed_files = ReadData.count_ready_phasors_files(app)
+                    file_indexes = ReadData.loaded_phasors_files(app, 0, app.phasors_pushed_files)
+                    grouped_data = ReadData.group_phasors_data_without_channels(
+                        phasors_data, file_indexes
+                    )
+                    phasors_data.release(file_indexes)
+                ReadData.plot_phasors_data(app, grouped_data, max_harmonic, laser_period_ns)
+                app.phasors_live_plot = True
+                ReadData.push_ready_phasors_files(app)
+            else:
+                grouped_data = ReadData.group_phasors_data_without_channels(phasors_data)
+                ReadData.plot_phasors_data(app, grouped_data, max_harmonic, laser_period_ns)
 
     @staticmethod
     def plot_spectroscopy_data(
@@ -742,7 +796,7 @@ class ReadData:
                         widget_key = logical_channel
                     
                     if logical_channel in app.plots_to_show:
-                        y_values = np.sum(curves, axis=0)
+                        y_values = sum_channel_curves(file_channels_curves, channel)
                         
                         # Accumulate y_values for caching
                         ch_idx = logical_channel
@@ -797,7 +851,9 @@ class ReadData:
                     widget_key_for_ticks = ch_idx
                     
                 if widget_key_for_ticks in app.decay_widgets:
-                    app.decay_widgets[widget_key_for_ticks].getAxis("left").setTicks([ticks])
+                    LinLogControl.set_axis_ticks(
+                        app.decay_widgets[widget_key_for_ticks].getAxis("left"), ticks
+                    )
                     PlotsController.set_plot_y_range(app.decay_widgets[widget_key_for_ticks])
             
             # Cache summed values for lin/log control (sum all files)
@@ -820,7 +876,7 @@ class ReadData:
                 
                 for channel, curves in channels_curves.items():
                     if channel < len(metadata_channels) and metadata_channels[channel] in app.plots_to_show:
-                        y_values = np.sum(curves, axis=0)
+                        y_values = sum_channel_curves(channels_curves, channel)
                         all_y_values.append(y_values)
                         if first_channel is None:
                             first_channel = metadata_channels[channel]
@@ -850,7 +906,7 @@ class ReadData:
                 # Original behavior: plot each channel separately
                 for channel, curves in channels_curves.items():
                     if channel < len(metadata_channels) and metadata_channels[channel] in app.plots_to_show:
-                        y_values = np.sum(curves, axis=0)
+                        y_values = sum_channel_curves(channels_curves, channel)
                         if app.tab_selected != s.TAB_PHASORS:
                             app.cached_decay_values[app.tab_selected][
                                 metadata_channels[channel]
@@ -886,22 +942,223 @@ class ReadData:
         QTimer.singleShot(250, force_main_plots_refresh)
 
     @staticmethod
-    def group_phasors_data_without_channels(data):
-        """Return {harmonic: [(g, s, file_name), ...]} without channel separation."""
+    def group_phasors_data_without_channels(data, file_indexes=None):
+        """
+        Merge the phasor points of all channels, harmonic by harmonic.
+        
+        Args:
+            data (list | PhasorsDataset): One PhasorsIndex per loaded phasors file
+            file_indexes (iterable[int], optional): The files to merge. Defaults to None (all).
+            
+        Returns:
+            dict: {harmonic: PhasorPointStore} where the file-id column maps every
+                  point to its entry in file_names and the points of each file
+                  are contiguous
+        """
+        if isinstance(data, PhasorsDataset):
+            file_names = list(data.file_paths)
+        else:
+            file_names = [phasors_index.file_path for phasors_index in data]
+        if file_indexes is None:
+            file_indexes = range(len(data))
+        parts = {}
+        for file_index in file_indexes:
+            phasors_index = data[file_index]
+            for channel, harmonic in phasors_index.keys():
+                g, s = phasors_index.get(channel, harmonic)
+                harmonic_parts = parts.setdefault(harmonic, {"g": [], "s": [], "file_index": []})
+                harmonic_parts["g"].append(g)
+                harmonic_parts["s"].append(s)
+                harmonic_parts["file_index"].append(np.full(len(g), file_index, dtype=np.int32))
         grouped_data = {}
-        for channel_data in data.values():
-            if not isinstance(channel_data, dict):
-                continue
-            for harmonic, points in channel_data.items():
-                harmonic_bucket = grouped_data.setdefault(harmonic, [])
-                for point in points:
-                    g, s = point[0], point[1]
-                    file_name = point[2] if len(point) >= 3 else ""
-                    if file_name is None:
-                        file_name = ""
-                    harmonic_bucket.append((g, s, str(file_name)))
+        for harmonic, harmonic_parts in parts.items():
+            grouped_data[harmonic] = PhasorPointStore.from_arrays(
+                np.concatenate(harmonic_parts["g"]),
+                np.concatenate(harmonic_parts["s"]),
+                np.concatenate(harmonic_parts["file_index"]),
+                file_names,
+            )
         return grouped_data
 
+    @staticmethod
+    def start_phasors_files_loader(app, dataset):
+        """
+        Starts decoding the files of a phasors dataset in the background.
+
+        Args:
+            app: Main application instance
+            dataset (PhasorsDataset): The loaded phasors files
+        """
+        ReadData.cancel_phasors_files_loader(app)
+        app.phasors_loaded_files = set()
+        app.phasors_failed_files = set()
+        app.phasors_pushed_files = 0
+        app.phasors_live_plot = False
+        loader = PhasorsFilesLoader(dataset)
+        loader.file_loaded.connect(partial(ReadData.on_phasors_file_loaded, app))
+        loader.file_failed.connect(partial(ReadData.on_phasors_file_failed, app))
+        app.phasors_files_loader = loader
+        loader.start()
+
+    @staticmethod
+    def cancel_phasors_files_loader(app):
+        """
+        Stops the background decoding of phasors files, if running.
+
+        The loader is disconnected and left to finish without blocking the
+        GUI; it is kept in app.stopping_phasors_files_loaders until a later
+        call finds it finished, so the thread is not destroyed while running.
+
+        Args:
+            app: Main application instance
+        """
+        app.stopping_phasors_files_loaders = {
+            loader for loader in app.stopping_phasors_files_loaders if not loader.isFinished()
+        }
+        loader = getattr(app, "phasors_files_loader", None)
+        if loader is not None and loader.isRunning():
+            loader.file_loaded.disconnect()
+            loader.file_failed.disconnect()
+            loader.cancel()
+            app.stopping_phasors_files_loaders.add(loader)
+        app.phasors_files_loader = None
+        app.phasors_live_plot = False
+
+    @staticmethod
+    def count_ready_phasors_files(app):
+        """
+        Count the phasors files not preceded by a file still decoding.
+
+        Files are plotted in order, so colors and legend entries follow the
+        selection order whatever the decoding order. Files that failed to
+        decode are counted as done, so they do not hold back the next ones.
+
+        Args:
+            app: Main application instance
+
+        Returns:
+            int: The number of files that can be plotted, failed files included
+        """
+        count = 0
+        while count in app.phasors_loaded_files or count in app.phasors_failed_files:
+            count += 1
+        return count
+
+    @staticmethod
+    def loaded_phasors_files(app, start, stop):
+        """
+        Args:
+            app: Main application instance
+            start (int): The first file index
+            stop (int): The file index after the last one
+
+        Returns:
+            list[int]: The indexes in [start, stop) of the files decoded successfully
+        """
+        return [
+            file_index
+            for file_index in range(start, stop)
+            if file_index not in app.phasors_failed_files
+        ]
+
+    @staticmethod
+    def on_phasors_file_loaded(app, file_index):
+        """
+        Push the newly decoded phasors files to the plot, if it is shown.
+
+        The loader pins the file in the dataset, so it stays decoded while it
+        waits for the plot or for the files before it.
+
+        Args:
+            app: Main application instance
+            file_index (int): The index of the decoded file
+        """
+        app.phasors_loaded_files.add(file_index)
+        ReadData.push_ready_phasors_files(app)
+
+    @staticmethod
+    def on_phasors_file_failed(app, file_index, error):
+        """
+        Report a phasors file that could not be decoded and push the files after it.
+
+        Args:
+            app: Main application instance
+            file_index (int): The index of the file
+            error (str): The error message
+        """
+        dataset = app.reader_data["phasors"]["data"]["phasors_data"]
+        if isinstance(dataset, PhasorsDataset):
+            ReadData.show_warning_message(
+                "Error reading file", f"Error reading {dataset.file_paths[file_index]}: {error}"
+            )
+        app.phasors_failed_files.add(file_index)
+        ReadData.push_ready_phasors_files(app)
+
+    @staticmethod
+    def push_ready_phasors_files(app):
+        """
+        Push the phasors files ready to be plotted, if the plot is shown.
+
+        The pushed files are released from the dataset: the plotted
+        PhasorPointStore holds the only copy of their points.
+
+        Args:
+            app: Main application instance
+        """
+        from core.controls_controller import ControlsController
+
+        if not app.phasors_live_plot:
+            return
+        dataset = app.reader_data["phasors"]["data"]["phasors_data"]
+        ready = ReadData.count_ready_phasors_files(app)
+        if ready <= app.phasors_pushed_files:
+            return
+        file_indexes = ReadData.loaded_phasors_files(app, app.phasors_pushed_files, ready)
+        app.phasors_pushed_files = ready
+        if not file_indexes:
+            return
+        grouped_data = ReadData.group_phasors_data_without_channels(dataset, file_indexes)
+        dataset.release(file_indexes)
+        for harmonic, points in grouped_data.items():
+            store = app.all_phasors_points[0].get(harmonic)
+            if store is None or (len(store) == 0 and store.file_ids is None):
+                store = PhasorPointStore(with_file_ids=True)
+                app.all_phasors_points[0][harmonic] = store
+            store.file_names = list(dataset.file_paths)
+            store.append(points.g, points.s, points.file_ids)
+        ControlsController._update_phasor_plots_for_harmonic(app)
+
+    @staticmethod
+    def group_plotted_phasors_points(app):
+        """
+        Group the plotted phasor points by harmonic and file for the image export.
+
+        The points are read from app.all_phasors_points, where the read mode
+        plot merges all channels, so no file is decoded again. Files that
+        failed to decode are skipped.
+
+        Args:
+            app: Main application instance
+
+        Returns:
+            dict: {channel: {harmonic: [(file_name, g, s), ...]}} with one entry per file,
+                  the merged channels being keyed by the first one
+        """
+        failed_files = getattr(app, "phasors_failed_files", set())
+        harmonics = {}
+        for harmonic, store in app.all_phasors_points[0].items():
+            if len(store) == 0:
+                continue
+            file_ids, starts, ends = store.file_groups()
+            files = [
+                (store.file_name(int(file_id)), store.g[start:end], store.s[start:end])
+                for file_id, start, end in zip(file_ids, starts, ends)
+                if int(file_id) not in failed_files
+            ]
+            if files:
+                harmonics[harmonic] = files
+        return {0: harmonics} if harmonics else {}
+
     @staticmethod
     def get_spectroscopy_data_to_fit(app):
         """
@@ -946,7 +1203,7 @@ class ReadData:
                 for channel, curves in file_channels_curves.items():
                     # Only process the first channel of each file
                     if channel == 0:
-                        y_values = np.sum(curves, axis=0)
+                        y_values = sum_channel_curves(file_channels_curves, channel)
                         
                         # Match x_values length to y_values length
                         if len(file_times) >= len(y_values):
@@ -972,7 +1229,7 @@ class ReadData:
                         )
         else:
             # Single-file mode: check if we have actual times data
-            if "times" in spectroscopy_data and spectroscopy_data["times"]:
+            if "times" in spectroscopy_data and len(spectroscopy_data["times"]) > 0:
                 # Use actual times from data (already in correct units)
                 x_values = np.array(spectroscopy_data["times"])  # Don't multiply by 1000
             else:
@@ -984,7 +1241,7 @@ class ReadData:
             
             for channel, curves in channels_curves.items():
                 if channels[channel] in app.plots_to_show:
-                    y_values = np.sum(curves, axis=0)
+                    y_values = sum_channel_curves(channels_curves, channel)
                     
                     if app.tab_selected != s.TAB_PHASORS:
                         app.cached_decay_values[app.tab_selected][
@@ -1011,7 +1268,7 @@ class ReadData:
         
         Args:
             app: Main application instance
-            data (dict): Phasors data by channel and harmonic
+            data (dict): Phasors arrays by harmonic, see group_phasors_data_without_channels
             harmonics (list or int): Available harmonics
             
         Returns:
@@ -1033,7 +1290,7 @@ class ReadData:
         # Populate all_phasors_points BEFORE resetting harmonic selector
         # to ensure _update_phasor_plots_for_harmonic has data to work with
         for harmonic, values in data.items():
-            app.all_phasors_points[0][harmonic].extend(values)
+            app.all_phasors_points[0][harmonic] = values
         
         if harmonics > 1:
             app.harmonic_selector_shown = True
@@ -1090,6 +1347,33 @@ class ReadData:
         Returns:
             None: Calls read_data_cb with file handle and other parameters
         """
+        file_name = ReadData.select_bin_file(window, magic_bytes, file_type, filter_string)
+        if not file_name:
+            return None
+        try:
+            with open(file_name, "rb") as f:
+                f.seek(4)
+                return read_data_cb(f, file_name, file_type, tab_selected, app)
+        except Exception:
+            ReadData.show_warning_message(
+                "Error reading file", f"Error reading {file_type} file"
+            )
+            return None
+
+    @staticmethod
+    def select_bin_file(window, magic_bytes, file_type, filter_string=None):
+        """
+        Ask the user for a binary file and check its extension and magic bytes.
+
+        Args:
+            window: Parent window for file dialogs
+            magic_bytes (bytes): Expected file magic bytes
+            file_type (str): Type of file being read
+            filter_string (str, optional): Filter pattern for file dialog
+
+        Returns:
+            str: The path of the selected file, or None if no valid file was selected
+        """
         dialog = QFileDialog()
         dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
         if filter_string:
@@ -1111,7 +1395,6 @@ class ReadData:
                 "Invalid extension", "Invalid extension. File should be a .bin"
             )
             return None
-
         try:
             with open(file_name, "rb") as f:
                 if f.read(4) != magic_bytes:
@@ -1120,18 +1403,21 @@ class ReadData:
                         f"Invalid file. The file is not a valid {file_type} file.",
                     )
                     return None
-                return read_data_cb(f, file_name, file_type, tab_selected, app)
         except Exception:
             ReadData.show_warning_message(
                 "Error reading file", f"Error reading {file_type} file"
             )
             return None
+        return file_name
 
     @staticmethod
     def read_spectroscopy_data(file, file_name, file_type, tab_selected, app):
         """
         Read spectroscopy data from binary file.
         
+        The records are memory-mapped, so channel curves are zero-copy
+        [n_records, 256] views on the file content.
+        
         Args:
             file: Open file handle
             file_name (str): Name of the file
@@ -1146,22 +1432,7 @@ class ReadData:
             Exception: If file reading or parsing fails
         """
         try:
-            json_length = struct.unpack("I", file.read(4))[0]
-            metadata = json.loads(file.read(json_length).decode("utf-8"))
-            channel_curves = {i: [] for i in range(len(metadata["channels"]))}
-            times = []
-            number_of_channels = len(metadata["channels"])
-            while True:
-                data = file.read(8)
-                if not data:
-                    break
-                time = struct.unpack("d", data)[0]
-                times.append(time / 1_000_000_000)
-                for i in range(number_of_channels):
-                    data = file.read(4 * 256)
-                    if len(data) < 4 * 256:
-                        return times, channel_curves
-                    channel_curves[i].append(np.array(struct.unpack("I" * 256, data)))
+            times, channel_curves, metadata = decoded_file_cache.read_spectroscopy_file(file_name)
             return file_name, "spectroscopy", times, channel_curves, metadata
         except Exception as e:
             ReadData.show_warning_message(
@@ -1182,33 +1453,14 @@ class ReadData:
             app: Main application instance
             
         Returns:
-            tuple: (file_name, file_type, phasors_data, metadata) or None if error
+            tuple: (file_name, file_type, phasors_data, metadata) or None if error,
+                phasors_data being a PhasorsIndex of the memory-mapped records
             
         Raises:
-            struct.error: If binary data unpacking fails
-            Exception: For other file reading errors
+            Exception: For file reading errors
         """
-        phasors_data = {}
         try:
-            json_length = struct.unpack("I", file.read(4))[0]
-            metadata = json.loads(file.read(json_length).decode("utf-8"))
-            while True:
-                bytes_read = file.read(32)
-                if not bytes_read:
-                    break
-                try:
-                    time_ns, channel_name, harmonic_name, g, s = struct.unpack(
-                        "QIIdd", bytes_read
-                    )
-                except struct.error:
-                    ReadData.show_warning_message(
-                        "Error unpacking file", "Error unpacking Phasors file data"
-                    )
-                    break
-                phasors_data.setdefault(channel_name, {}).setdefault(
-                    harmonic_name, []
-                ).append((g, s))
-                app.reader_data["phasors"]["data"]["phasors_data"].setdefault(channel_name, {}).setdefault(harmonic_name, []).append((g, s, file_name))           
+            phasors_data, metadata = decoded_file_cache.read_phasors_file(file_name)
             return file_name, "phasors", phasors_data, metadata
         except Exception:
             ReadData.show_warning_message(
@@ -1362,7 +1614,7 @@ class ReadData:
         Returns:
             tuple: (phasors_data, laser_period, active_channels, spectroscopy_times, spectroscopy_curves) for export
         """
-        phasors_data = app.reader_data["phasors"]["data"]["phasors_data"]
+        phasors_data = ReadData.group_plotted_phasors_points(app)
         # phasors metadata can be stored as a list (multi-file) or a dict (single file)
         phasors_meta = app.reader_data["phasors"].get("phasors_metadata") or app.reader_data["phasors"].get("metadata")
         if isinstance(phasors_meta, list):
@@ -1435,6 +1687,8 @@ class ReadDataControls:
                 app.control_inputs[s.SETTINGS_REPLICATES].setVisible(not read_mode)
             if "replicates_label" in app.control_inputs:
                 app.control_inputs["replicates_label"].setVisible(not read_mode)
+            if "continuous_fit_container" in app.control_inputs:
+                (hide_layout(app.control_inputs["continuous_fit_container"]) if read_mode else show_layout(app.control_inputs["continuous_fit_container"]))
          
         app.widgets[s.TOP_COLLAPSIBLE_WIDGET].setVisible(not read_mode)
         app.widgets["collapse_button"].setVisible(not read_mode)
@@ -1597,6 +1851,9 @@ class ReaderPopup(QWidget):
         self.data_type = ReadData.get_data_type(self.tab_selected)
         self.file_type_checkboxes = {}  # Store radio buttons for file type selection
         self.file_input_containers = {}  # Store containers for each file input
+        self.decode_task = None
+        self.decode_signals = None
+        self.plot_btn_enabled_before_decode = False
         self.setWindowTitle("Read data")
         TitlebarIcon.setup(self)
         GUIStyles.customize_theme(self, bg=QColor(20, 20, 20))
@@ -1986,10 +2243,33 @@ class ReaderPopup(QWidget):
         
         plot_btn.clicked.connect(self.on_plot_data_btn_clicked)
         self.widgets["plot_btn"] = plot_btn
+        # FILE DECODING PROGRESS
+        decode_progress = ProgressBar(
+            label_text="",
+            visible=False,
+            layout_type="horizontal",
+            progress_bar_width=200,
+        )
+        self.widgets["decode_progress"] = decode_progress
+        cancel_btn = QPushButton("CANCEL")
+        cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        cancel_btn.setObjectName("btn")
+        GUIStyles.set_stop_btn_style(cancel_btn)
+        cancel_btn.setFixedHeight(40)
+        cancel_btn.setFixedWidth(100)
+        cancel_btn.setVisible(False)
+        cancel_btn.clicked.connect(self.on_cancel_decode_btn_clicked)
+        self.widgets["decode_cancel_btn"] = cancel_btn
+        row_btn.addWidget(decode_progress)
+        row_btn.addWidget(cancel_btn)
         row_btn.addStretch(1)
         row_btn.addWidget(plot_btn)
         return row_btn
 
+    def on_cancel_decode_btn_clicked(self):
+        """Cancel the file decoding, keeping the data loaded before."""
+        self.cancel_bin_file_decode()
+
     def remove_channels_grid(self):
         """
         Remove channel selection grid layout.
@@ -2119,8 +2399,6 @@ class ReaderPopup(QWidget):
         Returns:
             None: Reads the selected file and updates the UI
         """
-        from core.controls_controller import ControlsController
-        
         # Clear the other file type when loading (fitting tab only)
         if self.data_type == "fitting":
             if file_type == "spectroscopy":
@@ -2136,8 +2414,20 @@ class ReaderPopup(QWidget):
             if hasattr(self.app, 'control_inputs') and 'bin_metadata_button' in self.app.control_inputs:
                 metadata_button = self.app.control_inputs['bin_metadata_button']
                 metadata_button.setVisible(False)
-        else:
-            ReadData.read_bin_data(self, self.app, self.tab_selected, file_type)
+        elif file_type in ReadData.bin_file_info():
+            self.start_bin_file_decode(file_type)
+            return
+        self.refresh_loaded_file_ui(file_type)
+
+    def refresh_loaded_file_ui(self, file_type):
+        """
+        Update the file input, channels grid and buttons after a file has been loaded.
+
+        Args:
+            file_type (str): Type of the loaded file ('fitting', 'spectroscopy' or 'phasors')
+        """
+        from core.controls_controller import ControlsController
+
         file_path = self.app.reader_data[self.data_type]["files"][file_type]
         file_name = file_path[0] if isinstance(file_path, list) and len(file_path) > 0 else file_path if isinstance(file_path, str) else ""
         has_files = (isinstance(file_path, list) and len(file_path) > 0) or (isinstance(file_path, str) and len(file_path) > 0)
@@ -2190,6 +2480,116 @@ class ReaderPopup(QWidget):
                 self.widgets["plot_btn"].setText("PLOT DATA") 
             
     
+    def start_bin_file_decode(self, file_type):
+        """
+        Ask for a binary file and decode it in the background.
+
+        The previous decoding, if any, is cancelled. app.reader_data is only
+        updated once the file is fully decoded (see on_bin_file_decoded).
+
+        Args:
+            file_type (str): Type of file to load ('spectroscopy' or 'phasors')
+        """
+        magic_bytes, label, _ = ReadData.bin_file_info()[file_type]
+        file_name = ReadData.select_bin_file(self, magic_bytes, label)
+        if not file_name:
+            return
+        self.cancel_bin_file_decode()
+        signals = FileDecodeSignals()
+        task = DecodeBinFileTask(file_name, file_type, signals)
+        signals.progress.connect(partial(self.on_bin_file_decode_progress, task))
+        signals.finished.connect(partial(self.on_bin_file_decoded, task))
+        signals.error.connect(partial(self.on_bin_file_decode_error, task))
+        signals.cancelled.connect(partial(self.on_bin_file_decode_cancelled, task))
+        # Keep the signals alive while the task runs
+        self.decode_task = task
+        self.decode_signals = signals
+        self.set_decoding(True, os.path.basename(file_name))
+        QThreadPool.globalInstance().start(task)
+
+    def cancel_bin_file_decode(self):
+        """Cancel the running file decoding, if any. The loaded data is left unchanged."""
+        if self.decode_task is not None:
+            self.decode_task.cancel()
+            self.decode_task = None
+            self.set_decoding(False)
+
+    def set_decoding(self, decoding, file_name=""):
+        """
+        Show or hide the decoding progress and cancel button.
+
+        Args:
+            decoding (bool): True while a file is being decoded
+            file_name (str, optional): Name of the file being decoded
+        """
+        progress = self.widgets["decode_progress"]
+        plot_btn = self.widgets["plot_btn"]
+        if decoding:
+            progress.progress_bar.setValue(0)
+            progress.label.setText(f"Loading {file_name}...")
+            self.plot_btn_enabled_before_decode = plot_btn.isEnabled()
+            plot_btn.setEnabled(False)
+        else:
+            plot_btn.setEnabled(self.plot_btn_enabled_before_decode)
+        progress.setVisible(decoding)
+        self.widgets["decode_cancel_btn"].setVisible(decoding)
+
+    def on_bin_file_decode_progress(self, task, decoded, total):
+        """
+        Update the decoding progress bar.
+
+        Args:
+            task (DecodeBinFileTask): The task reporting the progress
+            decoded (int): Records decoded so far
+            total (int): Records to decode
+        """
+        if task is not self.decode_task:
+            return
+        percentage = 100 if total == 0 else int(decoded * 100 / total)
+        self.widgets["decode_progress"].progress_bar.setValue(percentage)
+
+    def on_bin_file_decoded(self, task, result):
+        """
+        Hand the decoded file over to app.reader_data and refresh the UI.
+
+        Args:
+            task (DecodeBinFileTask): The completed task
+            result (tuple): The decoded file, see ReadData.store_bin_data
+        """
+        if task is not self.decode_task:
+            return
+        self.decode_task = None
+        self.set_decoding(False)
+        ReadData.store_bin_data(self.app, self.data_type, result)
+        self.refresh_loaded_file_ui(task.file_type)
+
+    def on_bin_file_decode_error(self, task, error):
+        """
+        Report a file that could not be decoded.
+
+        Args:
+            task (DecodeBinFileTask): The failed task
+            error (str): The error message
+        """
+        if task is not self.decode_task:
+            return
+        self.decode_task = None
+        self.set_decoding(False)
+        label = ReadData.bin_file_info()[task.file_type][1]
+        ReadData.show_warning_message("Error reading file", f"Error reading {label} file")
+        self.refresh_loaded_file_ui(task.file_type)
+
+    def on_bin_file_decode_cancelled(self, task):
+        """
+        Hide the decoding progress of a cancelled task.
+
+        Args:
+            task (DecodeBinFileTask): The cancelled task
+        """
+        if task is self.decode_task:
+            self.decode_task = None
+            self.set_decoding(False)
+
     def on_load_file_btn_clicked_phasors(self, file_type):
         """
         Handle file load button click event specifically for phasors files in PHASORS mode.
@@ -2212,7 +2612,7 @@ class ReaderPopup(QWidget):
         self.app.reader_data[self.data_type]["files"][file_type] = []
         if file_type == "phasors":
             self.app.reader_data[self.data_type]["phasors_metadata"] = []
-            self.app.reader_data[self.data_type]["data"]["phasors_data"] = {}
+            self.app.reader_data[self.data_type]["data"]["phasors_data"] = []
         elif file_type == "spectroscopy":
             self.app.reader_data[self.data_type]["spectroscopy_metadata"] = []
             self.app.reader_data[self.data_type]["data"]["spectroscopy_data"] = {"files_data": []}
@@ -2220,11 +2620,24 @@ class ReaderPopup(QWidget):
         # Set the files list
         self.app.reader_data[self.data_type]["files"][file_type] = valid_files
     
+        if file_type == "phasors":
+            # Only the headers are read here, the files are decoded in the background
+            try:
+                dataset = PhasorsDataset(valid_files)
+                self.app.reader_data[self.data_type]["phasors_metadata"] = list(dataset.metadata)
+                self.app.reader_data[self.data_type]["data"]["phasors_data"] = dataset
+                ReadData.start_phasors_files_loader(self.app, dataset)
+            except Exception as e:
+                ReadData.show_warning_message("Error reading file", f"Error reading phasors files: {str(e)}")
+            valid_files_to_decode = []
+        else:
+            valid_files_to_decode = valid_files
+
         # Leggi e accumula dati da ciascun file valido
         magic_bytes = b"SP01" if file_type == "spectroscopy" else b"SPF1"
         read_function = ReadData.read_spectroscopy_data if file_type == "spectroscopy" else ReadData.read_phasors_data
     
-        for file_path in valid_files:
+        for file_path in valid_files_to_decode:
             try:
                 with open(file_path, "rb") as f:
                     if f.read(4) == magic_bytes:  # Rivalida (opzionale, già fatto)
@@ -2250,14 +2663,8 @@ class ReaderPopup(QWidget):
                                     "channels_curves": channels_curves
                                 })
                             elif file_type == "phasors":
-                                phasors_data = data[0]
-                                for ch, harmonics in phasors_data.items():
-                                    if ch not in self.app.reader_data[self.data_type]["data"]["phasors_data"]:
-                                        self.app.reader_data[self.data_type]["data"]["phasors_data"][ch] = {}
-                                    for h, points in harmonics.items():
-                                        if h not in self.app.reader_data[self.data_type]["data"]["phasors_data"][ch]:
-                                            self.app.reader_data[self.data_type]["data"]["phasors_data"][ch][h] = []
-                                            self.app.reader_data[self.data_type]["data"]["phasors_data"][ch][h].extend([(p[0], p[1], file_path) for p in points])
+                                # One PhasorsIndex per file, aligned with the files list
+                                self.app.reader_data[self.data_type]["data"]["phasors_data"].append(data[0])
             except Exception as e:
                 ReadData.show_warning_message("Error reading file", f"Error reading {file_path}: {str(e)}")
     
@@ -2526,6 +2933,7 @@ class ReaderPopup(QWidget):
         """Handle window close event to restore file type selection if needed."""
         # Check if fitting files selection was made but no files were loaded
         self.check_and_restore_file_type_selection()
+        self.cancel_bin_file_decode()
         super().closeEvent(event)
 
   
@@ -2587,6 +2995,35 @@ class ReaderMetadataPopup(QWidget):
             "tau_ns": "Tau (ns)",
         }
 
+    def get_summary_rows(self, file_path):
+        """
+        Get the acquisition summary of a spectroscopy file from its summary index.
+
+        Only the small summary fields are read, the data file itself is not opened.
+
+        Args:
+            file_path (str): Path of the spectroscopy file
+
+        Returns:
+            list: (label, value) tuples, empty if the file has no valid summary index
+        """
+        if not isinstance(file_path, str) or not file_path:
+            return []
+        summary = read_spectroscopy_summary(file_path)
+        if summary is None:
+            return []
+        with summary:
+            record_count = int(summary["record_count"])
+            first_ns, last_ns = summary["time_range_ns"]
+            intensity = summary["intensity_per_second"]
+        total_intensity = intensity.sum(axis=0)
+        mean_intensity = float(total_intensity.mean()) if total_intensity.size else 0.0
+        return [
+            ("Records", str(record_count)),
+            ("Duration (s)", f"{(last_ns - first_ns) / 1_000_000_000:.3f}"),
+            ("Mean intensity (counts/s)", f"{mean_intensity:.0f}"),
+        ]
+
     def create_metadata_table(self):
         """
         Create formatted table displaying file metadata.
@@ -2685,6 +3122,17 @@ class ReaderMetadataPopup(QWidget):
                         h_box.addWidget(key_label)
                         h_box.addWidget(value_label)
                         file_container.addLayout(h_box)
+                for label, summary_value in self.get_summary_rows(file_path):
+                    h_box = QHBoxLayout()
+                    h_box.setContentsMargins(0, 0, 0, 0)
+                    h_box.setSpacing(0)
+                    key_label = QLabel(label)
+                    value_label = QLabel(summary_value)
+                    key_label.setStyleSheet(get_key_label_style("#11468F"))
+                    value_label.setStyleSheet(get_value_label_style("#11468F"))
+                    h_box.addWidget(key_label)
+                    h_box.addWidget(value_label)
+                    file_container.addLayout(h_box)
                 
                 # Add file container to grid
                 grid_layout.addLayout(file_container, row, col)
@@ -2750,6 +3198,17 @@ class ReaderMetadataPopup(QWidget):
                         h_box.addWidget(key_label)
                         h_box.addWidget(value_label)
                         v_box.addLayout(h_box)
+                for label, summary_value in self.get_summary_rows(file):
+                    h_box = QHBoxLayout()
+                    h_box.setContentsMargins(0, 0, 0, 0)
+                    h_box.setSpacing(0)
+                    key_label = QLabel(label)
+                    value_label = QLabel(summary_value)
+                    key_label.setStyleSheet(get_key_label_style("#11468F"))
+                    value_label.setStyleSheet(get_value_label_style("#11468F"))
+                    h_box.addWidget(key_label)
+                    h_box.addWidget(value_label)
+                    v_box.addLayout(h_box)
         return v_box
 
     def center_window(self):
@@ -2838,3 +3297,98 @@ class SavePlotTask(QRunnable):
         except Exception as e:
             plt.close(self.plot)
             self.signals.error.emit(str(e))
+
+
+class FileDecodeSignals(QObject):
+    """
+    Qt signals for the background decoding of a data file.
+
+    Signals:
+        progress (int, int): Emitted with the records decoded and the total to decode
+        finished (object): Emitted with the decoded file, see ReadData.store_bin_data
+        error (str): Emitted when the file cannot be decoded
+        cancelled: Emitted when the decoding is cancelled
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class DecodeBinFileTask(QRunnable):
+    """
+    Background task decoding a spectroscopy or phasors binary file.
+
+    Unless the file has a summary index or cached decoded arrays, its records
+    are decoded in chunks of s.READER_DECODE_CHUNK_BYTES (see
+    bin_readers.record_chunks): the progress is reported and the cancellation
+    checked after every chunk. The decoded content is only emitted once
+    complete, never written into app.reader_data from here.
+
+    Attributes:
+        file_name (str): Path of the file to decode
+        file_type (str): Type of file ('spectroscopy' or 'phasors')
+        signals (FileDecodeSignals): Signal emitter for progress and completion
+    """
+
+    def __init__(self, file_name, file_type, signals):
+        """
+        Initialize the decode task.
+
+        Args:
+            file_name (str): Path of the file to decode
+            file_type (str): Type of file ('spectroscopy' or 'phasors')
+            signals (FileDecodeSignals): Signal emitter for progress and completion
+        """
+        super().__init__()
+        self.file_name = file_name
+        self.file_type = file_type
+        self.signals = signals
+        self._cancel_requested = False
+
+    def cancel(self):
+        """Request the cancellation of the decoding."""
+        self._cancel_requested = True
+
+    def report_progress(self, decoded, total):
+        """
+        Progress callback of the decoding, called after every chunk.
+
+        Args:
+            decoded (int): Records decoded so far
+            total (int): Records to decode
+
+        Raises:
+            DecodeCancelled: If the cancellation was requested
+        """
+        if self._cancel_requested:
+            raise DecodeCancelled()
+        self.signals.progress.emit(decoded, total)
+
+    @pyqtSlot()
+    def run(self):
+        """
+        Execute the decoding task.
+
+        Returns:
+            None: Emits signals based on operation result
+        """
+        try:
+            if self.file_type == "spectroscopy":
+                times, channel_curves, metadata = decoded_file_cache.read_spectroscopy_file(
+                    self.file_name, self.report_progress
+                )
+                result = (self.file_name, "spectroscopy", times, channel_curves, metadata)
+            else:
+                phasors_data, metadata = decoded_file_cache.read_phasors_file(
+                    self.file_name, self.report_progress
+                )
+                result = (self.file_name, "phasors", phasors_data, metadata)
+            if self._cancel_requested:
+                self.signals.cancelled.emit()
+                return
+            self.signals.finished.emit(result)
+        except DecodeCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
@@ -141,7 +141,7 @@ class SpectroscopyTimeShift(QWidget):
                     ticks, _ = LinLogControl.calculate_lin_mode(cached_decay_curve)
                 else:
                     ticks, _, _ = LinLogControl.calculate_log_mode(cached_decay_curve)
-                decay_widget.getAxis("left").setTicks([ticks])
+                LinLogControl.set_axis_ticks(decay_widget.getAxis("left"), ticks)
             PlotsController.set_plot_y_range(decay_widget)
         else:
             # Single-file mode or other tabs: original behavior
@@ -159,7 +159,7 @@ class SpectroscopyTimeShift(QWidget):
                             else:
                                 ticks, y_data, _ = LinLogControl.calculate_log_mode(cached_decay_curve)
                                 decay_widget.showGrid(x=False, y=True, alpha=0.3)     
-                            decay_widget.getAxis("left").setTicks([ticks])    
+                            LinLogControl.set_axis_ticks(decay_widget.getAxis("left"), ticks)    
                             y = np.roll(y_data, value)
                             decay_curve.setData(x, y)
                             PlotsController.set_plot_y_range(decay_widget)
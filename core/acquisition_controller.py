@@ -4,11 +4,14 @@ import numpy as np
 from components.box_message import BoxMessage
 from components.check_card import CheckCard
 from utils.export_data import ExportData
+from utils.file_utils import FileUtils
 from utils.gui_styles import GUIStyles
 from utils.helpers import calc_SBR, humanize_number, mhz_to_ns, ns_to_mhz
 from components.lin_log_control import LinLogControl
 from components.plots_config import PlotsConfigPopup
 from core.phasors_controller import PhasorsController
+from core.acquisition_ingest import END_OF_ACQUISITION, AcquisitionIngestWorker
+from core.continuous_fit_controller import ContinuousFitController
 import settings.settings as s
 from PyQt6.QtWidgets import (
     QApplication,
@@ -168,7 +171,11 @@ class AcquisitionController:
         try:
             print(f"Starting acquisition with params: {params}")
             app.all_phasors_points = PhasorsController.get_empty_phasors_points()
-            flim_labs.start_spectroscopy(**params)
+            result = flim_labs.start_spectroscopy(**params)
+            # The saves after the acquisition use its output files instead of scanning the data folder
+            FileUtils.hand_off_acquisition_files(
+                getattr(result, "data_file", None), params["time_tagger"]
+            )
             return True
         except Exception as e:
             AcquisitionController.check_card_connection(app)
@@ -181,7 +188,7 @@ class AcquisitionController:
         Updates UI elements and timers after acquisition starts successfully.
 
         Disables controls, updates the start button style, and starts the
-        data polling timer.
+        ingest worker, the render timer and the continuous fit.
 
         Args:
             app: The main application instance.
@@ -194,7 +201,26 @@ class AcquisitionController:
         app.update_plots_enabled = True
         ControlsController.top_bar_set_enabled(app, False)
         LinLogControl.set_lin_log_switches_enable_mode(app.lin_log_switches, False)
-        app.pull_from_queue_timer.start(25)
+        AcquisitionController.stop_ingest_worker(app)
+        app.ingest_worker = AcquisitionIngestWorker()
+        app.ingest_worker.start()
+        app.pull_from_queue_timer.start(s.RENDER_TICK_MS)
+        ContinuousFitController.start(app)
+
+    @staticmethod
+    def stop_ingest_worker(app):
+        """
+        Stops the acquisition ingest worker, if running, and keeps its counters.
+
+        Args:
+            app: The main application instance.
+        """
+        if app.ingest_worker is None:
+            return
+        app.ingest_worker.stop()
+        app.ingest_stats = app.ingest_worker.stats()
+        app.ingest_worker = None
+        print(f"Acquisition ingest stats: {app.ingest_stats}")
 
     @staticmethod
     def begin_spectroscopy_experiment(app):
@@ -371,6 +397,7 @@ class AcquisitionController:
             app: The main application instance.
         """
         AcquisitionController._stop_hardware_and_update_state(app)
+        ContinuousFitController.stop(app)
         AcquisitionController._finalize_ui_after_stop(app)
         AcquisitionController._handle_reference_file_after_stop(app)
         AcquisitionController._process_phasor_results(app)
@@ -380,54 +407,88 @@ class AcquisitionController:
     @staticmethod
     def pull_from_queue(app):
         """
-        Pulls data from the FLIM-LABS output queue and processes it.
+        Processes the data pulled from the FLIM-LABS output queue since the last call.
 
-        This method is connected to a timer and runs continuously during
-        acquisition. It dispatches different data types (e.g., decay curves,
-        phasors) to the appropriate update functions.
+        This method is connected to the render timer (s.RENDER_TICK_MS) and runs
+        continuously during acquisition. The queue itself is drained by the
+        AcquisitionIngestWorker thread. It dispatches different data types
+        (e.g., decay curves, phasors) to the appropriate update functions.
+        Decay curves are folded per channel by the ingest worker, so the plots
+        of a channel are refreshed once per tick however many packets were received.
 
         Args:
             app: The main application instance.
         """
-        from core.plots_controller import PlotsController
         from core.ui_controller import UIController
-        val = flim_labs.pull_from_queue()
-        if len(val) > 0:
-            for v in val:
-                if v == ("end",):  # End of acquisition
-                    print("Got end of acquisition, stopping")
-                    UIController.style_start_button(app)
-                    app.acquisition_stopped = True
-                    AcquisitionController.stop_spectroscopy_experiment(app)
-                    break
-                if app.mode == s.MODE_STOPPED:
-                    break
-                if "sp_phasors" in v[0]:
-                    channel = v[1][0]
-                    harmonic = v[2][0]
-                    phasors = v[3]
-                    channel_index = next(
-                        (item for item in app.plots_to_show if item == channel), None
-                    )
-                    if harmonic == 1:
-                        if channel_index is not None:
-                            PhasorsController.draw_points_in_phasors(app, channel, harmonic, phasors)
-                    if channel_index is not None:
-                        app.all_phasors_points[channel_index][harmonic].extend(phasors)
-                    continue
-                try:
-                    ((channel,), (time_ns,), intensities) = v
-                except:
-                    print(v)
-                ((channel,), (time_ns,), intensities) = v
-                channel_index = next(
-                    (item for item in app.plots_to_show if item == channel), None
-                )
-                if channel_index is not None:
-                    PlotsController.update_plots(app, channel_index, time_ns, intensities)
-                    AcquisitionController.update_acquisition_countdowns(app, time_ns)
-                    AcquisitionController.update_cps(app, channel_index, time_ns, intensities)
-                QApplication.processEvents()
+        if app.ingest_worker is None:
+            return
+        packets, decay_batches, phasors_batches = app.ingest_worker.drain()
+        end_of_acquisition = END_OF_ACQUISITION in packets
+        if app.mode == s.MODE_STOPPED and not end_of_acquisition:
+            return
+        if app.mode != s.MODE_STOPPED:
+            AcquisitionController.flush_phasors_batches(app, phasors_batches)
+        AcquisitionController.flush_decay_batches(app, decay_batches)
+        if end_of_acquisition:
+            print("Got end of acquisition, stopping")
+            AcquisitionController.stop_ingest_worker(app)
+            UIController.style_start_button(app)
+            app.acquisition_stopped = True
+            AcquisitionController.stop_spectroscopy_experiment(app)
+
+    @staticmethod
+    def flush_phasors_batches(app, phasors_batches):
+        """
+        Pushes the phasor points received during a render tick to the plots.
+
+        The packets of each channel and harmonic are folded by the ingest
+        worker, so each store is appended to and redrawn once per tick.
+
+        Args:
+            app: The main application instance.
+            phasors_batches (dict): {(channel, harmonic): PhasorsBatch}, see
+                                    AcquisitionIngestWorker.drain.
+        """
+        for (channel, harmonic), batch in phasors_batches.items():
+            if channel not in app.plots_to_show:
+                continue
+            points = app.all_phasors_points[channel][harmonic]
+            points.append(batch.g, batch.s)
+            if harmonic == 1:
+                if app.quantized_phasors:
+                    PhasorsController.update_live_quantized_phasors(app, channel, harmonic)
+                else:
+                    PhasorsController.draw_points_in_phasors(app, channel, harmonic, points)
+
+    @staticmethod
+    def flush_decay_batches(app, decay_batches):
+        """
+        Pushes the decay curves received during a render tick to the plots.
+
+        The packets of each channel are folded by the ingest worker, so the
+        intensity trace gets the k photon counts and the decay curve is updated
+        once with the summed curve.
+
+        Args:
+            app: The main application instance.
+            decay_batches (dict): {channel: DecayBatch}, see AcquisitionIngestWorker.drain.
+        """
+        from core.plots_controller import PlotsController
+        last_time_ns = None
+        for channel, batch in decay_batches.items():
+            if channel not in app.plots_to_show or len(batch) == 0:
+                continue
+            AcquisitionController.update_cps(app, channel, batch)
+            PlotsController.update_plots(
+                app,
+                channel,
+                np.asarray(batch.times_ns),
+                batch.curve,
+                counts=np.asarray(batch.counts),
+            )
+            last_time_ns = batch.times_ns[-1]
+        if last_time_ns is not None:
+            AcquisitionController.update_acquisition_countdowns(app, last_time_ns)
                 
          
     
@@ -480,7 +541,7 @@ class AcquisitionController:
                            
     
     @staticmethod
-    def update_cps(app, channel_index, time_ns, curve):
+    def update_cps(app, channel_index, batch):
         """
         Updates the Counts Per Second (CPS) display for a given channel.
 
@@ -491,42 +552,41 @@ class AcquisitionController:
         Args:
             app: The main application instance.
             channel_index (int): The index of the channel to update.
-            time_ns (int): The timestamp of the current data chunk in nanoseconds.
-            curve (np.ndarray): The intensity data for the current chunk.
+            batch (DecayBatch): The decay packets received during the render tick.
         """
         # check if there is channel_index'th element in cps_counts
         if not (channel_index in app.cps_counts):
             return
         cps = app.cps_counts[channel_index]
-        curve_sum = np.sum(curve)
         # SBR
-        SBR_count = calc_SBR(np.array(curve))
+        SBR_count = calc_SBR(np.array(batch.last_curve))
         app.all_SBR_counts.append(SBR_count)
-        if cps["last_time_ns"] == 0:
-            cps["last_time_ns"] = time_ns
-            cps["last_count"] = curve_sum
-            cps["current_count"] = curve_sum
-            return
-        cps["current_count"] = cps["current_count"] + np.sum(curve)
-        time_elapsed = time_ns - cps["last_time_ns"]
-        if time_elapsed > 330_000_000:
-            cps_value = (cps["current_count"] - cps["last_count"]) / (
-                time_elapsed / 1_000_000_000
-            )
-            app.all_cps_counts.append(cps_value)            
-            humanized_number = humanize_number(cps_value)
-            app.cps_widgets[channel_index].setText(f"{humanized_number} CPS")
-            cps_threshold = app.control_inputs[s.SETTINGS_CPS_THRESHOLD].value()
-            if cps_threshold > 0:
-                if cps_value > cps_threshold:
-                    app.cps_widgets_animation[channel_index].start()
-                else:
-                    app.cps_widgets_animation[channel_index].stop()
-            #SBR
-            if app.show_SBR:
-                AcquisitionController.update_SBR(app, channel_index, curve)
-            cps["last_time_ns"] = time_ns
-            cps["last_count"] = cps["current_count"]   
+        for time_ns, curve_sum in zip(batch.times_ns, batch.counts):
+            if cps["last_time_ns"] == 0:
+                cps["last_time_ns"] = time_ns
+                cps["last_count"] = curve_sum
+                cps["current_count"] = curve_sum
+                continue
+            cps["current_count"] = cps["current_count"] + curve_sum
+            time_elapsed = time_ns - cps["last_time_ns"]
+            if time_elapsed > 330_000_000:
+                cps_value = (cps["current_count"] - cps["last_count"]) / (
+                    time_elapsed / 1_000_000_000
+                )
+                app.all_cps_counts.append(cps_value)            
+                humanized_number = humanize_number(cps_value)
+                app.cps_widgets[channel_index].setText(f"{humanized_number} CPS")
+                cps_threshold = app.control_inputs[s.SETTINGS_CPS_THRESHOLD].value()
+                if cps_threshold > 0:
+                    if cps_value > cps_threshold:
+                        app.cps_widgets_animation[channel_index].start()
+                    else:
+                        app.cps_widgets_animation[channel_index].stop()
+                #SBR
+                if app.show_SBR:
+                    AcquisitionController.update_SBR(app, channel_index, batch.last_curve)
+                cps["last_time_ns"] = time_ns
+                cps["last_count"] = cps["current_count"]   
             
             
             
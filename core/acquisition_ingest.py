@@ -0,0 +1,207 @@
+import threading
+
+import flim_labs
+import numpy as np
+from PyQt6.QtCore import QThread
+
+import settings.settings as s
+
+
+END_OF_ACQUISITION = ("end",)
+
+
+class DecayBatch:
+    """
+    The decay packets of one channel received between two render ticks.
+
+    The packets are folded as they arrive: the curves are summed into one
+    256-bin curve and only the timestamp and the total photon count of each
+    packet are kept, so the memory used does not grow with the 256 bins of
+    every packet when the GUI falls behind.
+    """
+
+    def __init__(self):
+        self.times_ns = []
+        self.counts = []
+        self.curve = None
+        self.last_curve = None
+
+    def add(self, time_ns, intensities):
+        """
+        Folds a decay packet into the batch.
+
+        Args:
+            time_ns (int): The timestamp of the packet in nanoseconds.
+            intensities (list[int]): The 256-bin decay curve of the packet.
+        """
+        curve = np.asarray(intensities)
+        self.times_ns.append(time_ns)
+        self.counts.append(curve.sum())
+        self.curve = curve.copy() if self.curve is None else self.curve + curve
+        self.last_curve = curve
+
+    def __len__(self):
+        return len(self.times_ns)
+
+
+class PhasorsBatch:
+    """
+    The phasors packets of one channel and harmonic received between two render ticks.
+
+    The (g, s) pairs of every packet are converted to arrays as they arrive,
+    on the ingest thread, so a lagging GUI does not accumulate Python tuples
+    and appends all the points of a tick to its store at once.
+    """
+
+    def __init__(self):
+        self._g = []
+        self._s = []
+        self.packets = 0
+
+    def add(self, points):
+        """
+        Folds a phasors packet into the batch.
+
+        Args:
+            points (list[tuple[float, float]]): The phasor points of the packet.
+        """
+        self.packets += 1
+        if len(points) == 0:
+            return
+        values = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._g.append(values[:, 0])
+        self._s.append(values[:, 1])
+
+    @property
+    def g(self):
+        return np.concatenate(self._g) if self._g else np.empty(0)
+
+    @property
+    def s(self):
+        return np.concatenate(self._s) if self._s else np.empty(0)
+
+    def __len__(self):
+        return sum(len(g) for g in self._g)
+
+
+class AcquisitionIngestWorker(QThread):
+    """
+    A worker thread draining the FLIM-LABS output queue during an acquisition.
+
+    Packets are taken from the library queue as fast as it produces them, so
+    ingest is not tied to the GUI refresh rate. Decay packets are folded into
+    a DecayBatch per channel and phasors packets into a PhasorsBatch per
+    channel and harmonic; only the end of acquisition marker is kept as a
+    packet. The GUI render tick takes everything received since the previous
+    tick with `drain`. No packet is dropped: when more than
+    s.INGEST_BACKLOG_WARNING_PACKETS arrive between two ticks, the GUI is
+    reported as lagging instead.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initializes the AcquisitionIngestWorker.
+
+        Args:
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._packets = []
+        self._decay_batches = {}
+        self._phasors_batches = {}
+        self._backlog = 0
+        self._running = True
+        self.received_packets = 0
+        self.max_backlog = 0
+        self.render_ticks = 0
+        self.lagging_ticks = 0
+        self._lagging = False
+
+    def run(self):
+        """Pulls packets until the end of acquisition marker or stop() is called."""
+        while self._running:
+            packets = flim_labs.pull_from_queue()
+            if len(packets) == 0:
+                self.msleep(s.INGEST_IDLE_SLEEP_MS)
+                continue
+            for packet in packets:
+                self._push(packet)
+                if packet == END_OF_ACQUISITION:
+                    self._running = False
+                    break
+
+    def _push(self, packet):
+        with self._lock:
+            self.received_packets += 1
+            self._backlog += 1
+            self.max_backlog = max(self.max_backlog, self._backlog)
+            if packet == END_OF_ACQUISITION:
+                self._packets.append(packet)
+                return
+            if "sp_phasors" in packet[0]:
+                key = (packet[1][0], packet[2][0])
+                batch = self._phasors_batches.get(key)
+                if batch is None:
+                    batch = self._phasors_batches[key] = PhasorsBatch()
+                batch.add(packet[3])
+                return
+            try:
+                ((channel,), (time_ns,), intensities) = packet
+            except (TypeError, ValueError):
+                print(packet)
+                return
+            batch = self._decay_batches.get(channel)
+            if batch is None:
+                batch = self._decay_batches[channel] = DecayBatch()
+            batch.add(time_ns, intensities)
+
+    def drain(self):
+        """
+        Takes everything received since the previous call.
+
+        Returns:
+            tuple[list, dict, dict]: The end of acquisition marker if received, the
+                                     {channel: DecayBatch} of the decay packets and the
+                                     {(channel, harmonic): PhasorsBatch} of the phasors packets.
+        """
+        with self._lock:
+            packets, self._packets = self._packets, []
+            decay_batches, self._decay_batches = self._decay_batches, {}
+            phasors_batches, self._phasors_batches = self._phasors_batches, {}
+            backlog, self._backlog = self._backlog, 0
+            self.render_ticks += 1
+        self._report_lag(backlog)
+        return packets, decay_batches, phasors_batches
+
+    def _report_lag(self, backlog):
+        lagging = backlog > s.INGEST_BACKLOG_WARNING_PACKETS
+        if lagging:
+            self.lagging_ticks += 1
+            if not self._lagging:
+                print(
+                    f"Warning: the GUI is lagging behind the acquisition, "
+                    f"{backlog} packets received since the previous render tick"
+                )
+        elif self._lagging:
+            print(f"The GUI caught up with the acquisition after {self.lagging_ticks} lagging ticks")
+        self._lagging = lagging
+
+    def stop(self):
+        """Asks the worker to stop and waits for it to finish."""
+        self._running = False
+        self.wait()
+
+    def stats(self):
+        """
+        Returns:
+            dict: The received packet counter, the largest number of packets received
+                  between two render ticks, the number of render ticks and the number
+                  of them above s.INGEST_BACKLOG_WARNING_PACKETS.
+        """
+        return {
+            "received_packets": self.received_packets,
+            "max_backlog": self.max_backlog,
+            "render_ticks": self.render_ticks,
+            "lagging_ticks": self.lagging_ticks,
+        }
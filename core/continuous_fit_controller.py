@@ -0,0 +1,228 @@
+import threading
+
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from utils.fitting_utilities import fit_decay_curve
+import settings.settings as s
+
+
+class ContinuousFitWorker(QThread):
+    """
+    A worker thread fitting the live decay curves of the Fitting tab.
+
+    Each job is seeded with the last result of its channel (see the
+    warm_start argument of fit_decay_curve), so successive fits of a growing
+    curve converge in a few iterations. Every model fit is capped at
+    s.CONTINUOUS_FIT_MAX_NFEV evaluations, and the worker can be cancelled
+    without waiting for the running fit (see cancel).
+
+    Signals:
+        result_ready (pyqtSignal): Emitted with the channel index and the fitting result.
+    """
+
+    result_ready = pyqtSignal(int, dict)
+
+    def __init__(self, jobs, parent=None):
+        """
+        Initializes the ContinuousFitWorker.
+
+        Args:
+            jobs (list): (channel_index, x, y, warm_start) tuples, warm_start being
+                         the previous result of the channel or None.
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.jobs = jobs
+        self._stop_event = threading.Event()
+
+    def cancel(self):
+        """Aborts the running fit and skips the remaining ones; no result is emitted anymore."""
+        self._stop_event.set()
+
+    def run(self):
+        """Fits the curves one after the other and emits each result."""
+        for channel_index, x, y, warm_start in self.jobs:
+            if self._stop_event.is_set():
+                return
+            try:
+                result = fit_decay_curve(
+                    x,
+                    y,
+                    channel_index,
+                    max_nfev=s.CONTINUOUS_FIT_MAX_NFEV,
+                    warm_start=warm_start,
+                    stop_event=self._stop_event,
+                )
+            except Exception as e:
+                result = {"error": str(e)}
+            if self._stop_event.is_set():
+                return
+            self.result_ready.emit(channel_index, result)
+
+
+class ContinuousFitController:
+    """
+    Periodically re-fits the growing decay curves during an acquisition on the Fitting tab
+    and shows the fitted lifetimes next to the decay plots.
+    """
+
+    @staticmethod
+    def is_enabled(app):
+        """
+        Args:
+            app: The main application instance.
+
+        Returns:
+            bool: Whether the continuous fit applies to the current view.
+        """
+        return (
+            app.continuous_fit
+            and app.acquire_read_mode == "acquire"
+            and app.tab_selected == s.TAB_FITTING
+        )
+
+    @staticmethod
+    def start(app):
+        """
+        Starts the periodic fitting, if enabled.
+
+        Args:
+            app: The main application instance.
+        """
+        app.continuous_fit_results.clear()
+        app.continuous_fit_runs = 0
+        if ContinuousFitController.is_enabled(app):
+            app.continuous_fit_timer.start(s.CONTINUOUS_FIT_INTERVAL_MS)
+
+    @staticmethod
+    def stop(app):
+        """
+        Stops the periodic fitting and cancels the running fit, if any.
+
+        The worker is not waited for: it stops at its next model evaluation
+        and stays referenced in app.continuous_fit_worker until then, so the
+        next timer tick does not start another one meanwhile.
+
+        Args:
+            app: The main application instance.
+        """
+        if app.continuous_fit_timer.isActive():
+            app.continuous_fit_timer.stop()
+        if app.continuous_fit_worker is not None:
+            app.continuous_fit_worker.cancel()
+
+    @staticmethod
+    def get_roi(app, channel_index):
+        """
+        Args:
+            app: The main application instance.
+            channel_index (int): The channel index.
+
+        Returns:
+            tuple | None: The (min, max) ROI bounds of the channel if its ROI is
+                          enabled in the fitting popup, as for FittingWorker, None otherwise.
+        """
+        popup = getattr(app, "fitting_config_popup", None)
+        if popup is None:
+            return None
+        checkbox = popup.roi_checkboxes.get(channel_index)
+        if checkbox is None or not checkbox.isChecked():
+            return None
+        return app.roi.get(channel_index)
+
+    @staticmethod
+    def on_timer_tick(app):
+        """
+        Fits the current decay curves in the background, unless the previous fit is still running.
+
+        Every s.CONTINUOUS_FIT_FULL_SEARCH_EVERY runs the fit is not seeded, so the
+        model order can change as the curves build up.
+
+        Args:
+            app: The main application instance.
+        """
+        from core.acquisition_controller import AcquisitionController
+
+        worker = app.continuous_fit_worker
+        if worker is not None and worker.isRunning():
+            return
+        if not ContinuousFitController.is_enabled(app):
+            return
+        data, _ = AcquisitionController.acquired_spectroscopy_data_to_fit(app, read=False)
+        full_search = app.continuous_fit_runs % s.CONTINUOUS_FIT_FULL_SEARCH_EVERY == 0
+        app.continuous_fit_runs += 1
+        jobs = []
+        for data_point in data:
+            channel_index = data_point["channel_index"]
+            warm_start = (
+                None if full_search else app.continuous_fit_results.get(channel_index)
+            )
+            x = np.array(data_point["x"], dtype=np.float64)
+            y = np.array(data_point["y"], dtype=np.float64)
+            roi = ContinuousFitController.get_roi(app, channel_index)
+            if roi is not None:
+                min_len = min(len(x), len(y))
+                x, y = x[:min_len], y[:min_len]
+                mask = (x >= roi[0]) & (x <= roi[1])
+                x, y = x[mask], y[mask]
+            jobs.append((channel_index, x, y, warm_start))
+        if not jobs:
+            return
+        app.continuous_fit_worker = ContinuousFitWorker(jobs)
+        app.continuous_fit_worker.result_ready.connect(
+            lambda channel_index, result: ContinuousFitController.handle_result(
+                app, channel_index, result
+            )
+        )
+        app.continuous_fit_worker.start()
+
+    @staticmethod
+    def handle_result(app, channel_index, result):
+        """
+        Keeps the result as seed of the next fit and shows the fitted lifetimes.
+
+        Args:
+            app: The main application instance.
+            channel_index (int): The channel index.
+            result (dict): The fitting result.
+        """
+        if "error" in result:
+            return
+        app.continuous_fit_results[channel_index] = result
+        label = app.continuous_fit_items.get(channel_index)
+        if label is None:
+            return
+        label.setText(ContinuousFitController.format_result(result))
+
+    @staticmethod
+    def format_result(result):
+        """
+        Args:
+            result (dict): The fitting result.
+
+        Returns:
+            str: The fitted lifetimes with their weights and the reduced chi-square.
+        """
+        parts = []
+        for key, component in result["output_data"].items():
+            if key == "component_B":
+                continue
+            parts.append(
+                f"τ{key[len('component_A'):]} = {component['tau_ns']:.3f} ns ({component['percentage']:.0%})"
+            )
+        parts.append(f"X² = {result['chi2']:.3f}")
+        return "   ".join(parts)
+
+    @staticmethod
+    def set_labels_visible(app, visible):
+        """
+        Shows or hides the fitted lifetime labels of the decay plots.
+
+        Args:
+            app: The main application instance.
+            visible (bool): True to show the labels, False to hide them.
+        """
+        for _, widget in app.continuous_fit_items.items():
+            if widget is not None:
+                widget.setVisible(visible)
@@ -70,6 +70,7 @@ class ControlsController:
         ControlsController.hide_harmonic_selector(app)
         hide_layout(app.control_inputs["phasors_resolution_container"])
         hide_layout(app.control_inputs["quantize_phasors_container"])
+        hide_layout(app.control_inputs["continuous_fit_container"])
         app.control_inputs["tau_label"].hide()
         app.control_inputs["tau"].hide()
         app.control_inputs[s.SETTINGS_HARMONIC].hide()
@@ -122,6 +123,7 @@ class ControlsController:
         ControlsController.hide_harmonic_selector(app)
         hide_layout(app.control_inputs["phasors_resolution_container"])
         hide_layout(app.control_inputs["quantize_phasors_container"])
+        (show_layout(app.control_inputs["continuous_fit_container"]) if app.acquire_read_mode != "read" else hide_layout(app.control_inputs["continuous_fit_container"]))
         app.control_inputs["tau_label"].hide()
         app.control_inputs["tau"].hide()
         app.control_inputs["calibration"].hide()
@@ -145,6 +147,7 @@ class ControlsController:
         """
         app.widgets[s.TIME_TAGGER_WIDGET].setVisible(False)
         ControlsController.fit_button_hide(app)
+        hide_layout(app.control_inputs["continuous_fit_container"])
 
         if app.acquire_read_mode == "read":
             app.control_inputs[s.LOAD_REF_BTN].hide()
@@ -660,6 +663,24 @@ class ControlsController:
         app.bin_file_size_label.show() if state else app.bin_file_size_label.hide()
         ExportData.calc_exported_file_size(app) if state else None
 
+    @staticmethod
+    def on_continuous_fit_changed(app, state):
+        """
+        Callback for the 'Continuous fit' switch.
+
+        Args:
+            app: The main application instance.
+            state (bool): The new state of the switch.
+        """
+        from core.continuous_fit_controller import ContinuousFitController
+        app.settings.setValue(s.SETTINGS_CONTINUOUS_FIT, state)
+        app.continuous_fit = state
+        ContinuousFitController.set_labels_visible(app, state)
+        if not state:
+            ContinuousFitController.stop(app)
+        elif app.mode == s.MODE_RUNNING:
+            ContinuousFitController.start(app)
+
     @staticmethod
     def on_show_SBR_changed(app, state):
         """
@@ -712,12 +733,11 @@ class ControlsController:
             )
 
         if not app.quantized_phasors:
-            # In phasors read mode, clear old scatters and redraw for new harmonic
+            # In phasors read mode, show the cached scatters of the new harmonic
             if is_phasors_read_mode:
-                PhasorsController.clear_phasors_file_scatters(app)
                 PhasorsController.clear_phasors_files_legend(app)
                 
-                # Redraw points for the selected harmonic (only in read mode)
+                # Draw points for the selected harmonic (only in read mode)
                 for i, channel_index in enumerate(app.plots_to_show):
                     if (
                         channel_index < len(app.all_phasors_points)
@@ -1,10 +1,14 @@
+import colorsys
+import time
 import numpy as np
 import pyqtgraph as pg
-from PyQt6.QtCore import  Qt
+from PyQt6.QtCore import  Qt, QTimer
 from PyQt6.QtGui import QFont
 
 
 from utils.helpers import mhz_to_ns
+from utils.phasors_store import PhasorPointStore
+from utils.phasors_lod import PhasorLODLayer
 import settings.settings as s
 
 
@@ -25,20 +29,22 @@ class PhasorsController:
         Initializes an empty data structure for storing phasor points.
 
         Returns:
-            list[dict[int, list]]: A list of dictionaries, where each list
-                                   represents a channel and each dictionary
-                                   holds empty lists for harmonics 1 through 4.
+            list[dict[int, PhasorPointStore]]: A list of dictionaries, where each
+                                               dictionary represents a channel and
+                                               holds an empty store for harmonics
+                                               1 through 4.
         """
         empty = []
         for i in range(8):
-            empty.append({1: [], 2: [], 3: [], 4: []})
+            empty.append({h: PhasorPointStore() for h in range(1, 5)})
         return empty
     
     @staticmethod
     def get_color_for_file_index(index):
         """
         Returns a color based on the file index (0, 1, 2, 3...).
-        Uses 4 distinct colors cycling through them: red, bright green, orange, yellow.
+        The first 4 files are red, bright green, orange and yellow; the next
+        ones get distinct hues spread by the golden angle.
         
         Args:
             index (int): The index of the file (0-based).
@@ -52,8 +58,12 @@ class PhasorsController:
             "#FF8C00",  # Orange (arancione)
             "#FFFF00",  # Yellow (giallo)
         ]
-        
-        return colors[index % len(colors)]
+        if index < len(colors):
+            return colors[index]
+        hue = (0.55 + (index - len(colors)) * 0.381966) % 1.0
+        lightness = 0.55 if (index // 8) % 2 == 0 else 0.7
+        r, g, b = colorsys.hls_to_rgb(hue, lightness, 1.0)
+        return f"#{int(r * 255):02X}{int(g * 255):02X}{int(b * 255):02X}"
     
     @staticmethod
     def create_phasors_files_legend(app, channel, file_order):
@@ -134,7 +144,7 @@ class PhasorsController:
             app: The main application instance.
             channel (int): The channel index to draw the points on.
             harmonic (int): The harmonic number of the phasor points.
-            phasors (list[tuple]): A list of (g, s) or (g, s, file_name) tuples to plot.
+            phasors (PhasorPointStore): The points of the channel and harmonic.
         """
         if channel in app.plots_to_show:
             # Check if we are in phasors read mode
@@ -143,63 +153,132 @@ class PhasorsController:
                                    app.acquire_read_mode == "read")
             
             if is_phasors_read_mode:
-                # Clear existing scatter plots for this channel before adding new ones
-                if hasattr(app, 'phasors_file_scatters') and channel in app.phasors_file_scatters:
-                    for scatter in app.phasors_file_scatters[channel]:
-                        app.phasors_widgets[channel].removeItem(scatter)
-                    app.phasors_file_scatters[channel] = []
-                
-                # New behavior for phasors read mode: Group points by file name and use different colors
-                points_by_file = {}
-                file_order = []  # Keep track of file order
-                for point in phasors:
-                    g, s = point[0], point[1]
-                    file_name = point[2] if len(point) >= 3 else ""
-                    if file_name not in points_by_file:
-                        points_by_file[file_name] = {"x": [], "y": []}
-                        file_order.append(file_name)  # Add to order list
-                    points_by_file[file_name]["x"].append(g)
-                    points_by_file[file_name]["y"].append(s)
-                
-                # Draw each file's points with its own color based on order
-                for idx, file_name in enumerate(file_order):
-                    coords = points_by_file[file_name]
-                    color = PhasorsController.get_color_for_file_index(idx)
-                    x_array = np.array(coords["x"])
-                    y_array = np.array(coords["y"])
-                    
-                    # Create a scatter plot item with the file-specific color
-                    scatter = pg.ScatterPlotItem(
-                        x=x_array,
-                        y=y_array,
-                        size=5,
-                        pen=None,
-                        brush=pg.mkBrush(color),
-                        symbol="o"
-                    )
-                    scatter.setZValue(1)
-                    app.phasors_widgets[channel].addItem(scatter)
-                    
-                    # Store reference for potential cleanup
-                    if not hasattr(app, 'phasors_file_scatters'):
-                        app.phasors_file_scatters = {}
-                    if channel not in app.phasors_file_scatters:
-                        app.phasors_file_scatters[channel] = []
-                    app.phasors_file_scatters[channel].append(scatter)
-                
-                # Create legend with file names and colors
-                PhasorsController.create_phasors_files_legend(app, channel, file_order)
+                # Points colored by source file, one cached scatter per (harmonic, file)
+                PhasorsController.draw_file_scatters(app, channel, harmonic, phasors)
             else:
-                # Original behavior for acquisition mode or other tabs
-                x, y = app.phasors_charts[channel].getData()
-                if x is None:
-                    x = np.array([])
-                    y = np.array([])
-                new_x = [p[0] for p in phasors]
-                new_y = [p[1] for p in phasors]
-                x = np.concatenate((x, new_x))
-                y = np.concatenate((y, new_y))
-                app.phasors_charts[channel].setData(x, y)  
+                # Acquisition mode or other tabs: only the new points are decimated and added
+                PhasorsController.draw_points_lod(app, channel, phasors)
+
+    @staticmethod
+    def draw_file_scatters(app, channel, harmonic, phasors):
+        """
+        Shows the points of a store colored by source file (phasors read mode).
+
+        The scatter items are kept in app.phasors_file_scatters per channel,
+        harmonic and file: only the items of the files whose points changed are
+        rebuilt, and the items of the other harmonics are hidden, so switching
+        harmonic does not recreate them.
+
+        Args:
+            app: The main application instance.
+            channel (int): The channel index.
+            harmonic (int): The harmonic number of the phasor points.
+            phasors (PhasorPointStore): The points of the channel and harmonic.
+        """
+        widget = app.phasors_widgets[channel]
+        harmonics_scatters = app.phasors_file_scatters.setdefault(channel, {})
+        entry = harmonics_scatters.get(harmonic)
+        if entry is not None and entry["store"] is not phasors:
+            for scatter in entry["scatters"].values():
+                widget.removeItem(scatter)
+            entry = None
+        if entry is None:
+            entry = {"store": phasors, "sizes": {}, "scatters": {}}
+            harmonics_scatters[harmonic] = entry
+        file_ids, starts, ends = phasors.file_groups()
+        file_order = []
+        for idx, (file_id, start, end) in enumerate(
+            zip(file_ids.tolist(), starts.tolist(), ends.tolist())
+        ):
+            file_order.append(phasors.file_name(file_id))
+            if entry["sizes"].get(file_id) == end - start:
+                continue
+            brush = pg.mkBrush(PhasorsController.get_color_for_file_index(idx))
+            scatter = entry["scatters"].get(file_id)
+            if scatter is None:
+                scatter = pg.ScatterPlotItem(size=5, pen=None, brush=brush, symbol="o")
+                scatter.setZValue(1)
+                widget.addItem(scatter)
+                entry["scatters"][file_id] = scatter
+            scatter.setData(
+                x=phasors.g[start:end], y=phasors.s[start:end], brush=brush
+            )
+            entry["sizes"][file_id] = end - start
+        for file_id in set(entry["scatters"]) - set(file_ids.tolist()):
+            widget.removeItem(entry["scatters"].pop(file_id))
+            entry["sizes"].pop(file_id, None)
+        for scatters_harmonic, harmonic_entry in harmonics_scatters.items():
+            for scatter in harmonic_entry["scatters"].values():
+                scatter.setVisible(scatters_harmonic == harmonic)
+        PhasorsController.create_phasors_files_legend(app, channel, file_order)
+
+    @staticmethod
+    def draw_points_lod(app, channel, phasors):
+        """
+        Adds the points of a store not drawn yet to the channel's phasor plot,
+        decimated to the current view (see PhasorLODLayer).
+
+        Args:
+            app: The main application instance.
+            channel (int): The channel index.
+            phasors (PhasorPointStore): The points of the channel and harmonic.
+        """
+        lod = app.phasors_lod.setdefault(channel, PhasorLODLayer())
+        if lod.needs_rebuild(phasors):
+            lod.store = phasors
+            PhasorsController.rebuild_phasors_lod(app, channel)
+            return
+        g, s_values = lod.select(phasors.g[lod.consumed :], phasors.s[lod.consumed :])
+        lod.consumed = len(phasors)
+        if len(g) > 0:
+            app.phasors_charts[channel].addPoints(x=g, y=s_values)
+
+    @staticmethod
+    def rebuild_phasors_lod(app, channel):
+        """
+        Decimates all the points of the channel to the current view and replaces the plotted ones.
+
+        Args:
+            app: The main application instance.
+            channel (int): The channel index.
+        """
+        lod = app.phasors_lod.get(channel)
+        if lod is None or lod.store is None or channel not in app.phasors_widgets:
+            return
+        view_box = app.phasors_widgets[channel].getViewBox()
+        x_range, y_range = view_box.viewRange()
+        try:
+            pixel_size = view_box.viewPixelSize()
+        except Exception:
+            # Not laid out yet, the view range sets the cells size
+            pixel_size = (0, 0)
+        lod.set_view(x_range, y_range, pixel_size)
+        g, s_values = lod.select(lod.store.g, lod.store.s)
+        lod.consumed = len(lod.store)
+        app.phasors_charts[channel].setData(x=g, y=s_values)
+
+    @staticmethod
+    def on_phasors_view_changed(app, channel):
+        """
+        Re-decimates the points of a phasor plot after a zoom, pan or auto-range.
+
+        Successive view changes within s.PHASORS_LOD_REFRESH_MS are coalesced.
+
+        Args:
+            app: The main application instance.
+            channel (int): The channel index.
+        """
+        lod = app.phasors_lod.get(channel)
+        if lod is None or lod.store is None or lod.refresh_pending:
+            return
+        lod.refresh_pending = True
+
+        def refresh():
+            lod.refresh_pending = False
+            if app.phasors_lod.get(channel) is lod:
+                PhasorsController.rebuild_phasors_lod(app, channel)
+
+        QTimer.singleShot(s.PHASORS_LOD_REFRESH_MS, refresh)
         
         
     @staticmethod
@@ -322,6 +401,7 @@ class PhasorsController:
         for ch in app.plots_to_show:
             if ch in app.phasors_charts:
                 app.phasors_charts[ch].setData([], [])   
+            app.phasors_lod.pop(ch, None)
                 
                 
     @staticmethod
@@ -346,13 +426,14 @@ class PhasorsController:
 
     @staticmethod
     def clear_phasors_file_scatters(app):
-        """Removes scatter items associated with file-specific phasor points."""
-        if hasattr(app, "phasors_file_scatters"):
-            for channel, scatter_list in list(app.phasors_file_scatters.items()):
-                if channel in app.phasors_widgets:
-                    for scatter in scatter_list:
-                        app.phasors_widgets[channel].removeItem(scatter)
-            app.phasors_file_scatters.clear()
+        """Removes the cached scatter items of the file-specific phasor points, for all harmonics."""
+        for channel, harmonics_scatters in app.phasors_file_scatters.items():
+            if channel not in app.phasors_widgets:
+                continue
+            for entry in harmonics_scatters.values():
+                for scatter in entry["scatters"].values():
+                    app.phasors_widgets[channel].removeItem(scatter)
+        app.phasors_file_scatters.clear()
 
 
     @staticmethod
@@ -386,20 +467,7 @@ class PhasorsController:
                                                values, or (None, None) if no
                                                data is available.
         """
-        x = [p[0] for p in app.all_phasors_points[channel_index][harmonic]]
-        y = [p[1] for p in app.all_phasors_points[channel_index][harmonic]]
-        g_values = np.array(x)
-        s_values = np.array(y)
-        if (
-            g_values.size == 0
-            or s_values.size == 0
-            or np.all(np.isnan(g_values))
-            or np.all(np.isnan(s_values))
-        ):
-            return None, None
-        mean_g = np.nanmean(g_values)
-        mean_s = np.nanmean(s_values)
-        return mean_g, mean_s
+        return app.all_phasors_points[channel_index][harmonic].mean()
     
     
     @staticmethod
@@ -433,33 +501,17 @@ class PhasorsController:
                     app.phasors_widgets[channel_index].removeItem(old_centers)
             
             if is_phasors_read_mode:
-                # New behavior: Create one center (blue cross) per file
-                points_by_file = {}
-                for point in app.all_phasors_points[channel_index][harmonic]:
-                    g, s = point[0], point[1]
-                    file_name = point[2] if len(point) >= 3 else ""
-                    if file_name not in points_by_file:
-                        points_by_file[file_name] = {"g": [], "s": []}
-                    points_by_file[file_name]["g"].append(g)
-                    points_by_file[file_name]["s"].append(s)
-                
-                # Create a blue cross for each file's mean
+                # One center (blue cross) per file, from the per-file means of the store
+                file_means = app.all_phasors_points[channel_index][harmonic].file_means()
+                means = np.array(
+                    [(mean_g, mean_s) for _, mean_g, mean_s in file_means], dtype=np.float64
+                ).reshape(-1, 2)
+                means = means[~np.isnan(means).any(axis=1)]
                 cluster_centers = []
-                for file_name, coords in points_by_file.items():
-                    g_values = np.array(coords["g"])
-                    s_values = np.array(coords["s"])
-                    
-                    if g_values.size == 0 or s_values.size == 0:
-                        continue
-                    if np.all(np.isnan(g_values)) or np.all(np.isnan(s_values)):
-                        continue
-                    
-                    mean_g = np.nanmean(g_values)
-                    mean_s = np.nanmean(s_values)
-                    
+                if len(means) > 0:
                     scatter = pg.ScatterPlotItem(
-                        [mean_g],
-                        [mean_s],
+                        means[:, 0],
+                        means[:, 1],
                         size=20,
                         pen={
                             "color": "#0066CC",
@@ -517,19 +569,9 @@ class PhasorsController:
                 
                 if is_phasors_read_mode:
                     # Multi-file mode: Create colored legend for each file
-                    points_by_file = {}
-                    file_order = []
-                    
-                    for point in app.all_phasors_points[channel_index][harmonic]:
-                        g, s = point[0], point[1]
-                        file_name = point[2] if len(point) >= 3 else ""
-                        if file_name not in points_by_file:
-                            points_by_file[file_name] = {"g": [], "s": []}
-                            file_order.append(file_name)
-                        points_by_file[file_name]["g"].append(g)
-                        points_by_file[file_name]["s"].append(s)
+                    file_means = app.all_phasors_points[channel_index][harmonic].file_means()
                     
-                    if not points_by_file:
+                    if not file_means:
                         legend_label.setVisible(False)
                         continue
                     
@@ -547,18 +589,10 @@ class PhasorsController:
                     
                     html_parts = []
                     
-                    for idx, file_name in enumerate(file_order):
-                        coords = points_by_file[file_name]
-                        g_values = np.array(coords["g"])
-                        s_values = np.array(coords["s"])
-                        
-                        if g_values.size == 0 or s_values.size == 0:
-                            continue
-                        if np.all(np.isnan(g_values)) or np.all(np.isnan(s_values)):
+                    for idx, (file_name, mean_g, mean_s) in enumerate(file_means):
+                        if np.isnan(mean_g) or np.isnan(mean_s):
                             continue
                         
-                        mean_g = np.nanmean(g_values)
-                        mean_s = np.nanmean(s_values)
                         color = PhasorsController.get_color_for_file_index(idx)
                         
                         # Try to calculate tau values if frequency is available
@@ -789,19 +823,52 @@ class PhasorsController:
         """
         Event handler for mouse movement over a phasor plot.
 
-        Updates the crosshair position and displays the calculated lifetime values
-        at the cursor's location.
+        Only the latest position is kept: the crosshair and the lifetime readout
+        are updated at most once every s.PHASORS_CURSOR_REFRESH_MS (see
+        update_phasors_cursor).
 
         Args:
             app: The main application instance.
             event: The mouse move event from PyQt.
             channel_index (int): The index of the channel where the event occurred.
         """
+        cursor = app.phasors_cursor
+        cursor["pending_event"] = (event, channel_index)
+        if cursor["refresh_pending"]:
+            return
+        cursor["refresh_pending"] = True
+
+        def refresh():
+            cursor["refresh_pending"] = False
+            pending_event = cursor.pop("pending_event", None)
+            if pending_event is not None:
+                PhasorsController.update_phasors_cursor(app, *pending_event)
+
+        QTimer.singleShot(s.PHASORS_CURSOR_REFRESH_MS, refresh)
+
+    @staticmethod
+    def update_phasors_cursor(app, event, channel_index):
+        """
+        Updates the crosshair position and displays the lifetime values at the
+        cursor's location.
+
+        Called at most once per s.PHASORS_CURSOR_REFRESH_MS with the latest
+        position, so the lifetimes are computed exactly at the cursor. The text
+        is only set again when the displayed values change.
+
+        Args:
+            app: The main application instance.
+            event: The scene position of the mouse.
+            channel_index (int): The index of the channel where the event occurred.
+        """
         from core.controls_controller import ControlsController
-        for i, channel in enumerate(app.phasors_coords):
-            if channel != channel_index:
-                app.phasors_coords[channel].setText("")
-                app.phasors_crosshairs[channel].setText("")
+        cursor = app.phasors_cursor
+        previous_channel = cursor.get("channel")
+        if previous_channel != channel_index and previous_channel in app.phasors_coords:
+            app.phasors_coords[previous_channel].setText("")
+            app.phasors_crosshairs[previous_channel].setText("")
+            cursor["html"] = None
+        cursor["channel"] = channel_index
         try:
             phasor_widget = app.phasors_widgets[channel_index]
             text = app.phasors_coords[channel_index]
@@ -814,24 +881,20 @@ class PhasorsController:
         text.setPos(mouse_point.x(), mouse_point.y())
         freq_mhz = ControlsController.get_current_frequency_mhz(app)
         harmonic = int(app.control_inputs[s.HARMONIC_SELECTOR].currentText())
-        g = mouse_point.x()
-        s_coord = mouse_point.y()
-        tau_phi, tau_m, tau_n = PhasorsController.calculate_tau(g, s_coord, freq_mhz, harmonic)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tau_phi, tau_m, tau_n = PhasorsController.calculate_tau(
+                np.float64(mouse_point.x()), np.float64(mouse_point.y()), freq_mhz, harmonic
+            )
         if tau_phi is None:
             return
         if tau_m is None:
-            text.setText(f"𝜏ϕ={round(tau_phi, 2)} ns; 𝜏n={round(tau_n, 2)} ns")
-            text.setHtml(
-                '<div style="background-color: rgba(0, 0, 0, 0.5);">{}</div>'.format(
-                    f"𝜏ϕ={round(tau_phi, 2)} ns; 𝜏n={round(tau_n, 2)} ns"
-                )
-            )
+            readout = f"𝜏ϕ={round(tau_phi, 2)} ns; 𝜏n={round(tau_n, 2)} ns"
         else:
-            text.setText(f"𝜏ϕ={round(tau_phi, 2)} ns; 𝜏m={round(tau_m, 2)} ns; 𝜏n={round(tau_n, 2)} ns")
+            readout = f"𝜏ϕ={round(tau_phi, 2)} ns; 𝜏n={round(tau_n, 2)} ns; 𝜏m={round(tau_m, 2)} ns"
+        if cursor["html"] != (text, readout):
+            cursor["html"] = (text, readout)
             text.setHtml(
-                '<div style="background-color: rgba(0, 0, 0, 0.5);">{}</div>'.format(
-                    f"𝜏ϕ={round(tau_phi, 2)} ns; 𝜏n={round(tau_n, 2)} ns; 𝜏m={round(tau_m, 2)} ns"
-                )
+                '<div style="background-color: rgba(0, 0, 0, 0.5);">{}</div>'.format(readout)
             )
                      
    
@@ -849,42 +912,78 @@ class PhasorsController:
             bins (int, optional): The number of bins for the histogram. Defaults to 64.
         """
         for i, channel_index in enumerate(app.plots_to_show):
-            x = [p[0] for p in app.all_phasors_points[channel_index][harmonic]]
-            y = [p[1] for p in app.all_phasors_points[channel_index][harmonic]]
-            if x is None or y is None or len(x) == 0 or len(y) == 0:
+            points = app.all_phasors_points[channel_index][harmonic]
+            if len(points) == 0:
                 continue
-            h, xedges, yedges = np.histogram2d(
-                x, y, bins=bins * 4, range=[[-2, 2], [-2, 2]]
+            PhasorsController.draw_quantized_phasors(
+                app, channel_index, points.density(bins), bins
             )
-            non_zero_h = h[h > 0]
-            all_zeros = len(non_zero_h) == 0
-            h_min = np.min(non_zero_h)
-            h_max = np.max(h)
-            h = h / np.max(h)
-            h[h == 0] = np.nan
+            PhasorsController.clear_phasors_points(app) 
+            
+
+    @staticmethod
+    def update_live_quantized_phasors(app, channel_index, harmonic):
+        """
+        Redraws the quantized phasors of a channel during acquisition.
+
+        The density grid is updated incrementally by every incoming batch, this
+        only re-renders it, at most once every s.PHASORS_DENSITY_REFRESH_MS.
+
+        Args:
+            app: The main application instance.
+            channel_index (int): The channel to redraw.
+            harmonic (int): The harmonic number to quantize.
+        """
+        now = time.monotonic()
+        last_render = app.phasors_density_rendered_at.get(channel_index, 0)
+        if (now - last_render) * 1000 < s.PHASORS_DENSITY_REFRESH_MS:
+            return
+        app.phasors_density_rendered_at[channel_index] = now
+        bins = int(s.PHASORS_RESOLUTIONS[app.phasors_resolution])
+        points = app.all_phasors_points[channel_index][harmonic]
+        PhasorsController.draw_quantized_phasors(
+            app, channel_index, points.density(bins), bins
+        )
+
+    @staticmethod
+    def draw_quantized_phasors(app, channel_index, counts, bins):
+        """
+        Renders a phasor density grid as a colormapped image.
+
+        The image item of the channel is reused when it already exists.
+
+        Args:
+            app: The main application instance.
+            channel_index (int): The channel to draw the image on.
+            counts (np.ndarray): The density grid, see PhasorPointStore.density.
+            bins (int): The phasors resolution of the grid.
+        """
+        non_zero_h = counts[counts > 0]
+        if len(non_zero_h) == 0:
+            return
+        h_min = np.min(non_zero_h)
+        h_max = np.max(counts)
+        h = counts / h_max
+        h[h == 0] = np.nan
+        image_item = app.quantization_images.get(channel_index)
+        if image_item is None or image_item.scene() is None:
             image_item = pg.ImageItem()
-            image_item.setImage(h, levels=(0, 1))
             image_item.setLookupTable(
                 PhasorsController.create_cool_colormap().getLookupTable(0, 1.0)
             )
             image_item.setOpacity(1)
-            image_item.resetTransform()
-            image_item.setScale(1 / bins)
-            image_item.setPos(-2, -2)
-            if channel_index in app.quantization_images:
-                app.phasors_widgets[channel_index].removeItem(
-                    app.quantization_images[channel_index]
-                )
-            if channel_index in app.phasors_colorbars:
-                app.phasors_widgets[channel_index].removeItem(
-                    app.phasors_colorbars[channel_index]
-                )
             image_item.setZValue(-1)
             app.phasors_widgets[channel_index].addItem(image_item, ignoreBounds=True)
             app.quantization_images[channel_index] = image_item
-            if not all_zeros:
-                PhasorsController.generate_colorbar(app, channel_index, h_min, h_max)
-            PhasorsController.clear_phasors_points(app) 
+        image_item.setImage(h, levels=(0, 1))
+        image_item.resetTransform()
+        image_item.setScale(1 / bins)
+        image_item.setPos(-2, -2)
+        if channel_index in app.phasors_colorbars:
+            app.phasors_widgets[channel_index].removeItem(
+                app.phasors_colorbars[channel_index]
+            )
+        PhasorsController.generate_colorbar(app, channel_index, h_min, h_max)
             
     
     @staticmethod
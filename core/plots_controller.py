@@ -6,6 +6,7 @@ import pyqtgraph as pg
 from components.animations import VibrantAnimation
 from utils.gui_styles import GUIStyles
 from utils.helpers import get_realtime_adjustment_value
+from utils.ring_buffer import TraceRingBuffer
 from components.lin_log_control import LinLogControl
 from components.spectroscopy_curve_time_shift import SpectroscopyTimeShift
 from utils.channel_name_utils import get_channel_name
@@ -235,7 +236,7 @@ class PlotsController:
             static_curve = curve_widget.plot(x, log_values, pen=pg.mkPen(color="#f72828", width=2))
             axis = curve_widget.getAxis("left")
             curve_widget.showGrid(x=False, y=True, alpha=0.3)
-            axis.setTicks([ticks])
+            LinLogControl.set_axis_ticks(axis, ticks)
             PlotsController.set_plot_y_range(curve_widget)
             
         curve_widget.plotItem.getAxis("left").enableAutoSIPrefix(False)
@@ -285,6 +286,12 @@ class PlotsController:
             if not app.show_SBR: SBR_label.hide()
             app.SBR_items[channel] = SBR_label
             v_decay_layout.addWidget(SBR_label)
+            if app.tab_selected == s.TAB_FITTING:
+                fit_label = QLabel("")
+                fit_label.setStyleSheet(GUIStyles.SBR_label())
+                if not app.continuous_fit: fit_label.hide()
+                app.continuous_fit_items[channel] = fit_label
+                v_decay_layout.addWidget(fit_label)
         
         curve_widget = PlotsController._create_decay_curve_widget(app, channel, frequency_mhz)
         v_decay_layout.addWidget(curve_widget)
@@ -366,7 +373,14 @@ class PlotsController:
            channel_names = getattr(app, 'channel_names', {})
            phasors_widget.setTitle(f"{get_channel_name(channel, channel_names)} phasors")
         PhasorsController.draw_semi_circle(phasors_widget)
-        app.phasors_charts[channel] = phasors_widget.plot([], [], pen=None, symbol="o", symbolPen="#1E90FF", symbolSize=1, symbolBrush="#1E90FF")
+        phasors_chart = pg.ScatterPlotItem(
+            pen=pg.mkPen("#1E90FF"), brush=pg.mkBrush("#1E90FF"), size=1, symbol="o"
+        )
+        phasors_widget.addItem(phasors_chart)
+        phasors_widget.getViewBox().sigRangeChanged.connect(
+            lambda *_, channel=channel: PhasorsController.on_phasors_view_changed(app, channel)
+        )
+        app.phasors_charts[channel] = phasors_chart
         app.phasors_widgets[channel] = phasors_widget
         v_layout.addWidget(phasors_widget, 3)
         
@@ -430,19 +444,22 @@ class PlotsController:
             
     
     @staticmethod
-    def update_intensity_plots(app, channel_index, time_ns, curve):
+    def update_intensity_plots(app, channel_index, time_ns, counts):
         """
         Updates the intensity plot for a specific channel with new data.
 
         It appends the new data point (total counts in the curve vs. time)
         and trims the data from the left to maintain a fixed time window,
-        creating a scrolling effect.
+        creating a scrolling effect. Points are kept in a per-channel
+        TraceRingBuffer so no array is reallocated per packet.
 
         Args:
             app: The main application instance.
             channel_index (int): The channel to update.
-            time_ns (int): The timestamp of the new data in nanoseconds.
-            curve (np.ndarray): The array of photon counts for the new data slice.
+            time_ns (int | np.ndarray): The timestamp of the new data in nanoseconds,
+                                        or the [k] timestamps of a batch.
+            counts (float | np.ndarray): The total photon count of the new data slice,
+                                         or the [k] counts of a batch.
         """
         bin_width_micros = int(
             app.settings.value(s.SETTINGS_BIN_WIDTH, s.DEFAULT_BIN_WIDTH)
@@ -453,25 +470,51 @@ class PlotsController:
             )
             / bin_width_micros
         )
-        curve = tuple(x / adjustment for x in curve)
         if app.tab_selected in app.intensity_lines:
             if channel_index in app.intensity_lines[app.tab_selected]:
                 intensity_line = app.intensity_lines[app.tab_selected][channel_index]
                 if intensity_line is not None:
-                    x, y = intensity_line.getData()
-                    # Initialize or append data
-                    if x is None or (len(x) == 1 and x[0] == 0):
-                        x = np.array([time_ns / 1_000_000_000])
-                        y = np.array([np.sum(curve)])
-                    else:
-                        x = np.append(x, time_ns / 1_000_000_000)
-                        y = np.append(y, np.sum(curve))
+                    buffer = PlotsController.get_intensity_buffer(
+                        app, channel_index, intensity_line, bin_width_micros
+                    )
+                    buffer.extend(
+                        np.atleast_1d(time_ns) / 1_000_000_000,
+                        np.atleast_1d(counts) / adjustment,
+                    )
                     # Trim data based on time span
-                    if len(x) > 2:
-                        while x[-1] - x[0] > app.cached_time_span_seconds:
-                            x = x[1:]
-                            y = y[1:]
-                    intensity_line.setData(x, y) 
+                    buffer.trim(app.cached_time_span_seconds)
+                    intensity_line.setData(*buffer.view())
+
+
+    @staticmethod
+    def get_intensity_buffer(app, channel_index, intensity_line, bin_width_micros):
+        """
+        Returns the ring buffer backing the intensity plot of a channel.
+
+        A new buffer, seeded with the points already shown, is created when the
+        channel has none or when its intensity plot has been recreated.
+
+        Args:
+            app: The main application instance.
+            channel_index (int): The channel of the intensity plot.
+            intensity_line (pg.PlotDataItem): The intensity plot item.
+            bin_width_micros (int): The acquisition bin width, used to size the buffer.
+
+        Returns:
+            TraceRingBuffer: The buffer of the channel.
+        """
+        line, buffer = app.intensity_buffers.get(channel_index, (None, None))
+        if line is intensity_line:
+            return buffer
+        buffer = TraceRingBuffer(
+            TraceRingBuffer.capacity_for(app.cached_time_span_seconds, bin_width_micros)
+        )
+        x, y = intensity_line.getData()
+        if x is not None and not (len(x) == 1 and x[0] == 0):
+            for x_value, y_value in zip(x, y):
+                buffer.append(x_value, y_value)
+        app.intensity_buffers[channel_index] = (intensity_line, buffer)
+        return buffer
                     
                     
                     
@@ -510,16 +553,19 @@ class PlotsController:
         else:
             decay_widget.showGrid(x=False, y=True, alpha=0.3)
             sum_decay = y
-            log_values, ticks, _ = LinLogControl.calculate_log_ticks(sum_decay)
+            log_values, ticks, _ = LinLogControl.calculate_log_ticks(
+                sum_decay, out=app.decay_log_buffers.get(channel_index)
+            )
+            app.decay_log_buffers[channel_index] = log_values
             decay_curve.setData(x, np.roll(log_values, time_shift))
             axis = decay_widget.getAxis("left")
-            axis.setTicks([ticks])
+            LinLogControl.set_axis_ticks(axis, ticks)
             PlotsController.set_plot_y_range(decay_widget)   
             
             
             
     @staticmethod
-    def update_plots(app, channel_index, time_ns, curve, reader_mode=False):
+    def update_plots(app, channel_index, time_ns, curve, reader_mode=False, counts=None):
         """
         Main function to update plots with new data during an acquisition.
 
@@ -529,14 +575,22 @@ class PlotsController:
         Args:
             app: The main application instance.
             channel_index (int): The channel the data belongs to.
-            time_ns (int): The timestamp of the data.
-            curve (np.ndarray): The photon count data.
+            time_ns (int | np.ndarray): The timestamp of the data, or the [k]
+                                        timestamps of a batch during acquisition.
+            curve (np.ndarray): The photon count data, or the [k, 256] curves of a
+                                batch during acquisition (summed for the decay plot),
+                                or their sum if counts is given.
             reader_mode (bool, optional): True if data comes from a file reader,
                                           which affects how data is handled. Defaults to False.
+            counts (np.ndarray, optional): The [k] photon counts of a batch whose curves
+                                           are already summed into curve. Defaults to None.
         """
         if not reader_mode:
+            if counts is None:
+                counts = np.atleast_2d(curve).sum(axis=1)
+                curve = np.atleast_2d(curve).sum(axis=0)
             # Update intensity plots
-            PlotsController.update_intensity_plots(app, channel_index, time_ns, curve)
+            PlotsController.update_intensity_plots(app, channel_index, time_ns, counts)
         
         # Get decay_curve if it exists, but don't fail if it doesn't (especially in reader_mode)
         decay_curve = None
@@ -564,8 +618,9 @@ class PlotsController:
                 PlotsController.update_spectroscopy_plots(app, x, y, channel_index, decay_curve)
             else:
                 decay_curve.setData(x, curve + y)
-        QApplication.processEvents()
-        time.sleep(0.01)        
+        if reader_mode:
+            QApplication.processEvents()
+            time.sleep(0.01)
             
                          
             
@@ -601,9 +656,11 @@ class PlotsController:
         app.phasors_lifetime_texts.clear()
         app.intensities_widgets.clear()
         app.phasors_charts.clear()
+        app.phasors_lod.clear()
         app.phasors_widgets.clear()
         app.decay_widgets.clear()
         app.phasors_coords.clear()
+        app.phasors_cursor.update(channel=None, html=None)
         for i, animation in app.cps_widgets_animation.items():
             if animation:
                 animation.stop()
@@ -613,9 +670,11 @@ class PlotsController:
         app.all_cps_counts.clear()
         app.all_SBR_counts.clear()
         app.SBR_items.clear()
+        app.continuous_fit_items.clear()
         app.acquisition_time_countdown_widgets.clear()
         if deep_clear:
             app.intensity_lines = deepcopy(s.DEFAULT_INTENSITY_LINES)
+            app.intensity_buffers.clear()
             app.decay_curves = deepcopy(s.DEFAULT_DECAY_CURVES)
             app.cached_decay_values = deepcopy(s.DEFAULT_CACHED_DECAY_VALUES)
             PhasorsController.clear_phasors_points(app)
@@ -69,6 +69,12 @@ class UIController:
         )
         app.widgets[s.TIME_TAGGER_PROGRESS_BAR] = time_tagger_progress_bar
         main_layout.addWidget(time_tagger_progress_bar)
+        # Acquisition files export progress bar
+        export_progress_bar = ProgressBar(
+            visible=False, label_text="Saving acquisition files..."
+        )
+        app.widgets[s.EXPORT_PROGRESS_BAR] = export_progress_bar
+        main_layout.addWidget(export_progress_bar)
         main_layout.addSpacing(5)
         grid_layout = QGridLayout()
         main_layout.addLayout(grid_layout)
@@ -370,6 +376,30 @@ class UIController:
         layout.addLayout(show_SBR_control)   
         layout.addSpacing(20)
 
+    @staticmethod
+    def _create_continuous_fit_control(app, layout):
+        """
+        Creates the switch of the continuous fit shown on the Fitting tab during acquisitions.
+
+        Args:
+            app: The main application instance.
+            layout (QLayout): The layout to add the control to.
+        """
+        from core.controls_controller import ControlsController
+        continuous_fit_control = QVBoxLayout()
+        continuous_fit_control.setContentsMargins(0, 0, 0, 0)
+        continuous_fit_control.setSpacing(0)
+        inp = SwitchControl(active_color=s.PALETTE_BLUE_1, width=60, height=30, checked=app.continuous_fit)
+        app.control_inputs[s.SETTINGS_CONTINUOUS_FIT] = inp
+        inp.toggled.connect(partial(ControlsController.on_continuous_fit_changed, app))
+        continuous_fit_control.addWidget(QLabel("Continuous fit:"))
+        continuous_fit_control.addSpacing(5)
+        continuous_fit_control.addWidget(inp)
+        app.control_inputs["continuous_fit_container"] = continuous_fit_control
+        (show_layout(continuous_fit_control) if app.tab_selected == s.TAB_FITTING and app.acquire_read_mode != "read" else hide_layout(continuous_fit_control))
+        layout.addLayout(continuous_fit_control)
+        layout.addSpacing(20)
+
     @staticmethod
     def _create_phasor_controls(app, layout):
         """
@@ -556,6 +586,7 @@ class UIController:
         
         UIController._create_basic_controls(app, controls_row)
         UIController._create_pileup_sbr_controls(app, controls_row)
+        UIController._create_continuous_fit_control(app, controls_row)
         UIController._create_phasor_controls(app, controls_row)
         UIController._create_calibration_controls(app, controls_row)
         
@@ -1,3 +1,4 @@
+import os
 import struct
 import matplotlib.pyplot as plt
 import numpy as np
@@ -60,23 +61,23 @@ with open(file_path, 'rb') as f:
     if "tau_ns" in metadata and metadata["tau_ns"] is not None:
         print("Tau: " + str(metadata["tau_ns"]) + "ns")   
         
-    channel_curves = [[] for _ in range(len(metadata["channels"]))]
-    times = []
+    # Each record is a float64 timestamp (ns) followed by one 256-bin uint32
+    # decay curve per enabled channel. Records are memory-mapped, a truncated
+    # trailing record is ignored.
     number_of_channels = len(metadata["channels"])
-    channel_values_unpack_string = 'I' * 256 
-    
-    while True:        
-        data = f.read(8)
-        if not data:
-            break
-        (time,) = struct.unpack('d', data)    
-        for i in range(number_of_channels):
-            data = f.read(4 * 256)  
-            if len(data) < 4 * 256:
-                break
-            curve = struct.unpack(channel_values_unpack_string, data)    
-            channel_curves[i].append(np.array(curve))
-        times.append(time / 1_000_000_000)    
+    record_dtype = np.dtype(
+        [("times", "<f8"), ("curves", "<u4", (number_of_channels, 256))]
+    )
+    data_offset = 8 + json_length
+    number_of_records = (os.path.getsize(file_path) - data_offset) // record_dtype.itemsize
+    if number_of_records <= 0:
+        print("No data found in file")
+        exit(0)
+    records = np.memmap(
+        file_path, dtype=record_dtype, mode="r", offset=data_offset, shape=(number_of_records,)
+    )
+    times = records["times"] / 1_000_000_000
+    channel_curves = [records["curves"][:, i] for i in range(number_of_channels)]
 
     # PLOTTING
     plt.xlabel(f"Time (ns, Laser period = {laser_period_ns} ns)")
@@ -91,7 +92,7 @@ with open(file_path, 'rb') as f:
     total_max = 0
     total_min = 9999999999999
     for i in range(len(channel_curves)):
-        sum_curve = np.sum(channel_curves[i], axis=0)
+        sum_curve = np.sum(channel_curves[i], axis=0, dtype=np.uint64)
         max = np.max(sum_curve)
         min = np.min(sum_curve)
         if max > total_max:
@@ -1,4 +1,8 @@
+import heapq
+import shutil
 import struct
+import tempfile
+import numpy as np
 import pandas as pd
 import os
 import json
@@ -13,107 +17,291 @@ file_path = "<FILE-PATH>"
 init(autoreset=True)  
 warnings.filterwarnings("ignore", category=FutureWarning, module="pandas")
 
-def read_time_tagger_bin(file_path, chunk_size=100000):
+# Packed 17-byte record: event type (u8), Micro Time (ns, f64), Macro Time (ns, f64)
+RECORD_DTYPE = np.dtype([("ev", "u1"), ("micro", "<f8"), ("macro", "<f8")])
+CHUNK_RECORDS = 1_000_000
+# Memory allowed for sorting the records by Macro Time when saving to Parquet
+MEMORY_BUDGET_BYTES = 512 * 1024 * 1024
+# Approximate memory needed per record while sorting and converting a chunk
+BYTES_PER_RECORD_IN_MEMORY = 80
+COLUMNS = ["Event", "Micro Time (ns)", "Macro Time (ns)"]
+
+
+def event_names_table():
     """
-    Reads data from a Time Tagger binary file (.bin) and yields data in chunks as DataFrames.
-    The .bin file consists of records with a length of 17 bytes, where 1 byte represents the event type (Channel, Pixel, Line, Frame), 
-    8 bytes represent the Micro Time (ns) value, and 8 bytes represent the Macro Time (ns) value. 
-    The first 4 bytes are magic bytes used to uniquely identify a "spectroscopy time tagger" .bin file. 
-    The .bin file also has a variable-length header containing information about the enabled channels and 
+    Builds the lookup table mapping each event code to its name.
+
+    Returns:
+        list: 256 event names, indexed by event code.
+    """
+    names = [f"ch{code + 1}" for code in range(256)]  # Channel
+    names[70] = "F"  # Frame
+    names[76] = "L"  # Line
+    names[80] = "P"  # Pixel
+    return names
+
+
+EVENT_NAMES = event_names_table()
+
+
+def read_header(file_path):
+    """
+    Reads and parses the header from the binary file.
+
+    Parameters:
+        file_path (str): Path to the .bin file.
+
+    Returns:
+        dict: Parsed header information in JSON format.
+        int: Byte offset of the first record.
+    """
+    with open(file_path, "rb") as f:
+        if f.read(4) != b"STT1":
+            print(Fore.RED + "Invalid data file")
+            exit(0)
+        header_length = struct.unpack("<I", f.read(4))[0]
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    return header, 8 + header_length
+
+
+def describe_header(header):
+    """
+    Formats the enabled channels and the laser period of the acquisition.
+
+    Parameters:
+        header (dict): Parsed header information.
+
+    Returns:
+        str: Enabled channels information.
+        str: Laser period information.
+    """
+    enabled_channels = laser_period = None
+    if "channels" in header and header["channels"] is not None:
+        enabled_channels = ", ".join(
+            ["Channel " + str(ch + 1) for ch in header["channels"]]
+        )
+    if "laser_period_ns" in header and header["laser_period_ns"] is not None:
+        laser_period = str(header["laser_period_ns"]) + "ns"
+    return enabled_channels, laser_period
+
+
+def map_time_tagger_records(file_path):
+    """
+    Memory-maps the records of a Time Tagger binary file (.bin), no data is read.
+
+    Parameters:
+        file_path (str): Path to the .bin file.
+
+    Returns:
+        np.ndarray: The records, with the RECORD_DTYPE fields.
+        dict: Parsed header information.
+    """
+    header, offset = read_header(file_path)
+    record_count = (os.path.getsize(file_path) - offset) // RECORD_DTYPE.itemsize
+    if record_count <= 0:
+        return np.zeros(0, dtype=RECORD_DTYPE), header
+    records = np.memmap(
+        file_path, dtype=RECORD_DTYPE, mode="r", offset=offset, shape=(record_count,)
+    )
+    return records, header
+
+
+def read_time_tagger_records(file_path, chunk_size=CHUNK_RECORDS):
+    """
+    Reads the records of a Time Tagger binary file (.bin) in chunks of NumPy arrays.
+    The .bin file consists of records with a length of 17 bytes, where 1 byte represents the event type (Channel, Pixel, Line, Frame),
+    8 bytes represent the Micro Time (ns) value, and 8 bytes represent the Macro Time (ns) value.
+    The first 4 bytes are magic bytes used to uniquely identify a "spectroscopy time tagger" .bin file.
+    The .bin file also has a variable-length header containing information about the enabled channels and
     the laser period of the acquisition.
 
+    The records are memory-mapped and decoded one chunk at a time, so memory use
+    is bounded by the chunk size whatever the file size.
+
     Parameters:
         file_path (str): Path to the .bin file.
-        chunk_size (int): Number of records per chunk (default is 100000).
+        chunk_size (int): Number of records per chunk (default is CHUNK_RECORDS).
 
     Yields:
-        pd.DataFrame: A DataFrame containing the data (Event, Micro Time, Macro Time) for each chunk.
+        tuple: The event codes (uint8), Micro Times and Macro Times (ns, rounded to 6 decimals) of the chunk.
         str: Enabled channels information.
         str: Laser period information.
     """
     if not os.path.exists(file_path):
         print(Fore.RED + f"File not found: {file_path}")
         return
-    record_size = 17  # 1 byte per channel, 8 bytes per micro_time (f64), 8 bytes per macro_time (f64)
+    records, header = map_time_tagger_records(file_path)
+    enabled_channels, laser_period = describe_header(header)
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start : start + chunk_size]
+        yield (
+            np.array(chunk["ev"]),
+            np.round(chunk["micro"], 6),
+            np.round(chunk["macro"], 6),
+        ), enabled_channels, laser_period
 
-    def read_header(f):
-        """
-        Reads and parses the header from the binary file.
 
-        Parameters:
-            f (file object): File object for reading the binary file.
+def read_time_tagger_bin(file_path, chunk_size=CHUNK_RECORDS):
+    """
+    Reads data from a Time Tagger binary file (.bin) and yields data in chunks as DataFrames.
+    See read_time_tagger_records for the file format.
 
-        Returns:
-            dict: Parsed header information in JSON format.
-        """
-        if f.read(4) != b"STT1":
-            print(Fore.RED + "Invalid data file")
-            exit(0)
-        header_length_bytes = f.read(4)
-        header_length = struct.unpack("<I", header_length_bytes)[0]
-        header_json = f.read(header_length).decode("utf-8")
-        header = json.loads(header_json)
-        return header
-
-    def record_generator(file_path, record_size):
-        """
-        Generator that yields records from the binary file.
-
-        Parameters:
-            file_path (str): Path to the .bin file.
-            record_size (int): Size of each record in bytes.
-
-        Yields:
-            tuple: A tuple containing the unpacked record data, enabled channels, and laser period.
-        """
-        with open(file_path, "rb") as f:
-            header = read_header(f)
-            if "channels" in header and header["channels"] is not None:
-                enabled_channels = ", ".join(
-                    ["Channel " + str(ch + 1) for ch in header["channels"]]
-                )
-            if "laser_period_ns" in header and header["laser_period_ns"] is not None:
-                laser_period = str(header["laser_period_ns"]) + "ns"
-            while True:
-                record = f.read(record_size)
-                if len(record) < record_size:
-                    break
-                yield struct.unpack("<Bdd", record), enabled_channels, laser_period
+    Parameters:
+        file_path (str): Path to the .bin file.
+        chunk_size (int): Number of records per chunk (default is CHUNK_RECORDS).
 
-    records = []
-    for i, (record, enabled_channels, laser_period) in enumerate(
-        record_generator(file_path, record_size)
+    Yields:
+        pd.DataFrame: A DataFrame containing the data (Event, Micro Time, Macro Time) for each chunk.
+        str: Enabled channels information.
+        str: Laser period information.
+    """
+    event_names = np.array(EVENT_NAMES, dtype=object)
+    for (events, micro_times, macro_times), enabled_channels, laser_period in read_time_tagger_records(
+        file_path, chunk_size
     ):
-        event, micro_time, macro_time = record
-        event_string = ""
-        if event == 70:
-            event_string = "F" # Frame
-        elif event == 76:
-            event_string = "L"  # Line
-        elif event == 80:
-            event_string = "P"  # Pixel
-        else:
-            event_string = f"ch{event + 1}" # Channel     
-        records.append((event_string, round(micro_time, 6), round(macro_time, 6)))
-
-        if (i + 1) % chunk_size == 0:
-            yield pd.DataFrame(
-                records, columns=["Event", "Micro Time (ns)", "Macro Time (ns)"]
-            ), enabled_channels, laser_period
-            records = []
-    if records:
         yield pd.DataFrame(
-            records, columns=["Event", "Micro Time (ns)", "Macro Time (ns)"]
+            {
+                COLUMNS[0]: event_names[events],
+                COLUMNS[1]: micro_times,
+                COLUMNS[2]: macro_times,
+            }
         ), enabled_channels, laser_period
 
 
-def save_to_parquet(file_path, output_file):
+def records_to_table(events, micro_times, macro_times):
     """
-    Saves the data from the binary file to a Parquet file with optional metadata.
+    Builds the Arrow table of a chunk of records.
+
+    Parameters:
+        events (np.ndarray): Event codes.
+        micro_times (np.ndarray): Micro Times (ns).
+        macro_times (np.ndarray): Macro Times (ns).
+
+    Returns:
+        pa.Table: The table with the Event, Micro Time and Macro Time columns.
+    """
+    event_column = pa.DictionaryArray.from_arrays(
+        pa.array(events.astype(np.int16)), pa.array(EVENT_NAMES)
+    ).dictionary_decode()
+    return pa.table(
+        {
+            COLUMNS[0]: event_column,
+            COLUMNS[1]: pa.array(micro_times),
+            COLUMNS[2]: pa.array(macro_times),
+        }
+    )
+
+
+def table_schema(enabled_channels, laser_period):
+    """
+    Builds the Parquet schema, with the acquisition metadata.
+
+    Parameters:
+        enabled_channels (str): Enabled channels information.
+        laser_period (str): Laser period information.
+
+    Returns:
+        pa.Schema: The schema of the output file.
+    """
+    schema = pa.schema(
+        [(COLUMNS[0], pa.string()), (COLUMNS[1], pa.float64()), (COLUMNS[2], pa.float64())]
+    )
+    metadata = {"enabled_channels": enabled_channels, "laser_period": laser_period}
+    return schema.with_metadata(
+        {k: v.encode() for k, v in metadata.items() if v is not None}
+    )
+
+
+def write_records(writer, records):
+    """
+    Writes records to a Parquet file as a row group.
+
+    Parameters:
+        writer (pq.ParquetWriter): The output file writer.
+        records (np.ndarray): The records, with the RECORD_DTYPE fields.
+    """
+    writer.write_table(
+        records_to_table(
+            np.asarray(records["ev"]),
+            np.round(records["micro"], 6),
+            np.round(records["macro"], 6),
+        )
+    )
+
+
+def is_sorted(values):
+    """
+    Parameters:
+        values (np.ndarray): 1D array.
+
+    Returns:
+        bool: Whether the values are in non-decreasing order.
+    """
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+def merge_sorted_runs(runs, block_records):
+    """
+    Merges runs of records sorted by Macro Time (k-way merge).
+
+    A block of each run is loaded at a time. A heap keeps the runs ordered by
+    the last Macro Time of their loaded block: all the loaded records up to the
+    smallest of these can be output, as the records not loaded yet come later.
+
+    Parameters:
+        runs (list): Arrays of records sorted by Macro Time (typically memory-mapped).
+        block_records (int): Number of records loaded per run.
+
+    Yields:
+        np.ndarray: The next records in Macro Time order.
+    """
+    positions = [0] * len(runs)
+    blocks = [None] * len(runs)
+    heap = []
+
+    def load_block(run_index):
+        start = positions[run_index]
+        block = np.array(runs[run_index][start : start + block_records])
+        positions[run_index] += len(block)
+        blocks[run_index] = block
+        if len(block) > 0:
+            heapq.heappush(heap, (block["macro"][-1], run_index))
+
+    for run_index in range(len(runs)):
+        load_block(run_index)
+    while heap:
+        bound = heap[0][0]
+        parts = []
+        for run_index, block in enumerate(blocks):
+            if block is None or len(block) == 0:
+                continue
+            cut = np.searchsorted(block["macro"], bound, side="right")
+            if cut > 0:
+                parts.append(block[:cut])
+                blocks[run_index] = block[cut:]
+        merged = np.concatenate(parts)
+        yield merged[np.argsort(merged["macro"], kind="stable")]
+        # The runs whose block ended at the bound are now empty
+        while heap and len(blocks[heap[0][1]]) == 0:
+            _, run_index = heapq.heappop(heap)
+            load_block(run_index)
+
+
+def save_to_parquet(file_path, output_file, memory_budget_bytes=MEMORY_BUDGET_BYTES):
+    """
+    Saves the data from the binary file to a Parquet file with optional metadata,
+    sorted by Macro Time.
+
+    The records are processed in chunks sized after the memory budget. While
+    the Macro Times are increasing, the chunks are written as they are read.
+    Otherwise the file is sorted out of core: chunks already in order are kept
+    as runs of the memory-mapped input, the others are sorted and spilled to
+    temporary files, and all the runs are then merged into the Parquet file.
 
     Parameters:
         file_path (str): Path to the .bin file.
         output_file (str): Path to the output .parquet file.
+        memory_budget_bytes (int): Approximate memory used for sorting (default is MEMORY_BUDGET_BYTES).
     """
     if not os.path.exists(file_path):
         print(Fore.RED + f"File not found: {file_path}")
@@ -126,34 +314,75 @@ def save_to_parquet(file_path, output_file):
 
     print(Fore.CYAN + f"Saving data to {output_file}...")
 
-    # Initialize variables for collecting data
-    records_list = []
-    enabled_channels = laser_period = None
-
-    # Set up an indeterminate progress bar (total=None)
-    with tqdm(
-        desc="Processing chunks...",
-        unit="chunk",
-        total=None,  # Indeterminate progress bar
-    ) as pbar:
-        # Process chunks and update the progress bar
-        for chunk, channels, period in read_time_tagger_bin(file_path):
-            records_list.append(chunk)
-            enabled_channels = channels
-            laser_period = period
-            pbar.update(1)  # Increment the progress bar for each chunk processed
-
-    # Concatenate all data and sort
-    existing_data = pd.concat(records_list, ignore_index=True)
-    existing_data.sort_values(by="Macro Time (ns)", inplace=True)
-
-    # Save the DataFrame as Parquet and add metadata (enabled_channels and laser_period)
-    table = pa.Table.from_pandas(existing_data)
-    metadata = {"enabled_channels": enabled_channels, "laser_period": laser_period}
-    table = table.replace_schema_metadata(
-        {**table.schema.metadata, **{k: v.encode() for k, v in metadata.items()}}
+    records, header = map_time_tagger_records(file_path)
+    schema = table_schema(*describe_header(header))
+    chunk_records = max(1, memory_budget_bytes // BYTES_PER_RECORD_IN_MEMORY)
+    partial_file = f"{output_file}.part"
+    spill_dir = tempfile.mkdtemp(
+        prefix="time_tagger_sort_", dir=os.path.dirname(os.path.abspath(output_file))
     )
-    pq.write_table(table, output_file, compression="snappy")
+    try:
+        runs = []
+        # [start, end) of the current run of input records in Macro Time order
+        source_run = None
+        # Written as read while the whole input is in order
+        writer = pq.ParquetWriter(partial_file, schema, compression="snappy")
+
+        # Set up an indeterminate progress bar (total=None)
+        with tqdm(
+            desc="Processing chunks...",
+            unit="chunk",
+            total=None,  # Indeterminate progress bar
+        ) as pbar:
+            for start in range(0, len(records), chunk_records):
+                end = min(start + chunk_records, len(records))
+                chunk = records[start:end]
+                macro_times = chunk["macro"]
+                if is_sorted(macro_times):
+                    if source_run is not None and macro_times[0] >= records["macro"][start - 1]:
+                        source_run[1] = end
+                    else:
+                        if source_run is not None:
+                            runs.append(records[source_run[0] : source_run[1]])
+                        source_run = [start, end]
+                else:
+                    if source_run is not None:
+                        runs.append(records[source_run[0] : source_run[1]])
+                        source_run = None
+                    spill_file = os.path.join(spill_dir, f"run_{len(runs)}.npy")
+                    np.save(spill_file, chunk[np.argsort(macro_times, kind="stable")])
+                    runs.append(np.load(spill_file, mmap_mode="r"))
+                if writer is not None and runs:
+                    # Out of order: the records will be merged instead
+                    writer.close()
+                    os.remove(partial_file)
+                    writer = None
+                if writer is not None:
+                    write_records(writer, chunk)
+                pbar.update(1)  # Increment the progress bar for each chunk processed
+
+        if writer is None:
+            if source_run is not None:
+                runs.append(records[source_run[0] : source_run[1]])
+            print(Fore.CYAN + f"Sorting data by Macro Time ({len(runs)} sorted runs)...")
+            block_records = max(1, chunk_records // len(runs))
+            writer = pq.ParquetWriter(partial_file, schema, compression="snappy")
+            pending = []
+            pending_records = 0
+            for merged in merge_sorted_runs(runs, block_records):
+                pending.append(merged)
+                pending_records += len(merged)
+                if pending_records >= chunk_records:
+                    write_records(writer, np.concatenate(pending))
+                    pending = []
+                    pending_records = 0
+            if pending:
+                write_records(writer, np.concatenate(pending))
+        writer.close()
+        os.replace(partial_file, output_file)
+    finally:
+        runs = None
+        shutil.rmtree(spill_dir, ignore_errors=True)
     print(Fore.GREEN + f"Data and metadata saved to {output_file}.")
 
 
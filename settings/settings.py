@@ -41,12 +41,15 @@ SETTINGS_CPS_THRESHOLD = "cps_threshold"
 DEFAULT_CPS_THRESHOLD = 0
 SETTINGS_SHOW_SBR = "show_SBR"
 DEFAULT_SHOW_SBR = False
+SETTINGS_CONTINUOUS_FIT = "continuous_fit"
+DEFAULT_CONTINUOUS_FIT = False
 SETTINGS_REPLICATES = "replicates"
 
 SETTINGS_CHANNEL_NAMES = "channel_names"
 DEFAULT_CHANNEL_NAMES = "{}"
 
 TIME_TAGGER_PROGRESS_BAR = "time_tagger_progress_bar"
+EXPORT_PROGRESS_BAR = "export_progress_bar"
 TIME_TAGGER_WIDGET = "time_tagger_widget"
 
 TIME_SHIFTS_NS = "time_shifts_ns"
@@ -99,6 +102,26 @@ UNICODE_SUP = {
 }
 
 REALTIME_MS = 50
+RENDER_TICK_MS = 33
+INGEST_IDLE_SLEEP_MS = 2
+# Packets received between two render ticks above which the GUI is reported as lagging
+INGEST_BACKLOG_WARNING_PACKETS = 2000
+FIT_CACHE_MAX_ENTRIES = 256
+FIT_CACHE_ON_DISK = True
+FIT_CACHE_MAX_DISK_BYTES = 64 * 1024 * 1024
+FIT_BATCH_MIN_CURVES = 16
+CONTINUOUS_FIT_INTERVAL_MS = 1000
+CONTINUOUS_FIT_FULL_SEARCH_EVERY = 10
+CONTINUOUS_FIT_MAX_NFEV = 200
+PHASORS_READ_MAX_FILES = 64
+PHASORS_LOAD_WORKERS = 4
+PHASORS_MAX_DECODED_FILES = 4
+READER_DECODE_CHUNK_BYTES = 8 * 1024 * 1024
+EXPORT_COPY_CHUNK_BYTES = 8 * 1024 * 1024
+EXPORT_DATA_WORKERS = 4
+DECODED_FILE_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+DECODED_FILE_CACHE_ON_DISK = True
+SPECTROSCOPY_SUMMARY_CHUNK_RECORDS = 65536
 REALTIME_ADJUSTMENT = REALTIME_MS * 1000
 HETERODYNE_FACTOR = 255.0 / 256.0
 DEFAULT_TICKS_LOG = [0, 1, 2, 3, 4, 5, 6]
@@ -107,6 +130,12 @@ DEFAULT_TICKS_LIN = [0, 10, 100, 1000, 10000, 100000, 1000000]
 PHASORS_RESOLUTIONS = ["16", "32", "64", "128", "256", "512"]
 SETTINGS_PHASORS_RESOLUTION = "phasors_resolution"
 DEFAULT_PHASORS_RESOLUTION = 2
+PHASORS_DENSITY_REFRESH_MS = 200
+PHASORS_LOD_CELL_PX = 1
+PHASORS_LOD_MAX_VIEW_BINS = 2048
+PHASORS_LOD_OUTSIDE_BINS = 256
+PHASORS_LOD_REFRESH_MS = 50
+PHASORS_CURSOR_REFRESH_MS = 16
 SETTINGS_QUANTIZE_PHASORS = "quantize_phasors"
 DEFAULT_QUANTIZE_PHASORS = True
 
@@ -137,7 +166,7 @@ READER_DATA = {
         "phasors_metadata": [],
         "plots": [],
         "metadata": [],
-        "data": {"phasors_data": {}, "spectroscopy_data": {}},
+        "data": {"phasors_data": [], "spectroscopy_data": {}},
     },
     "fitting": {
         "files": {"spectroscopy": "", "fitting": [], "laserblood_metadata": ""},
@@ -7,6 +7,7 @@ It also handles the application's main event loop.
 
 from functools import partial
 import json
+import multiprocessing
 import os
 import queue
 import sys
@@ -30,9 +31,11 @@ from PyQt6.QtWidgets import (
 )
 from utils.logo_utilities import OverlayWidget
 from components.read_data import (
+    ReadData,
     ReadDataControls,
 )
 from core.acquisition_controller import AcquisitionController
+from core.continuous_fit_controller import ContinuousFitController
 from core.controls_controller import ControlsController
 from core.phasors_controller import PhasorsController
 from core.plots_controller import PlotsController
@@ -128,6 +131,16 @@ class SpectroscopyWindow(QWidget):
         show_SBR = self.settings.value(s.SETTINGS_SHOW_SBR, s.DEFAULT_SHOW_SBR)
         self.show_SBR = str(show_SBR).lower() == "true"
 
+        continuous_fit = self.settings.value(
+            s.SETTINGS_CONTINUOUS_FIT, s.DEFAULT_CONTINUOUS_FIT
+        )
+        self.continuous_fit = str(continuous_fit).lower() == "true"
+        self.continuous_fit_results = {}
+        self.continuous_fit_items = {}
+        self.continuous_fit_worker = None
+        self.continuous_fit_runs = 0
+        self.continuous_fit_timer = QTimer()
+
         self.acquire_read_mode = self.settings.value(
             s.SETTINGS_ACQUIRE_READ_MODE, s.DEFAULT_ACQUIRE_READ_MODE
         )
@@ -161,6 +174,9 @@ class SpectroscopyWindow(QWidget):
         self.reader_data = s.READER_DATA
         self.update_plots_enabled = False
         self.widgets = {}
+        self.export_jobs = []
+        # Export jobs only, so closing waits for them and not for the reader decodes
+        self.export_threadpool = QThreadPool()
         self.channel_checkboxes = []
         self.sync_buttons = []
         self.control_inputs = {}
@@ -171,6 +187,16 @@ class SpectroscopyWindow(QWidget):
         self.acquisition_stopped = False
         self.intensities_widgets = {}
         self.intensity_lines = s.INTENSITY_LINES
+        self.intensity_buffers = {}
+        self.decay_log_buffers = {}
+        self.ingest_worker = None
+        self.ingest_stats = {}
+        self.phasors_files_loader = None
+        self.stopping_phasors_files_loaders = set()
+        self.phasors_loaded_files = set()
+        self.phasors_failed_files = set()
+        self.phasors_pushed_files = 0
+        self.phasors_live_plot = False
         self.phasors_charts = {}
         self.phasors_widgets = {}
         self.phasors_coords = {}
@@ -181,7 +207,11 @@ class SpectroscopyWindow(QWidget):
         self.phasors_legend_labels = {}
         self.phasors_clusters_center = {}
         self.phasors_crosshairs = {}
+        self.phasors_cursor = {"channel": None, "html": None, "refresh_pending": False}
         self.quantization_images = {}
+        self.phasors_density_rendered_at = {}
+        self.phasors_lod = {}
+        self.phasors_file_scatters = {}
         self.cps_widgets = {}
         self.cps_widgets_animation = {}
         self.cps_counts = {}
@@ -231,6 +261,9 @@ class SpectroscopyWindow(QWidget):
         self.pull_from_queue_timer.timeout.connect(
             partial(AcquisitionController.pull_from_queue, self)
         )
+        self.continuous_fit_timer.timeout.connect(
+            partial(ContinuousFitController.on_timer_tick, self)
+        )
 
         ExportData.calc_exported_file_size(self)
         ReadDataControls.handle_widgets_visibility(
@@ -261,6 +294,9 @@ class SpectroscopyWindow(QWidget):
             if popup_key in self.widgets and self.widgets[popup_key] is not None:
                 self.widgets[popup_key].close()
 
+        # Let the acquisition files being saved be written completely
+        if self.export_jobs:
+            self.export_threadpool.waitForDone()
         event.accept()
 
     def eventFilter(self, source, event):
@@ -325,9 +361,18 @@ def main():
 
     if window.pull_from_queue_timer.isActive():
         window.pull_from_queue_timer.stop()
+    AcquisitionController.stop_ingest_worker(window)
+    ContinuousFitController.stop(window)
+    if window.continuous_fit_worker is not None:
+        window.continuous_fit_worker.wait()
+    ReadData.cancel_phasors_files_loader(window)
+    for loader in list(window.stopping_phasors_files_loaders):
+        loader.wait()
 
     sys.exit(exit_code)
 
 
 if __name__ == "__main__":
+    # Required by the fitting process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
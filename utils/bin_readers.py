@@ -0,0 +1,350 @@
+import json
+import os
+import struct
+import numpy as np
+
+import settings.settings as s
+
+
+SPECTROSCOPY_MAGIC = b"SP01"
+NUM_BINS = 256
+
+
+class DecodeCancelled(Exception):
+    """Raised by a decoding progress callback to abort the decoding."""
+
+
+def read_bin_header(file_path, magic_number):
+    """Reads the magic number and JSON metadata header of a binary data file.
+
+    Args:
+        file_path (str): The path to the binary file.
+        magic_number (bytes): The expected 4-byte magic number at the start of the file.
+
+    Raises:
+        ValueError: If the file does not start with the expected magic number.
+
+    Returns:
+        tuple: (metadata, data_offset) where data_offset is the byte offset of the first record.
+    """
+    with open(file_path, "rb") as f:
+        if f.read(4) != magic_number:
+            raise ValueError(f"Invalid file: expected {magic_number!r} magic number")
+        (json_length,) = struct.unpack("I", f.read(4))
+        metadata = json.loads(f.read(json_length).decode("utf-8"))
+    return metadata, 8 + json_length
+
+
+def spectroscopy_record_dtype(number_of_channels):
+    """Builds the packed NumPy dtype of a single SP01 record.
+
+    Each record is a float64 timestamp (ns) followed by one 256-bin uint32
+    decay curve per enabled channel.
+
+    Args:
+        number_of_channels (int): The number of enabled channels in the file.
+
+    Returns:
+        np.dtype: The structured record dtype with `times` and `curves` fields.
+    """
+    return np.dtype(
+        [("times", "<f8"), ("curves", "<u4", (number_of_channels, NUM_BINS))]
+    )
+
+
+def map_records(file_path, dtype, offset):
+    """Memory-maps the fixed-size records stored after a file header.
+
+    A truncated trailing record (e.g. an acquisition interrupted mid-write)
+    is ignored, only complete records are exposed.
+
+    Args:
+        file_path (str): The path to the binary file.
+        dtype (np.dtype): The dtype of a single record.
+        offset (int): The byte offset of the first record.
+
+    Returns:
+        np.ndarray: A read-only structured view of the records (no data is copied).
+    """
+    number_of_records = max(0, os.path.getsize(file_path) - offset) // dtype.itemsize
+    if number_of_records == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(
+        file_path, dtype=dtype, mode="r", offset=offset, shape=(number_of_records,)
+    )
+
+
+def record_chunks(records):
+    """Splits records in consecutive chunks of about s.READER_DECODE_CHUNK_BYTES.
+
+    Args:
+        records (np.ndarray): The records, possibly memory-mapped.
+
+    Returns:
+        list[tuple[int, int]]: The (start, end) bounds of the chunks.
+    """
+    step = max(1, s.READER_DECODE_CHUNK_BYTES // records.dtype.itemsize)
+    return [
+        (start, min(start + step, len(records)))
+        for start in range(0, len(records), step)
+    ]
+
+
+def read_spectroscopy_records(file_path):
+    """Opens a spectroscopy (SP01) file as a memory-mapped structured array.
+
+    Args:
+        file_path (str): The path to the spectroscopy data file.
+
+    Returns:
+        tuple: (metadata, records) where records["times"] is a float64 array of
+            timestamps in ns with shape [n_records] and records["curves"] is a uint32
+            array with shape [n_records, n_channels, 256].
+    """
+    metadata, offset = read_bin_header(file_path, SPECTROSCOPY_MAGIC)
+    dtype = spectroscopy_record_dtype(len(metadata["channels"]))
+    return metadata, map_records(file_path, dtype, offset)
+
+
+class ChannelsCurves(dict):
+    """
+    The decay curves of a spectroscopy file by channel position.
+
+    A plain dict of [n_records, 256] views, which can also carry the summed
+    decay of each channel when it is already known (e.g. read from a cache),
+    see sum_channel_curves.
+    """
+
+    def __init__(self, curves, summed=None):
+        """
+        Args:
+            curves (np.ndarray): The [n_records, n_channels, 256] decay curves.
+            summed (np.ndarray, optional): The [n_channels, 256] summed curves. Defaults to None.
+        """
+        super().__init__({i: curves[:, i] for i in range(curves.shape[1])})
+        self.summed = summed
+
+
+def sum_channel_curves(channels_curves, channel):
+    """Sums the decay curves of a channel, reusing the precomputed sum if any.
+
+    Args:
+        channels_curves (dict): The channels curves, possibly a ChannelsCurves.
+        channel (int): The channel position.
+
+    Returns:
+        np.ndarray: The summed decay curve of the channel.
+    """
+    summed = getattr(channels_curves, "summed", None)
+    if summed is not None:
+        return summed[channel]
+    return np.sum(channels_curves[channel], axis=0)
+
+
+def read_spectroscopy_file(file_path):
+    """Reads a spectroscopy (SP01) file in the layout used by the read mode.
+
+    Args:
+        file_path (str): The path to the spectroscopy data file.
+
+    Returns:
+        tuple: (times, channels_curves, metadata) where times are the record
+            timestamps in seconds and channels_curves is a ChannelsCurves mapping
+            each channel position to a [n_records, 256] view of its decay curves.
+    """
+    metadata, records = read_spectroscopy_records(file_path)
+    times = records["times"] / 1_000_000_000
+    return times, ChannelsCurves(records["curves"]), metadata
+
+
+def sum_spectroscopy_curves(records, progress=None):
+    """Sums all the decay curves of a spectroscopy file channel by channel.
+
+    The records are summed chunk by chunk (see record_chunks), so a memory-mapped
+    file is read progressively.
+
+    Args:
+        records (np.ndarray): The structured records returned by read_spectroscopy_records.
+        progress (function, optional): Called after each chunk with the number of
+            records summed and the total; may raise DecodeCancelled. Defaults to None.
+
+    Returns:
+        np.ndarray: A uint64 array with shape [n_channels, 256].
+    """
+    summed = np.zeros(records.dtype["curves"].shape, dtype=np.uint64)
+    for start, end in record_chunks(records):
+        summed += records[start:end]["curves"].sum(axis=0, dtype=np.uint64)
+        if progress is not None:
+            progress(end, len(records))
+    return summed
+
+
+PHASORS_MAGIC = b"SPF1"
+PHASORS_RECORD_DTYPE = np.dtype(
+    [("t", "<u8"), ("ch", "<u4"), ("h", "<u4"), ("g", "<f8"), ("s", "<f8")]
+)
+
+
+def read_phasors_records(file_path):
+    """Opens a phasors (SPF1) file as a memory-mapped structured array.
+
+    Args:
+        file_path (str): The path to the phasors data file.
+
+    Returns:
+        tuple: (metadata, records) where records is a read-only view with the
+            `t`, `ch`, `h`, `g` and `s` fields of PHASORS_RECORD_DTYPE.
+    """
+    metadata, offset = read_bin_header(file_path, PHASORS_MAGIC)
+    return metadata, map_records(file_path, PHASORS_RECORD_DTYPE, offset)
+
+
+class PhasorsIndex:
+    """
+    Phasor points of a single file grouped by (channel, harmonic).
+
+    The records are stably sorted by (channel, harmonic) once, so the G and S
+    values of each group are contiguous float64 slices kept in acquisition order.
+    """
+
+    def __init__(self, records, file_path="", progress=None):
+        """
+        Builds the index from SPF1 records.
+
+        The records are read chunk by chunk (see record_chunks): a first pass
+        collects the (channel, harmonic) keys, a second one gathers the sorted
+        G and S values. Progress is counted in records over both passes.
+
+        Args:
+            records (np.ndarray): The structured records returned by read_phasors_records.
+            file_path (str, optional): The source file of the records. Defaults to "".
+            progress (function, optional): Called after each chunk with the number of
+                records processed and the total (twice the number of records); may
+                raise DecodeCancelled. Defaults to None.
+        """
+        self.file_path = file_path
+        self._slices = {}
+        total = len(records)
+        if total == 0:
+            self.g = np.zeros(0, dtype=np.float64)
+            self.s = np.zeros(0, dtype=np.float64)
+            return
+        chunks = record_chunks(records)
+        channels = np.empty(total, dtype=records.dtype["ch"])
+        harmonics = np.empty(total, dtype=records.dtype["h"])
+        for start, end in chunks:
+            chunk = records[start:end]
+            channels[start:end] = chunk["ch"]
+            harmonics[start:end] = chunk["h"]
+            if progress is not None:
+                progress(end, 2 * total)
+        key = channels.astype(np.int64) * (int(harmonics.max()) + 1) + harmonics
+        if key.max() <= np.iinfo(np.uint16).max:
+            # Stable sort of 16-bit keys is a linear radix sort
+            key = key.astype(np.uint16)
+        order = np.argsort(key, kind="stable")
+        g_values, s_values = records["g"], records["s"]
+        self.g = np.empty(total, dtype=np.float64)
+        self.s = np.empty(total, dtype=np.float64)
+        for start, end in chunks:
+            self.g[start:end] = g_values[order[start:end]]
+            self.s[start:end] = s_values[order[start:end]]
+            if progress is not None:
+                progress(total + end, 2 * total)
+        sorted_key = key[order]
+        boundaries = np.flatnonzero(sorted_key[1:] != sorted_key[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(sorted_key)]))
+        for start, end in zip(starts, ends):
+            first = order[start]
+            self._slices[(int(channels[first]), int(harmonics[first]))] = (
+                int(start),
+                int(end),
+            )
+
+    @classmethod
+    def from_arrays(cls, g, s, slices, file_path=""):
+        """
+        Rebuilds an index from the arrays of a previously built one.
+
+        Args:
+            g (np.ndarray): The sorted G values.
+            s (np.ndarray): The sorted S values.
+            slices (np.ndarray): A [n_groups, 4] array of (channel, harmonic, start, end).
+            file_path (str, optional): The source file of the records. Defaults to "".
+
+        Returns:
+            PhasorsIndex: The index.
+        """
+        index = cls.__new__(cls)
+        index.file_path = file_path
+        index.g = g
+        index.s = s
+        index._slices = {
+            (int(channel), int(harmonic)): (int(start), int(end))
+            for channel, harmonic, start, end in slices
+        }
+        return index
+
+    def slices_array(self):
+        """
+        Returns:
+            np.ndarray: A [n_groups, 4] int64 array of (channel, harmonic, start, end),
+                see from_arrays.
+        """
+        return np.array(
+            [(*key, *bounds) for key, bounds in self._slices.items()], dtype=np.int64
+        ).reshape(-1, 4)
+
+    def keys(self):
+        """
+        Returns:
+            list[tuple[int, int]]: The (channel, harmonic) pairs found in the file.
+        """
+        return list(self._slices.keys())
+
+    @property
+    def channels(self):
+        """
+        Returns:
+            list[int]: The sorted channels found in the file.
+        """
+        return sorted({channel for channel, _ in self._slices})
+
+    def harmonics(self, channel=None):
+        """
+        Args:
+            channel (int, optional): Restrict the result to a channel. Defaults to None.
+
+        Returns:
+            list[int]: The sorted harmonics found in the file (or in the channel).
+        """
+        return sorted(
+            {h for ch, h in self._slices if channel is None or ch == channel}
+        )
+
+    def get(self, channel, harmonic):
+        """
+        Args:
+            channel (int): The channel index.
+            harmonic (int): The harmonic number.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Contiguous G and S values of the group,
+                empty arrays if the group is not in the file.
+        """
+        start, end = self._slices.get((channel, harmonic), (0, 0))
+        return self.g[start:end], self.s[start:end]
+
+
+def read_phasors_file(file_path):
+    """Reads and indexes a phasors (SPF1) file.
+
+    Args:
+        file_path (str): The path to the phasors data file.
+
+    Returns:
+        tuple: (phasors_index, metadata) where phasors_index is a PhasorsIndex.
+    """
+    metadata, records = read_phasors_records(file_path)
+    return PhasorsIndex(records, file_path), metadata
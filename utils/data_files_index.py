@@ -0,0 +1,138 @@
+import json
+import os
+import threading
+
+
+# Bump when the index layout changes, so older indexes are rebuilt
+DATA_FILES_INDEX_VERSION = 1
+
+DATA_FILE_KINDS = ("spectroscopy", "time_tagger", "phasors")
+
+
+def data_file_kind(file_name):
+    """
+    Args:
+        file_name (str): The name of a file of the data folder.
+
+    Returns:
+        str | None: The kind of acquisition file (see DATA_FILE_KINDS), None if
+                    the file is not an acquisition file.
+    """
+    if "calibration" in file_name:
+        return None
+    if file_name.startswith("time_tagger_spectroscopy"):
+        return "time_tagger"
+    if file_name.startswith("spectroscopy-phasors"):
+        return "phasors"
+    if file_name.startswith("spectroscopy") and "phasors" not in file_name:
+        return "spectroscopy"
+    return None
+
+
+class DataFilesIndex:
+    """
+    The newest acquisition file of each kind in the data folder.
+
+    The index is saved as JSON with the modification time of the folder,
+    which changes whenever a file is added, removed or renamed: while it is
+    unchanged the index is used as is, otherwise the folder is scanned once
+    with os.scandir, which only stats the acquisition files. The output files
+    of an acquisition can also be handed off directly (see hand_off), so the
+    save after the acquisition does not scan the folder at all.
+    """
+
+    def __init__(self, folder, index_path):
+        """
+        Args:
+            folder (str): The data folder.
+            index_path (str): The JSON file where the index is kept.
+        """
+        self.folder = folder
+        self.index_path = index_path
+        self._handed_off = {}
+        self._lock = threading.Lock()
+        self._index = self._read_index()
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(index, dict)
+            or index.get("version") != DATA_FILES_INDEX_VERSION
+            or index.get("folder") != self.folder
+        ):
+            return None
+        return index
+
+    def _write_index(self):
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            temporary_path = f"{self.index_path}.tmp"
+            with open(temporary_path, "w") as f:
+                json.dump(self._index, f)
+            os.replace(temporary_path, self.index_path)
+        except OSError as e:
+            print(f"Error writing the data files index: {e}")
+
+    def _scan(self, folder_mtime_ns):
+        newest = {}
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                kind = data_file_kind(entry.name)
+                if kind is None:
+                    continue
+                try:
+                    mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if kind not in newest or mtime_ns > newest[kind][1]:
+                    newest[kind] = (entry.name, mtime_ns)
+        self._index = {
+            "version": DATA_FILES_INDEX_VERSION,
+            "folder": self.folder,
+            "folder_mtime_ns": folder_mtime_ns,
+            "newest": {kind: name for kind, (name, _) in newest.items()},
+        }
+        self._write_index()
+
+    def hand_off(self, file_paths):
+        """
+        Records the output files of the current acquisition, which are returned
+        by newest without looking at the folder. Replaces the files of the
+        previous acquisition.
+
+        Args:
+            file_paths (list[str]): The files written by the acquisition.
+        """
+        with self._lock:
+            self._handed_off = {}
+            for file_path in file_paths:
+                kind = data_file_kind(os.path.basename(file_path))
+                if kind is not None:
+                    self._handed_off[kind] = file_path
+
+    def newest(self, kind):
+        """
+        Args:
+            kind (str): The kind of acquisition file (see DATA_FILE_KINDS).
+
+        Raises:
+            FileNotFoundError: If there is no file of this kind.
+
+        Returns:
+            str: The full path to the most recent file of this kind.
+        """
+        with self._lock:
+            file_path = self._handed_off.get(kind)
+            if file_path is not None and os.path.exists(file_path):
+                return file_path
+            folder_mtime_ns = os.stat(self.folder).st_mtime_ns
+            if self._index is None or self._index["folder_mtime_ns"] != folder_mtime_ns:
+                self._scan(folder_mtime_ns)
+            file_name = self._index["newest"].get(kind)
+        if file_name is None:
+            raise FileNotFoundError(f"No suitable {kind} file found.")
+        return os.path.join(self.folder, file_name)
@@ -0,0 +1,217 @@
+import hashlib
+import os
+import shutil
+import threading
+
+import numpy as np
+
+import settings.settings as s
+from utils.bin_readers import (
+    PHASORS_MAGIC,
+    ChannelsCurves,
+    PhasorsIndex,
+    read_bin_header,
+    read_phasors_records,
+    read_spectroscopy_records,
+    sum_spectroscopy_curves,
+)
+from utils.spectroscopy_summary import read_spectroscopy_summary
+
+
+# Bump when the decoded arrays change, so stale entries are not reused
+DECODED_FILE_CACHE_VERSION = 1
+
+SPECTROSCOPY_ARRAYS = ("times", "summed_curves")
+PHASORS_ARRAYS = ("g", "s", "slices")
+
+
+def default_decoded_file_cache_folder():
+    """
+    Returns:
+        str: The decoded files cache folder, under the user .flim-labs folder.
+    """
+    home = os.environ.get("USERPROFILE", os.path.expanduser("~"))
+    return os.path.join(home, ".flim-labs", "cache", "decoded")
+
+
+class DecodedFileCache:
+    """
+    On-disk cache of the decoded content of SP01 and SPF1 files.
+
+    The first time a file is read, the arrays that are expensive to derive
+    from its records (record times and summed decay per channel for
+    spectroscopy files, G/S values grouped by (channel, harmonic) for phasors
+    files) are saved as .npy files in a folder keyed by the file path, size
+    and modification time. Reopening the file is then a stat of the file plus
+    memory-mapped np.load calls. The least recently used entries are removed
+    when the cache grows beyond max_bytes.
+    """
+
+    def __init__(self, folder, max_bytes=s.DECODED_FILE_CACHE_MAX_BYTES):
+        """
+        Args:
+            folder (str): The cache folder, None to disable the cache.
+            max_bytes (int, optional): The maximum total size of the cached arrays.
+                                       Defaults to s.DECODED_FILE_CACHE_MAX_BYTES.
+        """
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(file_path):
+        """
+        Builds the cache key of a file.
+
+        Args:
+            file_path (str): The path to the binary file.
+
+        Returns:
+            str: The hexadecimal SHA-256 key of the path, size and modification time.
+        """
+        stat = os.stat(file_path)
+        identity = f"{DECODED_FILE_CACHE_VERSION}|{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.folder, key)
+
+    def contains(self, file_path):
+        """
+        Args:
+            file_path (str): The path to the binary file.
+
+        Returns:
+            bool: Whether the decoded arrays of the current content of the file are cached.
+        """
+        if self.folder is None:
+            return False
+        try:
+            return os.path.isdir(self._entry_path(self.make_key(file_path)))
+        except OSError:
+            return False
+
+    def _load(self, file_path, names):
+        if self.folder is None:
+            return None
+        entry_path = self._entry_path(self.make_key(file_path))
+        try:
+            arrays = {
+                name: np.load(os.path.join(entry_path, f"{name}.npy"), mmap_mode="r")
+                for name in names
+            }
+            # The folder modification time orders the entries for the LRU eviction
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+        return arrays
+
+    def _store(self, file_path, arrays):
+        if self.folder is None:
+            return
+        try:
+            entry_path = self._entry_path(self.make_key(file_path))
+            temporary_path = f"{entry_path}.tmp{os.getpid()}-{threading.get_ident()}"
+            os.makedirs(temporary_path, exist_ok=True)
+            for name, values in arrays.items():
+                np.save(os.path.join(temporary_path, f"{name}.npy"), values)
+            try:
+                os.replace(temporary_path, entry_path)
+            except OSError:
+                # Already stored by another reader of the same file
+                shutil.rmtree(temporary_path, ignore_errors=True)
+            self._evict()
+        except OSError as e:
+            print(f"Error writing the decoded file cache: {e}")
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total_bytes = 0
+            for entry in os.scandir(self.folder):
+                if not entry.is_dir() or ".tmp" in entry.name:
+                    continue
+                size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                entries.append((entry.stat().st_mtime, size, entry.path))
+                total_bytes += size
+            for _, size, entry_path in sorted(entries):
+                if total_bytes <= self.max_bytes:
+                    break
+                shutil.rmtree(entry_path, ignore_errors=True)
+                total_bytes -= size
+
+    def read_spectroscopy_file(self, file_path, progress=None):
+        """
+        Reads a spectroscopy (SP01) file, see bin_readers.read_spectroscopy_file.
+
+        The summary index saved next to the file with the acquisition is used
+        when present and up to date (see spectroscopy_summary), otherwise the
+        cached arrays.
+
+        Args:
+            file_path (str): The path to the spectroscopy data file.
+            progress (function, optional): Progress callback of the decoding when
+                the file is neither summarized nor cached, see
+                bin_readers.sum_spectroscopy_curves. Defaults to None.
+
+        Returns:
+            tuple: (times, channels_curves, metadata) where channels_curves is a
+                ChannelsCurves carrying the summed decay of each channel.
+        """
+        metadata, records = read_spectroscopy_records(file_path)
+        summary = read_spectroscopy_summary(file_path)
+        if summary is not None:
+            with summary:
+                arrays = {name: summary[name] for name in SPECTROSCOPY_ARRAYS}
+        else:
+            arrays = self._load(file_path, SPECTROSCOPY_ARRAYS)
+        if arrays is None:
+            summed_curves = sum_spectroscopy_curves(records, progress)
+            arrays = {
+                "times": records["times"] / 1_000_000_000,
+                "summed_curves": summed_curves,
+            }
+            self._store(file_path, arrays)
+        channels_curves = ChannelsCurves(records["curves"], arrays["summed_curves"])
+        return arrays["times"], channels_curves, metadata
+
+    def read_phasors_file(self, file_path, progress=None):
+        """
+        Reads and indexes a phasors (SPF1) file, see bin_readers.read_phasors_file.
+
+        Args:
+            file_path (str): The path to the phasors data file.
+            progress (function, optional): Progress callback of the indexing when
+                the file is not cached, see bin_readers.PhasorsIndex. Defaults to None.
+
+        Returns:
+            tuple: (phasors_index, metadata) where phasors_index is a PhasorsIndex.
+        """
+        arrays = self._load(file_path, PHASORS_ARRAYS)
+        if arrays is not None:
+            metadata, _ = read_bin_header(file_path, PHASORS_MAGIC)
+            phasors_index = PhasorsIndex.from_arrays(
+                arrays["g"], arrays["s"], arrays["slices"], file_path
+            )
+            return phasors_index, metadata
+        metadata, records = read_phasors_records(file_path)
+        phasors_index = PhasorsIndex(records, file_path, progress)
+        self._store(
+            file_path,
+            {
+                "g": phasors_index.g,
+                "s": phasors_index.s,
+                "slices": phasors_index.slices_array(),
+            },
+        )
+        return phasors_index, metadata
+
+    def clear(self):
+        """Removes all the cached entries."""
+        if self.folder is not None:
+            shutil.rmtree(self.folder, ignore_errors=True)
+
+
+decoded_file_cache = DecodedFileCache(
+    default_decoded_file_cache_folder() if s.DECODED_FILE_CACHE_ON_DISK else None
+)
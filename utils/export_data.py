@@ -1,11 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import json
 import os
-import shutil
+import threading
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 from utils.file_utils import FileUtils
 from components.box_message import BoxMessage
 from utils.gui_styles import GUIStyles
 from utils.helpers import calc_timestamp, format_size
+from utils.spectroscopy_summary import write_spectroscopy_summary
 from export_data_scripts.script_files_utils import ScriptFileUtils
 import settings.settings as s
 
@@ -134,6 +138,8 @@ class ExportData:
 
         This includes the raw spectroscopy data, time tagger data (if applicable),
         the spectroscopy reference (if used), and associated analysis scripts.
+        Only the save dialog runs on the GUI thread: the files are written by an
+        ExportDataJob and the scripts are exported when it completes.
 
         Args:
             app: The main application instance.
@@ -141,56 +147,66 @@ class ExportData:
         try:
             timestamp = calc_timestamp()
             time_tagger = app.time_tagger
-            # Spectroscopy file (.bin)
             spectroscopy_file = FileUtils.get_recent_spectroscopy_file()
-            new_spectroscopy_file_path, save_dir, save_name = (
-                ExportData.rename_and_move_file(
-                    app,
-                    spectroscopy_file,
-                    "spectroscopy",
-                    "Save Spectroscopy files",
-                    timestamp,
-                    app,
-                )
-            )
-            if not new_spectroscopy_file_path:
+            save_dir, save_name = ExportData.ask_save_path(app, "Save Spectroscopy files")
+            if not save_dir:
                 return
-
-          # Time tagger file (.bin)
+            job = ExportDataJob()
+            # Spectroscopy file (.bin) and its summary index (.summary.npz)
+            new_spectroscopy_file_path = ExportData.export_file_path(
+                save_dir, save_name, "spectroscopy", timestamp
+            )
+            job.add_file(
+                spectroscopy_file,
+                new_spectroscopy_file_path,
+                after=ExportData.write_spectroscopy_summary,
+            )
+            # Time tagger file (.bin)
+            new_time_tagger_path = ""
             if time_tagger:
-                time_tagger_file = FileUtils.get_recent_time_tagger_file()
-                new_time_tagger_path = ExportData.copy_file(
-                    app,
-                    time_tagger_file,
-                    save_name,
-                    save_dir,
-                    "time_tagger_spectroscopy",
-                    timestamp,
+                new_time_tagger_path = ExportData.export_file_path(
+                    save_dir, save_name, "time_tagger_spectroscopy", timestamp
                 )
-            new_time_tagger_path = (
-                ""
-                if not time_tagger or not new_time_tagger_path
-                else new_time_tagger_path
-            )
-            
+                job.add_file(FileUtils.get_recent_time_tagger_file(), new_time_tagger_path)
             # Spectroscopy Calibration reference file (.json)
             if app.control_inputs["calibration"].currentIndex() == 1:
-                ExportData.save_spectroscopy_reference(app, save_name, save_dir, timestamp)
+                job.add_task(
+                    partial(ExportData.save_spectroscopy_reference, app, save_name, save_dir, timestamp)
+                )
             file_paths = {"spectroscopy": new_spectroscopy_file_path}
-            channel_names = getattr(app, 'channel_names', {})       
-            ExportData.download_scripts(
-                file_paths,
-                save_name,
-                save_dir,
-                "spectroscopy",
+            channel_names = getattr(app, 'channel_names', {})
+            ExportData.start_export_job(
                 app,
-                timestamp,
-                time_tagger=time_tagger,
-                time_tagger_file_path=new_time_tagger_path,
-                channel_names=channel_names,
+                job,
+                partial(
+                    ExportData.download_scripts,
+                    file_paths,
+                    save_name,
+                    save_dir,
+                    "spectroscopy",
+                    app,
+                    timestamp,
+                    time_tagger=time_tagger,
+                    time_tagger_file_path=new_time_tagger_path,
+                    channel_names=channel_names,
+                ),
             )
         except Exception as e:
             ScriptFileUtils.show_error_message(e)
+
+    @staticmethod
+    def write_spectroscopy_summary(file_path):
+        """
+        Writes the summary index of a saved spectroscopy file. A failure is not
+        fatal, the file is then summarized when it is read.
+
+        Args:
+            file_path (str): The saved spectroscopy file.
+        """
+        try:
+            write_spectroscopy_summary(file_path)
+        except Exception as e:
+            print(f"Error writing the spectroscopy summary: {e}")
     
 
     @staticmethod
@@ -222,7 +238,8 @@ class ExportData:
         Saves all data related to a phasors acquisition.
 
         This includes the raw phasors data, the associated spectroscopy data,
-        time tagger data (if applicable) and analysis scripts.
+        time tagger data (if applicable) and analysis scripts. The files are
+        written in the background, see save_spectroscopy_data.
 
         Args:
             app: The main application instance.
@@ -233,54 +250,118 @@ class ExportData:
             
             spectroscopy_file_ref = FileUtils.get_recent_spectroscopy_file()
             phasors_file = FileUtils.get_recent_phasors_file()
-            
+            save_dir, save_name = ExportData.ask_save_path(app, "Save Phasors Files")
+            if not save_dir:
+                return
+            job = ExportDataJob()
             # Phasors file (.bin)
-            new_phasors_file_path, save_dir, save_name = (
-                ExportData.rename_and_move_file(app, phasors_file, "phasors", "Save Phasors Files", timestamp, app)
+            new_phasors_file_path = ExportData.export_file_path(
+                save_dir, save_name, "phasors", timestamp
             )
-            if not new_phasors_file_path:
-                return
-            
+            job.add_file(phasors_file, new_phasors_file_path)
             # Spectroscopy reference file (.bin)
-            new_spectroscopy_ref_path = ExportData.copy_file(
-                app,
-                spectroscopy_file_ref, save_name, save_dir, "phasors_spectroscopy", timestamp
+            new_spectroscopy_ref_path = ExportData.export_file_path(
+                save_dir, save_name, "phasors_spectroscopy", timestamp
             )
-            
+            job.add_file(spectroscopy_file_ref, new_spectroscopy_ref_path)
             # Time Tagger file (.bin)
+            new_time_tagger_path = ""
             if time_tagger:
-                time_tagger_file = FileUtils.get_recent_time_tagger_file()
-                new_time_tagger_path = ExportData.copy_file(
-                    app,
-                    time_tagger_file, save_name, save_dir, "time_tagger_spectroscopy", timestamp
+                new_time_tagger_path = ExportData.export_file_path(
+                    save_dir, save_name, "time_tagger_spectroscopy", timestamp
                 )
-                
-            new_time_tagger_path = (
-                ""
-                if not time_tagger or not new_time_tagger_path
-                else new_time_tagger_path
-            )
+                job.add_file(FileUtils.get_recent_time_tagger_file(), new_time_tagger_path)
             
             file_paths = {
                 "spectroscopy_phasors_ref": new_spectroscopy_ref_path,
                 "phasors": new_phasors_file_path,
             }
             channel_names = getattr(app, 'channel_names', {})
-            ExportData.download_scripts(
-                file_paths,
-                save_name,
-                save_dir,
-                "phasors",
+            ExportData.start_export_job(
                 app,
-                timestamp,
-                time_tagger=time_tagger,
-                time_tagger_file_path=new_time_tagger_path,
-                channel_names=channel_names,
+                job,
+                partial(
+                    ExportData.download_scripts,
+                    file_paths,
+                    save_name,
+                    save_dir,
+                    "phasors",
+                    app,
+                    timestamp,
+                    time_tagger=time_tagger,
+                    time_tagger_file_path=new_time_tagger_path,
+                    channel_names=channel_names,
+                ),
             )
 
         except Exception as e:
             ScriptFileUtils.show_error_message(e)
 
+    @staticmethod
+    def start_export_job(app, job, on_done):
+        """
+        Runs an export job in the background, showing its progress in the main window.
+
+        Args:
+            app: The main application instance.
+            job (ExportDataJob): The files to write.
+            on_done (callable): Called on the GUI thread once all the files are written.
+        """
+        signals = job.signals
+        progress_bar = app.widgets[s.EXPORT_PROGRESS_BAR]
+        signals.progress.connect(
+            lambda written_bytes, total_bytes: progress_bar.progress_bar.setValue(
+                100 if total_bytes == 0 else int(written_bytes * 100 / total_bytes)
+            )
+        )
+        signals.finished.connect(partial(ExportData.on_export_job_finished, app, job, on_done))
+        signals.error.connect(partial(ExportData.on_export_job_error, app, job))
+        # Keep the job and its signals alive while it runs
+        app.export_jobs.append(job)
+        progress_bar.progress_bar.setValue(0)
+        progress_bar.set_visible(True)
+        app.export_threadpool.start(job)
+
+    @staticmethod
+    def on_export_job_finished(app, job, on_done, _):
+        """
+        Completes an export job on the GUI thread.
+
+        Args:
+            app: The main application instance.
+            job (ExportDataJob): The completed job.
+            on_done (callable): The completion callback, see start_export_job.
+        """
+        ExportData.remove_export_job(app, job)
+        on_done()
+
+    @staticmethod
+    def on_export_job_error(app, job, message):
+        """
+        Reports a failed export job on the GUI thread.
+
+        Args:
+            app: The main application instance.
+            job (ExportDataJob): The failed job.
+            message (str): The error message.
+        """
+        ExportData.remove_export_job(app, job)
+        ScriptFileUtils.show_error_message(message)
+
+    @staticmethod
+    def remove_export_job(app, job):
+        """
+        Forgets a completed export job and hides the progress bar when none is left.
+
+        Args:
+            app: The main application instance.
+            job (ExportDataJob): The completed job.
+        """
+        if job in app.export_jobs:
+            app.export_jobs.remove(job)
+        if not app.export_jobs:
+            app.widgets[s.EXPORT_PROGRESS_BAR].set_visible(False)
+
     @staticmethod
     def download_scripts(
         bin_file_paths,
@@ -321,6 +402,64 @@ class ExportData:
             channel_names,
         )
 
+    @staticmethod
+    def export_file_path(save_dir, save_name, file_type, timestamp, file_extension="bin"):
+        """
+        Builds the standardized path of an exported file.
+
+        Args:
+            save_dir (str): The directory to save the file in.
+            save_name (str): The base name chosen by the user.
+            file_type (str): A descriptor for the file type (e.g., 'spectroscopy').
+            timestamp (str): The timestamp for the filename.
+            file_extension (str, optional): The file extension. Defaults to "bin".
+
+        Returns:
+            str: The path of the exported file.
+        """
+        new_filename = f"{save_name}_{timestamp}_{file_type}"
+        new_filename = f"{FileUtils.clean_filename(new_filename)}.{file_extension}"
+        return os.path.join(save_dir, new_filename)
+
+    @staticmethod
+    def transfer_file(origin_file_path, new_file_path, progress=None):
+        """
+        Writes a copy of a file at a new path.
+
+        On the same filesystem the new path is a hard link to the file, which
+        takes no time whatever its size and leaves the original in place, as a
+        copy would. Otherwise, or if the filesystem does not support links, the
+        file is copied in chunks of s.EXPORT_COPY_CHUNK_BYTES.
+
+        Args:
+            origin_file_path (str): The path to the source file.
+            new_file_path (str): The path of the copy, replaced if it exists.
+            progress (callable, optional): Called with the number of bytes written by
+                                           each step. Defaults to None.
+        """
+        total_bytes = os.path.getsize(origin_file_path)
+        if os.path.exists(new_file_path):
+            if os.path.samefile(origin_file_path, new_file_path):
+                return
+            os.remove(new_file_path)
+        try:
+            os.link(origin_file_path, new_file_path)
+            if progress is not None:
+                progress(total_bytes)
+            return
+        except OSError:
+            pass
+        buffer = bytearray(s.EXPORT_COPY_CHUNK_BYTES)
+        view = memoryview(buffer)
+        with open(origin_file_path, "rb") as source, open(new_file_path, "wb") as destination:
+            while True:
+                read_bytes = source.readinto(buffer)
+                if not read_bytes:
+                    break
+                destination.write(view[:read_bytes])
+                if progress is not None:
+                    progress(read_bytes)
+
     @staticmethod
     def copy_file(app, origin_file_path, save_name, save_dir, file_type, timestamp, file_extension="bin"):
         """
@@ -338,12 +477,35 @@ class ExportData:
         Returns:
             str: The path to the newly created file.
         """
-        new_filename = f"{save_name}_{timestamp}_{file_type}"
-        new_filename = f"{FileUtils.clean_filename(new_filename)}.{file_extension}"
-        new_file_path = os.path.join(save_dir, new_filename)
-        shutil.copyfile(origin_file_path, new_file_path)
+        new_file_path = ExportData.export_file_path(
+            save_dir, save_name, file_type, timestamp, file_extension
+        )
+        ExportData.transfer_file(origin_file_path, new_file_path)
         return new_file_path
     
+    @staticmethod
+    def ask_save_path(window, file_dialog_prompt):
+        """
+        Opens a save dialog to choose the directory and base name of the exported files.
+
+        Args:
+            window: The parent window for the dialog.
+            file_dialog_prompt (str): The title for the save file dialog.
+
+        Returns:
+            tuple: The save directory (str) and base save name (str), or (None, None) if canceled.
+        """
+        dialog = QFileDialog()
+        save_path, _ = dialog.getSaveFileName(
+            window,
+            file_dialog_prompt,
+            "",
+            "All Files (*);;Binary Files (*.bin)",
+            options=QFileDialog.Option.DontUseNativeDialog,
+        )
+        if not save_path:
+            return None, None
+        return os.path.dirname(save_path), os.path.basename(save_path)
 
     @staticmethod
     def rename_and_move_file(app, original_file_path, file_type, file_dialog_prompt, timestamp, window, file_extension="bin"):
@@ -363,24 +525,14 @@ class ExportData:
             tuple: A tuple containing the new file path (str), save directory (str),
                    and base save name (str), or (None, None, None) if canceled.
         """
-        dialog = QFileDialog()
-        save_path, _ = dialog.getSaveFileName(
-            window,
-            file_dialog_prompt,
-            "",
-            "All Files (*);;Binary Files (*.bin)",
-            options=QFileDialog.Option.DontUseNativeDialog,
-        )
-        if save_path:
-            save_dir = os.path.dirname(save_path)
-            save_name = os.path.basename(save_path)
-            new_filename = f"{save_name}_{timestamp}_{file_type}"
-            new_filename = f"{FileUtils.clean_filename(new_filename)}.{file_extension}"
-            new_file_path = os.path.join(save_dir, new_filename)
-            shutil.copyfile(original_file_path, new_file_path)
-            return new_file_path, save_dir, save_name
-        else:
+        save_dir, save_name = ExportData.ask_save_path(window, file_dialog_prompt)
+        if not save_dir:
             return None, None, None
+        new_file_path = ExportData.export_file_path(
+            save_dir, save_name, file_type, timestamp, file_extension
+        )
+        ExportData.transfer_file(original_file_path, new_file_path)
+        return new_file_path, save_dir, save_name
 
         
         
@@ -414,4 +566,89 @@ class ExportData:
                 * (1000 / int(bin_width))
             )
             app.bin_file_size = format_size(file_size_MB * 1024 * 1024)
-            app.bin_file_size_label.setText("File size: " + str(app.bin_file_size))
\ No newline at end of file
+            app.bin_file_size_label.setText("File size: " + str(app.bin_file_size))
+
+
+class ExportDataSignals(QObject):
+    """
+    Qt signals for the background export of acquisition files.
+
+    Signals:
+        progress (object, object): Emitted with the bytes written and the total size
+        finished (object): Emitted with the exported file paths when all the files are written
+        error (str): Emitted when a file cannot be written
+    """
+    progress = pyqtSignal(object, object)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class ExportDataJob(QRunnable):
+    """
+    Background job writing the files of an export.
+
+    The files (and the other tasks, e.g. reference JSON files) are independent,
+    so they are written in parallel on s.EXPORT_DATA_WORKERS threads; the
+    progress is reported in bytes over all of them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = ExportDataSignals()
+        self.files = []
+        self.tasks = []
+        self._written_bytes = 0
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def add_file(self, origin_file_path, new_file_path, after=None):
+        """
+        Adds a file to write.
+
+        Args:
+            origin_file_path (str): The path to the source file.
+            new_file_path (str): The exported path.
+            after (callable, optional): Called with new_file_path once written. Defaults to None.
+        """
+        self.files.append((origin_file_path, new_file_path, after))
+
+    def add_task(self, task):
+        """
+        Adds a task to run along with the files.
+
+        Args:
+            task (callable): A function without arguments.
+        """
+        self.tasks.append(task)
+
+    def _on_written(self, written_bytes):
+        with self._lock:
+            self._written_bytes += written_bytes
+            self.signals.progress.emit(self._written_bytes, self._total_bytes)
+
+    def _write_file(self, origin_file_path, new_file_path, after):
+        ExportData.transfer_file(origin_file_path, new_file_path, progress=self._on_written)
+        if after is not None:
+            after(new_file_path)
+        return new_file_path
+
+    @pyqtSlot()
+    def run(self):
+        """Writes all the files, then emits finished, or error on the first failure."""
+        try:
+            self._total_bytes = sum(
+                os.path.getsize(origin_file_path) for origin_file_path, _, _ in self.files
+            )
+            with ThreadPoolExecutor(max_workers=s.EXPORT_DATA_WORKERS) as executor:
+                futures = [
+                    executor.submit(self._write_file, *exported_file)
+                    for exported_file in self.files
+                ]
+                futures += [executor.submit(task) for task in self.tasks]
+                for future in futures:
+                    future.result()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit([new_file_path for _, new_file_path, _ in self.files])
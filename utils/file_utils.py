@@ -2,11 +2,14 @@ import os
 import json
 import re
 from PyQt6.QtWidgets import QFileDialog
+from utils.data_files_index import DataFilesIndex
 from settings.settings import DEFAULT_BIN_WIDTH, SETTINGS_BIN_WIDTH, SETTINGS_TAU_NS
 
 
 class FileUtils:
     """A collection of utility methods for file and directory operations."""
+    _data_files_index = None
+
     @staticmethod
     def directory_selector(window):
         """Opens a dialog for the user to select a directory.
@@ -20,43 +23,62 @@ class FileUtils:
         folder_path = QFileDialog.getExistingDirectory(window, "Select Directory")
         return folder_path
 
+    @staticmethod
+    def get_data_files_index():
+        """Returns the index of the acquisition files in the default data directory.
+
+        Returns:
+            DataFilesIndex: The index, created on first use.
+        """
+        if FileUtils._data_files_index is None:
+            flim_labs_folder = os.path.join(os.environ["USERPROFILE"], ".flim-labs")
+            FileUtils._data_files_index = DataFilesIndex(
+                os.path.join(flim_labs_folder, "data"),
+                os.path.join(flim_labs_folder, "cache", "data_files_index.json"),
+            )
+        return FileUtils._data_files_index
+
+    @staticmethod
+    def hand_off_acquisition_files(data_file, time_tagger=False):
+        """Records the files written by the current acquisition, so the recent file
+        lookups return them without scanning the data directory.
+
+        Args:
+            data_file (str | None): The data file reported by the acquisition, None if unknown.
+            time_tagger (bool, optional): Whether a time tagger file is written too. Defaults to False.
+        """
+        file_paths = []
+        if data_file:
+            file_paths.append(data_file)
+            if time_tagger:
+                file_paths.append(
+                    data_file.replace("spectroscopy_", "time_tagger_spectroscopy_")
+                )
+        FileUtils.get_data_files_index().hand_off(file_paths)
+
     @staticmethod
     def get_recent_spectroscopy_file():
         """Finds the most recent spectroscopy data file in the default data directory.
 
+        Raises:
+            FileNotFoundError: If no suitable spectroscopy file is found.
+
         Returns:
             str: The full path to the most recent spectroscopy file.
         """
-        data_folder = os.path.join(os.environ["USERPROFILE"], ".flim-labs", "data")
-        files = [
-            f
-            for f in os.listdir(data_folder)
-            if f.startswith("spectroscopy")
-            and not ("calibration" in f)
-            and not ("phasors" in f)
-        ]
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
-        )
-        return os.path.join(data_folder, files[0])
+        return FileUtils.get_data_files_index().newest("spectroscopy")
 
     @staticmethod
     def get_recent_time_tagger_file():
         """Finds the most recent time tagger data file in the default data directory.
 
+        Raises:
+            FileNotFoundError: If no suitable time tagger file is found.
+
         Returns:
             str: The full path to the most recent time tagger file.
         """
-        data_folder = os.path.join(os.environ["USERPROFILE"], ".flim-labs", "data")
-        files = [
-            f
-            for f in os.listdir(data_folder)
-            if f.startswith("time_tagger_spectroscopy")
-        ]
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
-        )
-        return os.path.join(data_folder, files[0])
+        return FileUtils.get_data_files_index().newest("time_tagger")
 
     @staticmethod
     def get_recent_phasors_file():
@@ -68,18 +90,7 @@ class FileUtils:
         Returns:
             str: The full path to the most recent phasors file.
         """
-        data_folder = os.path.join(os.environ["USERPROFILE"], ".flim-labs", "data")
-        files = [
-            f
-            for f in os.listdir(data_folder)
-            if f.startswith("spectroscopy-phasors") and not ("calibration" in f)
-        ]
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
-        )
-        if not files:
-            raise FileNotFoundError("No suitable phasors file found.")
-        return os.path.join(data_folder, files[0])
+        return FileUtils.get_data_files_index().newest("phasors")
 
     @staticmethod
     def rename_bin_file(source_file, new_filename):
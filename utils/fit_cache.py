@@ -0,0 +1,243 @@
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+
+import settings.settings as s
+from utils.fitting_utilities import (
+    DEFAULT_MODEL_MAX_NFEV,
+    SOLVER_VARPRO,
+    convert_fitting_result_into_json_serializable_item,
+    convert_json_serializable_item_into_np_fitting_result,
+)
+
+
+# Bump when the fitting algorithm changes, so stale disk entries are not reused
+FIT_CACHE_VERSION = 3
+
+
+def default_fit_cache_folder():
+    """
+    Returns:
+        str: The on-disk fit cache folder, under the user .flim-labs folder.
+    """
+    home = os.environ.get("USERPROFILE", os.path.expanduser("~"))
+    return os.path.join(home, ".flim-labs", "cache", "fitting")
+
+
+class FitResultCache:
+    """
+    Content-addressed cache of decay fitting results.
+
+    Results are keyed by a hash of the fitted x/y arrays and of the settings
+    affecting the fit. An LRU-bounded in-memory tier answers repeated fits
+    within a session; an optional on-disk tier (one JSON file per result) keeps
+    them across sessions, the least recently used files being removed when it
+    grows beyond max_disk_bytes. Results with an error, and results where a
+    candidate model was cut short by the evaluation cap, are not cached.
+    """
+
+    def __init__(
+        self,
+        max_entries=s.FIT_CACHE_MAX_ENTRIES,
+        folder=None,
+        max_disk_bytes=s.FIT_CACHE_MAX_DISK_BYTES,
+    ):
+        """
+        Args:
+            max_entries (int, optional): The maximum number of results kept in memory.
+                                         Defaults to s.FIT_CACHE_MAX_ENTRIES.
+            folder (str, optional): The on-disk tier folder, None to keep results
+                                    in memory only. Defaults to None.
+            max_disk_bytes (int, optional): The maximum total size of the on-disk tier.
+                                            Defaults to s.FIT_CACHE_MAX_DISK_BYTES.
+        """
+        self.max_entries = max_entries
+        self.folder = folder
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        x_values,
+        y_values,
+        roi=None,
+        time_shift=0,
+        tau_similarity_threshold=0.01,
+        solver=SOLVER_VARPRO,
+        max_nfev=DEFAULT_MODEL_MAX_NFEV,
+        batched=False,
+    ):
+        """
+        Builds the cache key of a fit.
+
+        The vectorized fit_decay_curves and fit_decay_curve may reach different
+        local minima for the same curve, so their results are cached apart.
+
+        Args:
+            x_values (array-like): The x-axis data (time).
+            y_values (array-like): The y-axis data (counts).
+            roi (tuple, optional): The (min, max) ROI bounds, None if no ROI. Defaults to None.
+            time_shift (int, optional): The time shift of the curve. Defaults to 0.
+            tau_similarity_threshold (float, optional): See fit_decay_curve. Defaults to 0.01.
+            solver (str, optional): See fit_decay_curve. Defaults to SOLVER_VARPRO.
+            max_nfev (int, optional): See fit_decay_curve. Defaults to DEFAULT_MODEL_MAX_NFEV.
+            batched (bool, optional): Whether the curve is fitted with fit_decay_curves.
+                                      Defaults to False.
+
+        Returns:
+            str: The hexadecimal SHA-256 key.
+        """
+        digest = hashlib.sha256()
+        for values in (x_values, y_values):
+            values = np.ascontiguousarray(values, dtype=np.float64)
+            digest.update(str(values.shape).encode())
+            digest.update(values.tobytes())
+        settings = {
+            "version": FIT_CACHE_VERSION,
+            "roi": None if roi is None else [float(bound) for bound in roi],
+            "time_shift": float(time_shift),
+            "tau_similarity_threshold": float(tau_similarity_threshold),
+            "solver": solver,
+            "max_nfev": int(max_nfev),
+            "batched": bool(batched),
+        }
+        digest.update(json.dumps(settings, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _disk_path(self, key):
+        return os.path.join(self.folder, f"{key}.json")
+
+    def get(self, key):
+        """
+        Looks up a result, in memory first and then on disk.
+
+        Args:
+            key (str): The key returned by make_key.
+
+        Returns:
+            dict | None: A copy of the cached result, None on a miss.
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return copy.deepcopy(result)
+        result = self._read_from_disk(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, result)
+        return copy.deepcopy(result)
+
+    def put(self, key, result):
+        """
+        Stores a result in memory and, if enabled, on disk.
+
+        Args:
+            key (str): The key returned by make_key.
+            result (dict): The fit_decay_curve result.
+        """
+        if "error" in result:
+            return
+        model_timings = result.get("model_timings") or {}
+        if any(timing.get("status") == "truncated" for timing in model_timings.values()):
+            # Another model might have won without the evaluation cap
+            return
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._remember(key, result)
+        self._write_to_disk(key, result)
+
+    def _remember(self, key, result):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_from_disk(self, key):
+        if self.folder is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "r") as f:
+                result = convert_json_serializable_item_into_np_fitting_result(
+                    [json.load(f)]
+                )[0]
+            # The file modification time orders the entries for the LRU eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return result
+
+    def _write_to_disk(self, key, result):
+        if self.folder is None:
+            return
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            path = self._disk_path(key)
+            temporary_path = f"{path}.tmp"
+            with open(temporary_path, "w") as f:
+                json.dump(
+                    convert_fitting_result_into_json_serializable_item([result])[0], f
+                )
+            os.replace(temporary_path, path)
+            self._evict_from_disk()
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error writing the fit cache: {e}")
+
+    def _evict_from_disk(self):
+        with self._lock:
+            entries = []
+            total_bytes = 0
+            for entry in os.scandir(self.folder):
+                if not entry.name.endswith(".json"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+            for _, size, path in sorted(entries):
+                if total_bytes <= self.max_disk_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total_bytes -= size
+
+    def clear(self):
+        """Empties the in-memory tier and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns:
+            dict: The hit/miss counters and the number of results held in memory.
+        """
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+
+fit_result_cache = FitResultCache(
+    folder=default_fit_cache_folder() if s.FIT_CACHE_ON_DISK else None
+)
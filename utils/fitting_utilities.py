@@ -1,5 +1,6 @@
+import time
 import numpy as np
-from scipy.optimize import curve_fit
+from scipy.optimize import curve_fit, least_squares
 from utils.helpers import (
     convert_ndarray_to_list,
     convert_np_num_to_py_num,
@@ -92,6 +93,59 @@ model_formulas = {
     decay_model_4_with_B: "A1 * exp(-t / tau1) + A2 * exp(-t / tau2) + A3 * exp(-t / tau3) + A4 * exp(-t / tau4) + B",
 }
 
+# Decay models by increasing number of components
+DECAY_MODELS = [
+    decay_model_1_with_B,
+    decay_model_2_with_B,
+    decay_model_3_with_B,
+    decay_model_4_with_B,
+]
+
+
+def decay_model_jacobian(t, *params):
+    """Closed-form Jacobian of the multi-exponential decay models with background.
+
+    Works for any number of components, the parameters being ordered as in the
+    decay_model_N_with_B functions (A1, tau1, ..., An, taun, B).
+
+    Args:
+        t (np.ndarray): Time values.
+        *params (float): The model parameters.
+
+    Returns:
+        np.ndarray: The [len(t), len(params)] matrix of partial derivatives.
+    """
+    t = np.asarray(t, dtype=np.float64)
+    jacobian = np.empty((len(t), len(params)), dtype=np.float64)
+    for i in range((len(params) - 1) // 2):
+        amplitude, tau = params[2 * i], params[2 * i + 1]
+        exponential = np.exp(-t / tau)
+        jacobian[:, 2 * i] = exponential
+        jacobian[:, 2 * i + 1] = amplitude * exponential * t / tau**2
+    jacobian[:, -1] = 1.0
+    return jacobian
+
+
+# Solvers of fit_decay_curve: scipy curve_fit (Levenberg-Marquardt) with the
+# analytic Jacobian, or variable projection over the decay times only. Variable
+# projection reaches the same reduced chi-square several times faster on
+# 256-bin curves, so it is the default
+SOLVER_CURVE_FIT = "curve_fit"
+SOLVER_VARPRO = "varpro"
+
+# Maximum number of model evaluations of a single model fit in _find_best_fit
+DEFAULT_MODEL_MAX_NFEV = 50000
+
+# A variable projection solution is rejected as degenerate when two decay
+# times are closer than this relative distance, or when the amplitudes and
+# background cancel out (their absolute sum exceeds their sum by this ratio)
+VARPRO_MIN_TAU_SEPARATION = 1e-3
+VARPRO_MAX_AMPLITUDE_CANCELLATION = 10
+
+
+class _FitInterrupted(Exception):
+    """Raised from inside a model evaluation to abort a running curve_fit."""
+
 
 def _prepare_data(x_values, y_values):
     """Prepare and validate the data for fitting.
@@ -149,10 +203,9 @@ def _estimate_initial_parameters(t_data, y_data):
     # Estimate tau from the decay curve (time to reach 1/e of max)
     target_value = y_background + y_amplitude / np.e
     tau_estimate = 1000  # Default fallback in ns
-    for i in range(1, len(y_data)):
-        if y_data[i] <= target_value:
-            tau_estimate = t_data[i] - t_data[0]
-            break
+    below_target = np.flatnonzero(np.asarray(y_data[1:]) <= target_value)
+    if len(below_target) > 0:
+        tau_estimate = t_data[below_target[0] + 1] - t_data[0]
     
     return y_amplitude, tau_estimate, y_background
 
@@ -209,45 +262,289 @@ def _build_decay_models(y_amplitude, tau_estimate, y_background):
     ]
 
 
-def _find_best_fit(decay_models, t_data, y_data):
+def _fit_varpro(initial_guess, t_data, y_data, check_interrupted, max_nfev=DEFAULT_MODEL_MAX_NFEV):
+    """Fit a multi-exponential decay by variable projection.
+
+    For given decay times the amplitudes and the background enter the model
+    linearly, so they are solved by linear least squares and only the decay
+    times are optimized (with the Kaufman approximation of the projected
+    Jacobian).
+
+    Args:
+        initial_guess (list): The initial parameters (A1, tau1, ..., B); only the taus are used.
+        t_data (np.ndarray): Time data.
+        y_data (np.ndarray): Count data.
+        check_interrupted (function): Called at every iteration, raises to abort the fit.
+        max_nfev (int, optional): Maximum number of residual evaluations.
+            Defaults to DEFAULT_MODEL_MAX_NFEV.
+
+    Raises:
+        _FitInterrupted: "truncated" if max_nfev is reached before convergence.
+        RuntimeError: If the fit does not converge or its solution is degenerate,
+            see _is_degenerate_solution.
+
+    Returns:
+        np.ndarray: The fitted parameters, ordered as the model parameters.
+    """
+    t = np.asarray(t_data, dtype=np.float64)
+    y = np.asarray(y_data, dtype=np.float64)
+    taus0 = np.asarray(initial_guess[1:-1:2], dtype=np.float64)
+
+    def solve_linear(taus):
+        basis = np.empty((len(t), len(taus) + 1), dtype=np.float64)
+        basis[:, :-1] = np.exp(-t[:, None] / taus[None, :])
+        basis[:, -1] = 1.0
+        q, r = np.linalg.qr(basis)
+        coefficients = np.linalg.lstsq(r, q.T @ y, rcond=None)[0]
+        return basis, q, coefficients
+
+    def residuals(taus):
+        check_interrupted()
+        basis, _, coefficients = solve_linear(taus)
+        return basis @ coefficients - y
+
+    def jacobian(taus):
+        basis, q, coefficients = solve_linear(taus)
+        # d(basis @ c)/d(tau_k) at fixed c, projected on the orthogonal
+        # complement of the basis
+        derivatives = basis[:, :-1] * t[:, None] / taus[None, :] ** 2 * coefficients[None, :-1]
+        return derivatives - q @ (q.T @ derivatives)
+
+    fit = least_squares(
+        residuals,
+        taus0,
+        jac=jacobian,
+        bounds=(np.full(len(taus0), 1e-6), np.inf),
+        method="trf",
+        max_nfev=max_nfev,
+    )
+    if fit.status == 0:
+        raise _FitInterrupted("truncated")
+    if not fit.success:
+        raise RuntimeError(fit.message)
+    _, _, coefficients = solve_linear(fit.x)
+    popt = np.empty(2 * len(fit.x) + 1, dtype=np.float64)
+    popt[0:-1:2] = coefficients[:-1]
+    popt[1:-1:2] = fit.x
+    popt[-1] = coefficients[-1]
+    if _is_degenerate_solution(popt):
+        raise RuntimeError("Degenerate solution")
+    return popt
+
+
+def _is_degenerate_solution(popt):
+    """Whether fitted parameters use more components than the data supports.
+
+    With too many components, variable projection converges to decay times
+    that collide, or to huge amplitudes of opposite signs (possibly against
+    the background) cancelling each other. The chi-square of such a solution
+    is fine, but its components are meaningless.
+
+    Args:
+        popt (np.ndarray): Fitted parameters (A1, tau1, ..., B).
+
+    Returns:
+        bool: True if two decay times collide or the amplitudes cancel out.
+    """
+    taus = np.sort(popt[1:-1:2])
+    if np.any(np.diff(taus) < VARPRO_MIN_TAU_SEPARATION * taus[1:]):
+        return True
+    linear = np.append(popt[0:-1:2], popt[-1])
+    return np.sum(np.abs(linear)) > VARPRO_MAX_AMPLITUDE_CANCELLATION * max(
+        abs(np.sum(linear)), 1e-12
+    )
+
+
+def _fit_model(
+    model,
+    initial_guess,
+    t_data,
+    y_data,
+    max_nfev=DEFAULT_MODEL_MAX_NFEV,
+    stop_event=None,
+    solver=SOLVER_VARPRO,
+):
+    """Fit a single decay model, within a maximum number of model evaluations.
+
+    Args:
+        model (function): The decay model.
+        initial_guess (list): The initial parameters.
+        t_data (np.ndarray): Time data.
+        y_data (np.ndarray): Count data.
+        max_nfev (int, optional): Maximum number of model evaluations.
+            Defaults to DEFAULT_MODEL_MAX_NFEV.
+        stop_event (threading.Event, optional): Aborts the fit when set.
+        solver (str, optional): SOLVER_CURVE_FIT or SOLVER_VARPRO. Defaults to SOLVER_VARPRO.
+
+    Returns:
+        dict: The fit outcome with "status" ("ok", "failed", "truncated" when
+              max_nfev is reached, or "skipped"), "seconds" and, if successful,
+              "popt", "fitted_values" and "chi2".
+    """
+    evaluations = [0]
+
+    def check_interrupted():
+        if stop_event is not None and stop_event.is_set():
+            raise _FitInterrupted("skipped")
+
+    def guarded_model(t, *params):
+        check_interrupted()
+        evaluations[0] += 1
+        return model(t, *params)
+
+    start = time.monotonic()
+    try:
+        if solver == SOLVER_VARPRO:
+            popt = _fit_varpro(initial_guess, t_data, y_data, check_interrupted, max_nfev)
+        else:
+            try:
+                popt, pcov = curve_fit(
+                    guarded_model,
+                    t_data,
+                    y_data,
+                    p0=initial_guess,
+                    jac=decay_model_jacobian,
+                    maxfev=max_nfev,
+                )
+            except RuntimeError:
+                if evaluations[0] >= max_nfev:
+                    raise _FitInterrupted("truncated")
+                raise
+        fitted_values = model(t_data, *popt)
+
+        # Chi-square calculation
+        epsilon = 1e-10
+        chi2 = np.sum(
+            (np.array(y_data) - fitted_values) ** 2 / (fitted_values + epsilon)
+        )
+        reduced_chi2 = chi2 / (len(y_data) - len(popt))
+        return {
+            "status": "ok",
+            "seconds": time.monotonic() - start,
+            "popt": popt,
+            "fitted_values": fitted_values,
+            "chi2": reduced_chi2,
+        }
+    except _FitInterrupted as e:
+        return {"status": str(e), "seconds": time.monotonic() - start}
+    except:
+        return {"status": "failed", "seconds": time.monotonic() - start}
+
+
+def _warm_start_models(warm_start, scale_factor):
+    """Build the single decay model to try when seeded with a previous result.
+
+    Amplitudes and background are converted from the scale of the previous
+    fit to the scale of the current data; decay times are reused as they are.
+
+    Args:
+        warm_start (dict): A previous fit_decay_curve result, with "popt" and "scale_factor".
+        scale_factor (float): The scale factor of the current data.
+
+    Returns:
+        list: A single (model_function, initial_guess) tuple.
+    """
+    popt = np.array(warm_start["popt"], dtype=np.float64)
+    ratio = np.float64(warm_start["scale_factor"]) / scale_factor
+    popt[0:-1:2] *= ratio
+    popt[-1] *= ratio
+    return [(DECAY_MODELS[(len(popt) - 1) // 2 - 1], list(popt))]
+
+
+def _find_best_fit(
+    decay_models,
+    t_data,
+    y_data,
+    max_nfev=DEFAULT_MODEL_MAX_NFEV,
+    chi2_target=None,
+    solver=SOLVER_VARPRO,
+    stop_event=None,
+):
     """Try all decay models and find the best fit based on chi-square.
-    
+
+    The models are fitted one after the other, by increasing order: the fits
+    are CPU bound and hold the GIL, so threads would not run them faster, and
+    fit_decay_curve already runs in the worker processes of the FittingWorker.
+    When a model reaches `chi2_target`, the higher-order models are skipped;
+    otherwise the model with the lowest reduced chi-square wins.
+
     Args:
-        decay_models (list): List of (model, initial_guess) tuples.
+        decay_models (list): List of (model, initial_guess) tuples, by increasing order.
         t_data (np.ndarray): Time data.
         y_data (np.ndarray): Count data.
-    
+        max_nfev (int, optional): Maximum number of model evaluations of each model fit.
+            Defaults to DEFAULT_MODEL_MAX_NFEV.
+        chi2_target (float, optional): Reduced chi-square good enough to stop
+            trying higher-order models. Defaults to None.
+        solver (str, optional): SOLVER_CURVE_FIT or SOLVER_VARPRO. Defaults to SOLVER_VARPRO.
+        stop_event (threading.Event, optional): Cancels the search when set: the
+            running model fit is aborted and the next models are skipped.
+
     Returns:
-        tuple: (best_fit, best_model, best_popt, best_chi2) or (None, None, None, None)
+        tuple: (best_fit, best_model, best_popt, best_chi2, model_timings, candidates)
+            where model_timings maps the number of components of each model to its
+            status, duration and reduced chi-square, and candidates lists the
+            (model, fitted_values, popt, chi2) of every model fitted successfully,
+            by increasing order. The first four items are None if no model could
+            be fitted.
     """
-    best_chi2 = np.inf
-    best_fit = None
-    best_model = None
-    best_popt = None
-    
+    def meets_target(outcome):
+        return (
+            chi2_target is not None
+            and outcome["status"] == "ok"
+            and outcome["chi2"] <= chi2_target
+        )
+
+    outcomes = []
+    target_reached = False
     for model, initial_guess in decay_models:
-        try:
-            popt, pcov = curve_fit(
-                model, t_data, y_data, p0=initial_guess, maxfev=50000
-            )
-            fitted_values = model(t_data, *popt)
-            
-            # Chi-square calculation
-            epsilon = 1e-10
-            chi2 = np.sum(
-                (np.array(y_data) - fitted_values) ** 2 / (fitted_values + epsilon)
-            )
-            reduced_chi2 = chi2 / (len(y_data) - len(popt))
-            
-            if reduced_chi2 < best_chi2:
-                best_chi2 = reduced_chi2
-                best_fit = fitted_values
-                best_model = model
-                best_popt = popt
-        except:
+        if target_reached or (stop_event is not None and stop_event.is_set()):
+            outcomes.append({"status": "skipped", "seconds": 0.0})
             continue
-    
-    return best_fit, best_model, best_popt, best_chi2
+        outcome = _fit_model(
+            model, initial_guess, t_data, y_data, max_nfev, stop_event, solver
+        )
+        outcomes.append(outcome)
+        target_reached = meets_target(outcome)
+
+    model_timings = {}
+    for (model, _), outcome in zip(decay_models, outcomes):
+        model_timings[_model_components(model)] = {
+            "status": outcome["status"],
+            "seconds": outcome["seconds"],
+            "chi2": outcome.get("chi2"),
+        }
+
+    candidates = [
+        (model, outcome["fitted_values"], outcome["popt"], outcome["chi2"])
+        for (model, _), outcome in zip(decay_models, outcomes)
+        if outcome["status"] == "ok"
+    ]
+    on_target = [
+        candidate
+        for candidate in candidates
+        if chi2_target is not None and candidate[3] <= chi2_target
+    ]
+    if on_target:
+        best_model, best_fit, best_popt, best_chi2 = on_target[0]
+    elif candidates:
+        # First model wins on ties, as in a sequential search
+        best_model, best_fit, best_popt, best_chi2 = min(
+            candidates, key=lambda candidate: candidate[3]
+        )
+    else:
+        return None, None, None, None, model_timings, candidates
+    return best_fit, best_model, best_popt, best_chi2, model_timings, candidates
+
+
+def _model_components(model):
+    """Number of exponential components of a decay model."""
+    return {
+        decay_model_1_with_B: 1,
+        decay_model_2_with_B: 2,
+        decay_model_3_with_B: 3,
+        decay_model_4_with_B: 4,
+    }[model]
 
 
 def _identify_redundant_components(best_popt, tau_similarity_threshold):
@@ -291,7 +588,7 @@ def _identify_redundant_components(best_popt, tau_similarity_threshold):
     return has_redundant_components, unique_components
 
 
-def _refit_with_simplified_model(unique_components, t_data, y_data, y_amplitude, tau_estimate, y_background):
+def _refit_with_simplified_model(unique_components, t_data, y_data, y_amplitude, tau_estimate, y_background, solver=SOLVER_VARPRO):
     """Refit the data with a simplified model based on unique components.
     
     Args:
@@ -301,6 +598,7 @@ def _refit_with_simplified_model(unique_components, t_data, y_data, y_amplitude,
         y_amplitude (float): Estimated amplitude.
         tau_estimate (float): Estimated tau.
         y_background (float): Estimated background.
+        solver (str, optional): SOLVER_CURVE_FIT or SOLVER_VARPRO. Defaults to SOLVER_VARPRO.
     
     Returns:
         tuple: (model, best_fit, best_popt, best_chi2) or None if refit fails.
@@ -316,18 +614,10 @@ def _refit_with_simplified_model(unique_components, t_data, y_data, y_amplitude,
     
     model, initial_guess = model_map[unique_components]
     
-    try:
-        popt, pcov = curve_fit(model, t_data, y_data, p0=initial_guess, maxfev=50000)
-        best_fit = model(t_data, *popt)
-        
-        epsilon = 1e-10
-        best_chi2 = np.sum(
-            (np.array(y_data) - best_fit) ** 2 / (best_fit + epsilon)
-        ) / (len(y_data) - len(popt))
-        
-        return model, best_fit, popt, best_chi2
-    except:
+    outcome = _fit_model(model, initial_guess, t_data, y_data, solver=solver)
+    if outcome["status"] != "ok":
         return None
+    return model, outcome["fitted_values"], outcome["popt"], outcome["chi2"]
 
 
 def _generate_output_data(best_popt, best_chi2, best_model, y_data, best_fit):
@@ -380,13 +670,22 @@ def _generate_output_data(best_popt, best_chi2, best_model, y_data, best_fit):
 
 
 def fit_decay_curve(
-    x_values, y_values, channel, y_shift=0, tau_similarity_threshold=0.01
+    x_values,
+    y_values,
+    channel,
+    y_shift=0,
+    tau_similarity_threshold=0.01,
+    max_nfev=DEFAULT_MODEL_MAX_NFEV,
+    chi2_target=None,
+    solver=SOLVER_VARPRO,
+    warm_start=None,
+    stop_event=None,
 ):
     """Fits a decay curve to the provided data using multiple exponential models.
 
     It automatically selects the best model (from 1 to 4 exponential components)
     based on the reduced chi-square value. It also handles data scaling and
-    identifies the start of the decay.
+    identifies the start of the decay. See _find_best_fit for the model search.
 
     Args:
         x_values (np.ndarray): The x-axis data (time).
@@ -395,10 +694,23 @@ def fit_decay_curve(
         y_shift (int, optional): A vertical shift to apply to the data. Defaults to 0.
         tau_similarity_threshold (float, optional): The threshold for considering
             decay times (tau) as similar. Defaults to 0.01.
+        max_nfev (int, optional): Maximum number of model evaluations of each
+            candidate model. Defaults to DEFAULT_MODEL_MAX_NFEV.
+        chi2_target (float, optional): Reduced chi-square at which higher-order
+            models are not tried anymore. Defaults to None.
+        solver (str, optional): SOLVER_CURVE_FIT (Levenberg-Marquardt with analytic
+            Jacobian) or SOLVER_VARPRO (variable projection). Defaults to SOLVER_VARPRO.
+        warm_start (dict, optional): A previous result of this function for the same
+            curve (e.g. earlier in a live acquisition). Its model is refitted starting
+            from its parameters; the full model search only runs if that fails.
+            Defaults to None.
+        stop_event (threading.Event, optional): Cancels the fit when set, see
+            _find_best_fit. Defaults to None.
 
     Returns:
         dict: A dictionary containing the fitting results, including the fitted
-              parameters, R-squared, chi-squared, residuals, and the model used.
+              parameters, R-squared, chi-squared, residuals, the model used and
+              the timing of each candidate model.
               Returns a dictionary with an 'error' key if fitting fails.
     """
     # Prepare data
@@ -408,8 +720,6 @@ def fit_decay_curve(
     
     t_data = prep_result["t_data"]
     y_data = prep_result["y_data"]
-    decay_start = prep_result["decay_start"]
-    scale_factor = prep_result["scale_factor"]
     
     # Estimate initial parameters
     y_amplitude, tau_estimate, y_background = _estimate_initial_parameters(t_data, y_data)
@@ -417,12 +727,92 @@ def fit_decay_curve(
     # Build decay models with initial guesses
     decay_models = _build_decay_models(y_amplitude, tau_estimate, y_background)
     
+    best_fit = None
+    if warm_start is not None and warm_start.get("popt") is not None:
+        best_fit, best_model, best_popt, best_chi2, model_timings, candidates = _find_best_fit(
+            _warm_start_models(warm_start, prep_result["scale_factor"]),
+            t_data,
+            y_data,
+            max_nfev=max_nfev,
+            solver=solver,
+            stop_event=stop_event,
+        )
+
     # Find best fit among all models
-    best_fit, best_model, best_popt, best_chi2 = _find_best_fit(decay_models, t_data, y_data)
+    if best_fit is None:
+        best_fit, best_model, best_popt, best_chi2, model_timings, candidates = _find_best_fit(
+            decay_models,
+            t_data,
+            y_data,
+            max_nfev=max_nfev,
+            chi2_target=chi2_target,
+            solver=solver,
+            stop_event=stop_event,
+        )
     
+    if stop_event is not None and stop_event.is_set():
+        return {"error": "Fitting cancelled.", "model_timings": model_timings}
     if best_fit is None:
-        return {"error": "Optimal parameters not found for any model."}
+        return {
+            "error": "Optimal parameters not found for any model.",
+            "model_timings": model_timings,
+        }
     
+    return _finalize_fit(
+        x_values,
+        prep_result,
+        channel,
+        best_fit,
+        best_model,
+        best_popt,
+        best_chi2,
+        model_timings,
+        tau_similarity_threshold,
+        solver,
+        candidates,
+    )
+
+
+def _finalize_fit(
+    x_values,
+    prep_result,
+    channel,
+    best_fit,
+    best_model,
+    best_popt,
+    best_chi2,
+    model_timings,
+    tau_similarity_threshold,
+    solver=SOLVER_VARPRO,
+    candidates=None,
+):
+    """Simplify the best model if needed and build the fitting result dictionary.
+
+    When the best model has redundant components, it is replaced by the
+    better of the refit with fewer components and the non-redundant
+    lower-order candidates of the model search: the refit alone may land in
+    a worse minimum than a model already fitted.
+
+    Args:
+        x_values (np.ndarray): The x-axis data (time).
+        prep_result (dict): The prepared data returned by _prepare_data.
+        channel (int): The channel index associated with this data.
+        best_fit (np.ndarray): Fitted values of the best model.
+        best_model (function): The best model.
+        best_popt (np.ndarray): Fitted parameters of the best model.
+        best_chi2 (float): Reduced chi-square of the best model.
+        model_timings (dict): The status, duration and chi-square of each candidate model.
+        tau_similarity_threshold (float): The threshold for considering decay times as similar.
+        solver (str, optional): Solver of the simplified model refit. Defaults to SOLVER_VARPRO.
+        candidates (list, optional): The (model, fitted_values, popt, chi2) of the
+            models fitted successfully, see _find_best_fit. Defaults to None.
+
+    Returns:
+        dict: The fitting result, as returned by fit_decay_curve.
+    """
+    t_data = prep_result["t_data"]
+    y_data = prep_result["y_data"]
+
     # Identify redundant components
     has_redundant_components, unique_components = _identify_redundant_components(
         best_popt, tau_similarity_threshold
@@ -432,11 +822,24 @@ def fit_decay_curve(
     
     # Refit with simplified model if redundant components detected
     if has_redundant_components and unique_components < num_components:
+        y_amplitude, tau_estimate, y_background = _estimate_initial_parameters(
+            t_data, y_data
+        )
         refit_result = _refit_with_simplified_model(
-            unique_components, t_data, y_data, y_amplitude, tau_estimate, y_background
+            unique_components, t_data, y_data, y_amplitude, tau_estimate, y_background, solver
         )
-        if refit_result is not None:
-            best_model, best_fit, best_popt, best_chi2 = refit_result
+        alternatives = [] if refit_result is None else [refit_result]
+        alternatives += [
+            candidate
+            for candidate in candidates or []
+            if (len(candidate[2]) - 1) // 2 < num_components
+            and not _identify_redundant_components(candidate[2], tau_similarity_threshold)[0]
+        ]
+        if alternatives:
+            # The refit wins on ties
+            best_model, best_fit, best_popt, best_chi2 = min(
+                alternatives, key=lambda alternative: alternative[3]
+            )
     
     # Generate output data
     output_data, fitted_params_text, r2, residuals = _generate_output_data(
@@ -451,15 +854,333 @@ def fit_decay_curve(
         "residuals": residuals,
         "fitted_params_text": fitted_params_text,
         "output_data": output_data,
-        "scale_factor": scale_factor,
-        "decay_start": decay_start,
+        "scale_factor": prep_result["scale_factor"],
+        "decay_start": prep_result["decay_start"],
         "channel": channel,
         "chi2": best_chi2,
         "r2": r2,
         "model": model_formulas[best_model],
+        "model_timings": model_timings,
+        "popt": best_popt,
+    }
+
+
+def _batch_decay_model(t, params):
+    """Evaluates a multi-exponential decay model with background for many parameter sets.
+
+    Args:
+        t (np.ndarray): Time values, shape [n_bins].
+        params (np.ndarray): Parameters (A1, tau1, ..., B), shape [n_curves, n_params].
+
+    Returns:
+        tuple: (values, exponentials) with shapes [n_curves, n_bins] and
+            [n_curves, n_components, n_bins].
+    """
+    amplitudes = params[:, 0:-1:2]
+    taus = params[:, 1:-1:2]
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        exponentials = np.exp(-t[None, None, :] / taus[:, :, None])
+    values = np.einsum("nc,ncb->nb", amplitudes, exponentials) + params[:, -1:]
+    return values, exponentials
+
+
+def fit_decay_curves_batch(
+    t,
+    curves,
+    initial_params,
+    mask=None,
+    max_iterations=1000,
+    tolerance=1e-10,
+    stop_event=None,
+):
+    """Fits the same decay model to many curves at once with a vectorized Levenberg-Marquardt.
+
+    All the curves share the time axis and the number of components (given by
+    the number of initial parameters). Every iteration solves the damped normal
+    equations of all the curves with one batched linear solve, each curve
+    keeping its own damping factor; curves stop being updated once converged.
+
+    Args:
+        t (np.ndarray): Time values, shape [n_bins].
+        curves (np.ndarray): Counts, shape [n_curves, n_bins].
+        initial_params (np.ndarray): Initial parameters (A1, tau1, ..., B) of each
+            curve, shape [n_curves, n_params].
+        mask (np.ndarray, optional): Boolean [n_curves, n_bins] array of the bins
+            taking part in the fit of each curve. Defaults to None (all bins).
+        max_iterations (int, optional): Maximum number of iterations. Defaults to 1000.
+        tolerance (float, optional): Relative decrease of the sum of squared
+            residuals below which a curve is converged. Defaults to 1e-10.
+        stop_event (threading.Event, optional): Stops iterating when set, the
+            curves not converged yet being returned as such. Defaults to None.
+
+    Returns:
+        dict: "params" [n_curves, n_params], "fitted_values" [n_curves, n_bins],
+            "chi2" (reduced, over the masked bins) [n_curves], "converged" [n_curves]
+            and "iterations" [n_curves].
+    """
+    t = np.asarray(t, dtype=np.float64)
+    y = np.atleast_2d(np.asarray(curves, dtype=np.float64))
+    params = np.array(initial_params, dtype=np.float64, ndmin=2)
+    n_curves, n_params = params.shape
+    weights = (
+        np.ones_like(y) if mask is None else np.asarray(mask, dtype=np.float64)
+    )
+
+    def cost_of(values, y, weights):
+        # Diverging steps overflow: their cost is not finite and they are rejected
+        with np.errstate(over="ignore", invalid="ignore"):
+            cost = np.sum(weights * (values - y) ** 2, axis=1)
+        return np.where(np.isfinite(cost), cost, np.inf)
+
+    values, exponentials = _batch_decay_model(t, params)
+    cost = cost_of(values, y, weights)
+    damping = np.full(n_curves, 1e-3)
+    active = np.isfinite(cost)
+    converged = np.zeros(n_curves, dtype=bool)
+    iterations = np.zeros(n_curves, dtype=np.int64)
+    identity = np.eye(n_params)
+
+    for _ in range(max_iterations):
+        if not active.any() or (stop_event is not None and stop_event.is_set()):
+            break
+        index = np.flatnonzero(active)
+        p = params[index]
+        taus = p[:, 1:-1:2]
+        jacobian = np.empty((len(index), y.shape[1], n_params), dtype=np.float64)
+        jacobian[:, :, 0:-1:2] = exponentials[index].transpose(0, 2, 1)
+        jacobian[:, :, 1:-1:2] = (
+            p[:, None, 0:-1:2]
+            * exponentials[index].transpose(0, 2, 1)
+            * t[None, :, None]
+            / taus[:, None, :] ** 2
+        )
+        jacobian[:, :, -1] = 1.0
+        jacobian *= weights[index, :, None]
+        residuals = weights[index] * (values[index] - y[index])
+        jtj = np.einsum("nbp,nbq->npq", jacobian, jacobian)
+        gradient = np.einsum("nbp,nb->np", jacobian, residuals)
+        diagonal = np.maximum(np.einsum("npp->np", jtj), 1e-12)
+        system = jtj + damping[index, None, None] * diagonal[:, :, None] * identity
+        try:
+            step = np.linalg.solve(system, -gradient[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            step = np.stack(
+                [np.linalg.lstsq(a, -b, rcond=None)[0] for a, b in zip(system, gradient)]
+            )
+        candidate = p + step
+        candidate_values, candidate_exponentials = _batch_decay_model(t, candidate)
+        candidate_cost = cost_of(candidate_values, y[index], weights[index])
+        accepted = (
+            np.isfinite(candidate_cost)
+            & (candidate_cost <= cost[index])
+            & np.all(candidate[:, 1:-1:2] > 0, axis=1)
+        )
+        iterations[index] += 1
+
+        improvement = cost[index] - candidate_cost
+        small = accepted & (improvement <= tolerance * np.maximum(cost[index], 1e-300))
+        tiny_step = np.all(
+            np.abs(step) <= np.sqrt(tolerance) * (np.abs(p) + np.sqrt(tolerance)), axis=1
+        )
+        # No step decreases the cost anymore: the curve is given up, without
+        # knowing whether it sits at a minimum
+        stalled = ~accepted & (damping[index] > 1e12)
+
+        accepted_index = index[accepted]
+        params[accepted_index] = candidate[accepted]
+        values[accepted_index] = candidate_values[accepted]
+        exponentials[accepted_index] = candidate_exponentials[accepted]
+        cost[accepted_index] = candidate_cost[accepted]
+        damping[index] = np.where(
+            accepted, np.maximum(damping[index] / 10, 1e-12), damping[index] * 10
+        )
+
+        done = small | (accepted & tiny_step)
+        converged[index[done]] = True
+        active[index[done | stalled]] = False
+
+    epsilon = 1e-10
+    n_points = weights.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi2 = np.sum(weights * (y - values) ** 2 / (values + epsilon), axis=1) / (
+            n_points - n_params
+        )
+    return {
+        "params": params,
+        "fitted_values": values,
+        "chi2": chi2,
+        "converged": converged,
+        "iterations": iterations,
     }
 
 
+
+def fit_decay_curves(
+    x_values,
+    curves,
+    channels,
+    tau_similarity_threshold=0.01,
+    chi2_target=None,
+    stop_event=None,
+):
+    """Fits many decay curves sharing the same time axis.
+
+    Returns the same results as calling fit_decay_curve on every curve, up to
+    the local minimum reached by each model (degenerate solutions are rejected
+    and the best model is simplified the same way), but each candidate model is
+    fitted to all the curves at once with fit_decay_curves_batch instead of
+    one fit per curve and model. Curves no model converged for are fitted with
+    fit_decay_curve. The vectorized fit only pays off from about 16 curves
+    (see settings.FIT_BATCH_MIN_CURVES): below, fitting the curves one by one
+    with fit_decay_curve is as fast.
+
+    Args:
+        x_values (np.ndarray): The x-axis data (time) shared by all the curves.
+        curves (np.ndarray): The y-axis data (counts), shape [n_curves, len(x_values)].
+        channels (list): The channel index associated with each curve.
+        tau_similarity_threshold (float, optional): The threshold for considering
+            decay times (tau) as similar. Defaults to 0.01.
+        chi2_target (float, optional): Reduced chi-square at which the lowest-order
+            model reaching it is kept. Defaults to None.
+        stop_event (threading.Event, optional): Cancels the fit when set: every
+            curve not fitted yet gets an error result. Defaults to None.
+
+    Returns:
+        list: One fit_decay_curve result dictionary per curve, in input order.
+    """
+    x_values = np.asarray(x_values)
+    curves = np.atleast_2d(np.asarray(curves))
+    results = [None] * len(curves)
+    prepared = []
+    for index, y_values in enumerate(curves):
+        prep_result = _prepare_data(x_values, y_values)
+        if "error" in prep_result:
+            results[index] = prep_result
+            continue
+        prep_result["index"] = index
+        prep_result["initial_estimate"] = _estimate_initial_parameters(
+            prep_result["t_data"], prep_result["y_data"]
+        )
+        prepared.append(prep_result)
+    if not prepared:
+        return results
+
+    # The fit of a curve starts at its own decay_start: the bins before are masked
+    t = np.asarray(x_values, dtype=np.float64)
+    y = np.zeros((len(prepared), len(t)), dtype=np.float64)
+    mask = np.zeros((len(prepared), len(t)), dtype=bool)
+    for row, prep_result in enumerate(prepared):
+        start = prep_result["decay_start"]
+        end = start + len(prep_result["y_data"])
+        y[row, start:end] = prep_result["y_data"]
+        mask[row, start:end] = True
+
+    outcomes = []
+    for order, model in enumerate(DECAY_MODELS):
+        initial_params = np.array(
+            [
+                _build_decay_models(*prep_result["initial_estimate"])[order][1]
+                for prep_result in prepared
+            ],
+            dtype=np.float64,
+        )
+        start_time = time.monotonic()
+        batch = fit_decay_curves_batch(t, y, initial_params, mask=mask, stop_event=stop_event)
+        batch["seconds"] = (time.monotonic() - start_time) / len(prepared)
+        outcomes.append((model, batch))
+        if stop_event is not None and stop_event.is_set():
+            for prep_result in prepared:
+                results[prep_result["index"]] = {"error": "Fitting cancelled."}
+            return results
+
+    for row, prep_result in enumerate(prepared):
+        index = prep_result["index"]
+        model_timings = {}
+        candidates = []
+        for model, batch in outcomes:
+            # Degenerate solutions are rejected as in the single-curve fit
+            ok = (
+                bool(batch["converged"][row])
+                and np.isfinite(batch["chi2"][row])
+                and not _is_degenerate_solution(batch["params"][row])
+            )
+            chi2 = float(batch["chi2"][row]) if ok else None
+            model_timings[_model_components(model)] = {
+                "status": "ok" if ok else "failed",
+                "seconds": batch["seconds"],
+                "chi2": chi2,
+            }
+            if ok:
+                start = prep_result["decay_start"]
+                candidates.append(
+                    (
+                        model,
+                        batch["fitted_values"][row, start : start + len(prep_result["y_data"])],
+                        batch["params"][row],
+                        chi2,
+                    )
+                )
+        if not candidates:
+            results[index] = fit_decay_curve(
+                x_values,
+                curves[index],
+                channels[index],
+                tau_similarity_threshold=tau_similarity_threshold,
+                chi2_target=chi2_target,
+                stop_event=stop_event,
+            )
+            continue
+        on_target = [
+            candidate
+            for candidate in candidates
+            if chi2_target is not None and candidate[3] <= chi2_target
+        ]
+        best_model, best_fit, best_popt, best_chi2 = (
+            on_target[0] if on_target else min(candidates, key=lambda c: c[3])
+        )
+        results[index] = _finalize_fit(
+            x_values,
+            prep_result,
+            channels[index],
+            best_fit,
+            best_model,
+            best_popt,
+            best_chi2,
+            model_timings,
+            tau_similarity_threshold,
+            candidates=candidates,
+        )
+    return results
+
+
+# Cancellation event of the jobs of the current process, when it is a worker
+# of a fitting process pool (see init_fitting_process)
+_process_stop_event = None
+
+
+def init_fitting_process(stop_event):
+    """Initializer of the fitting process pool workers.
+
+    A multiprocessing.Event can only reach a worker process when the process
+    is created, so it is handed over here instead of with every job.
+
+    Args:
+        stop_event (multiprocessing.Event): Cancels the running jobs when set.
+    """
+    global _process_stop_event
+    _process_stop_event = stop_event
+
+
+def fit_decay_curve_job(*args, **kwargs):
+    """fit_decay_curve in a fitting pool worker, cancelled by the pool stop event."""
+    return fit_decay_curve(*args, stop_event=_process_stop_event, **kwargs)
+
+
+def fit_decay_curves_job(*args, **kwargs):
+    """fit_decay_curves in a fitting pool worker, cancelled by the pool stop event."""
+    return fit_decay_curves(*args, stop_event=_process_stop_event, **kwargs)
+
+
 def convert_fitting_result_into_json_serializable_item(results):
     """Converts a list of fitting result dictionaries into a JSON-serializable format.
 
@@ -485,7 +1206,10 @@ def convert_fitting_result_into_json_serializable_item(results):
             "decay_start": convert_np_num_to_py_num(result.get("decay_start")),
             "channel": result.get("channel"),
             "chi2": convert_np_num_to_py_num(result.get("chi2")),
+            "r2": convert_np_num_to_py_num(result.get("r2")),
             "model": result.get("model"),
+            "model_timings": convert_np_num_to_py_num(result.get("model_timings")),
+            "popt": convert_ndarray_to_list(result.get("popt")),
         }
         parsed_results.append(parsed_result)
     return parsed_results
@@ -515,6 +1239,11 @@ def convert_json_serializable_item_into_np_fitting_result(parsed_results):
             "channel": parsed_result.get("channel"),
             "chi2": np.float64(parsed_result.get("chi2")),
             "model": parsed_result.get("model"),
+            "model_timings": parsed_result.get("model_timings"),
         }
+        if parsed_result.get("r2") is not None:
+            result["r2"] = np.float64(parsed_result["r2"])
+        if parsed_result.get("popt") is not None:
+            result["popt"] = np.array(parsed_result["popt"], dtype=np.float64)
         results.append(result)
     return results
@@ -1,10 +1,15 @@
-import json
-import struct
 import os
 import matplotlib.pyplot as plt
 import numpy as np
 
 from utils.helpers import ns_to_mhz
+from utils.bin_readers import (
+    PhasorsIndex,
+    read_bin_header,
+    read_phasors_records,
+    read_spectroscopy_records,
+    sum_spectroscopy_curves,
+)
 from utils.channel_name_utils import get_channel_name
 
 
@@ -18,11 +23,7 @@ def extract_metadata(file_path, magic_number):
     Returns:
         dict: The parsed metadata from the file header.
     """
-    with open(file_path, "rb") as f:
-        assert f.read(4) == magic_number
-        header_length = int.from_bytes(f.read(4), byteorder="little")
-        header = f.read(header_length)
-        metadata = json.loads(header)
+    metadata, _ = read_bin_header(file_path, magic_number)
     return metadata
 
 
@@ -37,24 +38,11 @@ def load_data(file_path, selected_channels):
     Returns:
         dict: A dictionary where keys are channel indices and values are the summed decay curves.
     """
-    data = {}
-    with open(file_path, "rb") as f:
-        assert f.read(4) == b"SP01"
-        header_length = int.from_bytes(f.read(4), byteorder="little")
-        header = f.read(header_length)
-        metadata = json.loads(header)
-        selected_channels = metadata["channels"]
-        while True:
-            time_ns = f.read(8)
-            if not time_ns:
-                break
-            for channel in selected_channels:
-                current_curve = [
-                    int.from_bytes(f.read(4), byteorder="little") for _ in range(256)
-                ]
-                data[channel] = data.get(channel, [0 for _ in range(256)])
-                data[channel] = [sum(x) for x in zip(data[channel], current_curve)]
-    return data
+    metadata, records = read_spectroscopy_records(file_path)
+    summed_curves = sum_spectroscopy_curves(records)
+    return {
+        channel: summed_curves[i] for i, channel in enumerate(metadata["channels"])
+    }
 
 
 def load_phasors(file_path, selected_channels):
@@ -65,37 +53,17 @@ def load_phasors(file_path, selected_channels):
         selected_channels (list): A list of channel indices to load data for.
 
     Returns:
-        dict: A nested dictionary of phasor data: {channel: {harmonic: [(g, s), ...]}}.
+        dict: A nested dictionary of phasor data: {channel: {harmonic: (g_values, s_values)}}.
     """
-    data = {}
-    with open(file_path, "rb") as f:
-        assert f.read(4) == b"SPF1"
-        header_length = int.from_bytes(f.read(4), byteorder="little")
-        header = f.read(header_length)
-        metadata = json.loads(header)
-        while True:
-            for channel in selected_channels:
-                if channel not in data:
-                    data[channel] = {}
-
-                for harmonic in range(1, metadata["harmonics"] + 1):
-                    if harmonic not in data[channel]:
-                        data[channel][harmonic] = []
-
-                    bytes_read = f.read(32)
-                    if not bytes_read:
-                        return data  # Exit the function if no more data
-
-                    # Unpack the read bytes
-                    try:
-                        time_ns, channel_name, harmonic_name, g, s = struct.unpack(
-                            "QIIdd", bytes_read
-                        )
-                    except struct.error as e:
-                        return data
-
-                    data[channel][harmonic].append((g, s))
-    return data
+    metadata, records = read_phasors_records(file_path)
+    index = PhasorsIndex(records, file_path)
+    return {
+        channel: {
+            harmonic: index.get(channel, harmonic)
+            for harmonic in range(1, metadata["harmonics"] + 1)
+        }
+        for channel in selected_channels
+    }
 
 
 def plot_phasors(data):
@@ -122,12 +90,9 @@ def plot_phasors(data):
         ax.plot(x, y, label=f"Channel: {channel}")
 
         for harmonic, values in harmonics.items():
-            if values:  # Ensure there are values to plot
-                g_values, s_values = zip(*values)
-
+            g_values, s_values = values
+            if len(g_values) > 0:  # Ensure there are values to plot
                 # Filter out extreme values to prevent overflow
-                g_values = np.array(g_values)
-                s_values = np.array(s_values)
                 mask = (np.abs(g_values) < 1e9) & (np.abs(s_values) < 1e9)
                 g_values = g_values[mask]
                 s_values = s_values[mask]
@@ -276,21 +241,10 @@ def plot_phasors_data(
             if selected_harmonic is not None and harmonic != selected_harmonic:
                 continue  # Skip non-selected harmonics
             if values:
-                # values can be (g, s) or (g, s, file_name)
-                entries = []
-                for v in values:
-                    try:
-                        g_val = v[0]
-                        s_val = v[1]
-                        file_val = v[2] if len(v) > 2 else None
-                    except Exception:
-                        # unexpected shape, skip
-                        continue
-                    entries.append((g_val, s_val, file_val))
-
+                # values is a list of (file_name, g_values, s_values) entries, one per file
                 # group points by file name (basename). Use a fallback key for points without file info
                 groups = {}
-                for g_val, s_val, f_val in entries:
+                for f_val, g_val, s_val in values:
                     key = os.path.basename(str(f_val)) if f_val else "__combined__"
                     groups.setdefault(key, []).append((g_val, s_val))
 
@@ -305,22 +259,17 @@ def plot_phasors_data(
                 except Exception:
                     color_map = plt.cm.tab10(np.linspace(0, 1, max(1, len(groups))))
 
-                # collect all g/s for computing overall mean and per-group means
-                all_g = []
-                all_s = []
                 mean_handles = []
                 mean_labels = []
                 from matplotlib.lines import Line2D
                 for idx, (fname, pts) in enumerate(groups.items()):
-                    g_vals = np.array([p[0] for p in pts])
-                    s_vals = np.array([p[1] for p in pts])
+                    g_vals = np.concatenate([g for g, _ in pts])
+                    s_vals = np.concatenate([s for _, s in pts])
                     mask = (np.abs(g_vals) < 1e9) & (np.abs(s_vals) < 1e9)
                     g_vals = g_vals[mask]
                     s_vals = s_vals[mask]
                     if g_vals.size == 0:
                         continue
-                    all_g.extend(g_vals.tolist())
-                    all_s.extend(s_vals.tolist())
                     if fname == "__combined__":
                         label = f"Harmonic: {harmonic}"
                         color = "#00FFFF"
@@ -444,7 +393,7 @@ def plot_phasors_data(
                 if isinstance(ch_curves, (list, np.ndarray)):
                     total_curves += len(ch_curves)
             
-            time_s = round(times[-1], 2) if times and len(times) > 0 else 0
+            time_s = round(times[-1], 2) if times is not None and len(times) > 0 else 0
             
             # Format file name with metadata
             if time_s > 0 or total_curves > 0:
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+import threading
+
+import settings.settings as s
+from utils.bin_readers import PHASORS_MAGIC, read_bin_header
+from utils.decoded_file_cache import decoded_file_cache
+
+
+class PhasorsDataset:
+    """
+    Any number of phasors (SPF1) files, decoded lazily.
+
+    Opening the dataset only reads the JSON headers. A file is decoded into a
+    PhasorsIndex the first time it is requested (`load`), possibly from a
+    worker thread. At most `max_decoded` decoded files are kept: the least
+    recently used ones that are not pinned are evicted and decoded again if
+    requested later. A file loaded with `pin=True` stays decoded until it is
+    released.
+
+    Iterating the dataset yields the PhasorsIndex of every file in order, so
+    it can be used wherever a list of PhasorsIndex is expected.
+    """
+
+    def __init__(self, file_paths, max_decoded=s.PHASORS_MAX_DECODED_FILES):
+        """
+        Args:
+            file_paths (list[str]): The phasors files.
+            max_decoded (int, optional): The number of decoded files kept in memory.
+                                         Defaults to s.PHASORS_MAX_DECODED_FILES.
+
+        Raises:
+            ValueError: If a file is not a valid phasors file.
+        """
+        self.file_paths = list(file_paths)
+        self.max_decoded = max(1, int(max_decoded))
+        self.metadata = [
+            read_bin_header(file_path, PHASORS_MAGIC)[0] for file_path in self.file_paths
+        ]
+        self._decoded = OrderedDict()
+        self._pinned = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.file_paths)
+
+    def __iter__(self):
+        for file_index in range(len(self.file_paths)):
+            yield self.load(file_index)
+
+    def __getitem__(self, file_index):
+        return self.load(file_index)
+
+    def load(self, file_index, pin=False):
+        """
+        Returns the decoded content of a file, decoding it if needed.
+
+        Args:
+            file_index (int): The index of the file in file_paths.
+            pin (bool, optional): Whether to keep the file decoded until it is
+                                  released. Defaults to False.
+
+        Returns:
+            PhasorsIndex: The phasor points of the file.
+        """
+        with self._lock:
+            phasors_index = self._decoded.get(file_index)
+            if phasors_index is not None:
+                self._decoded.move_to_end(file_index)
+                if pin:
+                    self._pinned.add(file_index)
+                return phasors_index
+        phasors_index, _ = decoded_file_cache.read_phasors_file(
+            self.file_paths[file_index]
+        )
+        with self._lock:
+            self._decoded[file_index] = phasors_index
+            if pin:
+                self._pinned.add(file_index)
+            self._evict()
+        return phasors_index
+
+    def release(self, file_indexes):
+        """
+        Unpins files and drops their decoded content.
+
+        Called once the points of the files have been copied elsewhere (the
+        plotted PhasorPointStore), so the dataset does not hold a second copy.
+
+        Args:
+            file_indexes (iterable[int]): The indexes of the files to release.
+        """
+        with self._lock:
+            for file_index in file_indexes:
+                self._pinned.discard(file_index)
+                self._decoded.pop(file_index, None)
+
+    def pinned_count(self):
+        """
+        Returns:
+            int: The number of files pinned decoded and not released yet.
+        """
+        with self._lock:
+            return len(self._pinned)
+
+    def _evict(self):
+        for file_index in list(self._decoded.keys()):
+            if len(self._decoded) <= self.max_decoded:
+                break
+            if file_index not in self._pinned:
+                del self._decoded[file_index]
+
+    def decoded_indexes(self):
+        """
+        Returns:
+            list[int]: The indexes of the files currently held decoded in memory.
+        """
+        with self._lock:
+            return list(self._decoded.keys())
@@ -0,0 +1,106 @@
+import numpy as np
+
+import settings.settings as s
+
+
+class PhasorLODLayer:
+    """
+    View-dependent decimation of the phasor points of one plot.
+
+    The points inside the view are binned on a grid of screen-pixel-sized
+    cells (s.PHASORS_LOD_CELL_PX pixels) and only the first point of each cell
+    is rendered: as the points are drawn as single pixels, the rendering looks
+    the same, but the number of rendered points is bounded by the number of
+    pixels instead of growing with the acquisition. Zooming in shrinks the
+    cells, down to full resolution. The points outside the view are kept on a
+    coarse s.PHASORS_LOD_OUTSIDE_BINS grid over the phasor domain, so the plot
+    auto-range still sees them.
+
+    The occupied cells are remembered, so a batch of new points is decimated in
+    O(batch) and its selected points can be appended to the plot item; the whole
+    store is only scanned again when the view changes (see set_view).
+    """
+
+    LIMIT = 2.0
+
+    def __init__(self):
+        self.store = None
+        self.consumed = 0
+        self.has_view = False
+        self.refresh_pending = False
+        self._occupied = None
+
+    def set_view(self, x_range, y_range, pixel_size):
+        """
+        Sets the visible area and forgets the rendered points.
+
+        Args:
+            x_range (tuple[float, float]): The visible G range.
+            y_range (tuple[float, float]): The visible S range.
+            pixel_size (tuple[float, float]): The size of a screen pixel in data units.
+        """
+        self.x0, x1 = float(x_range[0]), float(x_range[1])
+        self.y0, y1 = float(y_range[0]), float(y_range[1])
+        width = max(x1 - self.x0, 1e-12)
+        height = max(y1 - self.y0, 1e-12)
+        self.x1, self.y1 = self.x0 + width, self.y0 + height
+        cell_w = max(float(pixel_size[0]) * s.PHASORS_LOD_CELL_PX, width / s.PHASORS_LOD_MAX_VIEW_BINS)
+        cell_h = max(float(pixel_size[1]) * s.PHASORS_LOD_CELL_PX, height / s.PHASORS_LOD_MAX_VIEW_BINS)
+        self.columns = int(np.ceil(width / cell_w))
+        self.rows = int(np.ceil(height / cell_h))
+        self.cell_w, self.cell_h = width / self.columns, height / self.rows
+        outside_cells = s.PHASORS_LOD_OUTSIDE_BINS * s.PHASORS_LOD_OUTSIDE_BINS
+        self._occupied = np.zeros(self.columns * self.rows + outside_cells, dtype=bool)
+        self.consumed = 0
+        self.has_view = True
+
+    def needs_rebuild(self, store):
+        """
+        Args:
+            store (PhasorPointStore): The points to render.
+
+        Returns:
+            bool: Whether the rendered points must be recomputed from the whole store
+                  (no view yet, another store, or the store was cleared).
+        """
+        return not self.has_view or store is not self.store or len(store) < self.consumed
+
+    def select(self, g, s_values):
+        """
+        Decimates a batch of points against the cells already rendered.
+
+        Args:
+            g (np.ndarray): The G values of the batch.
+            s_values (np.ndarray): The S values of the batch.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The G and S values of the points to add to the plot.
+        """
+        limit = self.LIMIT
+        in_view = (g >= self.x0) & (g < self.x1) & (s_values >= self.y0) & (s_values < self.y1)
+        in_domain = (g >= -limit) & (g < limit) & (s_values >= -limit) & (s_values < limit)
+        outside = in_domain & ~in_view
+        cells = np.full(len(g), -1, dtype=np.int64)
+        columns = ((g[in_view] - self.x0) / self.cell_w).astype(np.int64)
+        rows = ((s_values[in_view] - self.y0) / self.cell_h).astype(np.int64)
+        cells[in_view] = np.minimum(rows, self.rows - 1) * self.columns + np.minimum(
+            columns, self.columns - 1
+        )
+        bins = s.PHASORS_LOD_OUTSIDE_BINS
+        scale = bins / (2 * limit)
+        outside_columns = ((g[outside] + limit) * scale).astype(np.int64)
+        outside_rows = ((s_values[outside] + limit) * scale).astype(np.int64)
+        cells[outside] = self.columns * self.rows + outside_rows * bins + outside_columns
+        candidates = np.flatnonzero(cells >= 0)
+        unique_cells, first = np.unique(cells[candidates], return_index=True)
+        new = ~self._occupied[unique_cells]
+        self._occupied[unique_cells[new]] = True
+        selected = np.sort(candidates[first[new]])
+        return g[selected], s_values[selected]
+
+    def rendered_cells(self):
+        """
+        Returns:
+            int: The number of points currently rendered.
+        """
+        return 0 if self._occupied is None else int(np.count_nonzero(self._occupied))
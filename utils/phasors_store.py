@@ -0,0 +1,307 @@
+import numpy as np
+
+
+class PhasorDensityGrid:
+    """
+    Accumulating 2D histogram of phasor points.
+
+    The grid has `bins * 4` bins per axis over [-2, 2]², the same binning as
+    `np.histogram2d(g, s, bins=bins * 4, range=[[-2, 2], [-2, 2]])`, but it is
+    updated batch by batch so each update costs O(batch).
+    """
+
+    LIMIT = 2.0
+
+    def __init__(self, bins):
+        """
+        Args:
+            bins (int): The phasors resolution (see settings.PHASORS_RESOLUTIONS).
+        """
+        self.bins = int(bins)
+        self.size = self.bins * 4
+        self.counts = np.zeros((self.size, self.size), dtype=np.int64)
+
+    def add(self, g, s):
+        """
+        Adds a batch of points to the grid. NaN and out of range points are ignored.
+
+        Args:
+            g (np.ndarray): The G values of the batch.
+            s (np.ndarray): The S values of the batch.
+        """
+        limit = self.LIMIT
+        inside = (g >= -limit) & (g <= limit) & (s >= -limit) & (s <= limit)
+        if not inside.any():
+            return
+        scale = self.size / (2 * limit)
+        # The right edge belongs to the last bin, as in np.histogram2d
+        gi = np.minimum(((g[inside] + limit) * scale).astype(np.intp), self.size - 1)
+        si = np.minimum(((s[inside] + limit) * scale).astype(np.intp), self.size - 1)
+        # Only the bins hit by the batch are touched, whatever the grid size
+        bins, counts = np.unique(gi * self.size + si, return_counts=True)
+        self.counts.reshape(-1)[bins] += counts
+
+
+class PhasorPointStore:
+    """
+    Growable columnar storage for the phasor points of one channel and harmonic.
+
+    G and S values are kept in preallocated float64 arrays that double in size
+    when full, so appending a batch is amortized O(batch). Running sums of the
+    non-NaN values make the mean and count O(1). An optional int32 column
+    records the source file of every point (phasors read mode); the points
+    are grouped by file once, on the first request after an append (see
+    file_groups).
+    """
+
+    def __init__(self, capacity=1024, with_file_ids=False):
+        """
+        Args:
+            capacity (int, optional): The initial number of points allocated. Defaults to 1024.
+            with_file_ids (bool, optional): Whether to keep a file-id column. Defaults to False.
+        """
+        self._capacity = max(1, int(capacity))
+        self._g = np.empty(self._capacity, dtype=np.float64)
+        self._s = np.empty(self._capacity, dtype=np.float64)
+        self._file_ids = (
+            np.empty(self._capacity, dtype=np.int32) if with_file_ids else None
+        )
+        self.file_names = []
+        self._count = 0
+        self._density = None
+        self._file_groups = None
+        self._file_means = None
+        self._reset_sums()
+
+    @classmethod
+    def from_arrays(cls, g, s, file_ids=None, file_names=None):
+        """
+        Builds a store holding the given points.
+
+        Args:
+            g (np.ndarray): The G values.
+            s (np.ndarray): The S values.
+            file_ids (np.ndarray, optional): The index in file_names of every point. Defaults to None.
+            file_names (list[str], optional): The source files. Defaults to None.
+
+        Returns:
+            PhasorPointStore: The filled store.
+        """
+        store = cls(capacity=len(g), with_file_ids=file_ids is not None)
+        store.file_names = list(file_names or [])
+        store.append(g, s, file_ids)
+        return store
+
+    def _reset_sums(self):
+        self._sum_g = 0.0
+        self._sum_s = 0.0
+        self._valid_g = 0
+        self._valid_s = 0
+
+    def _reserve(self, count):
+        if count <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < count:
+            capacity *= 2
+        for name in ("_g", "_s", "_file_ids"):
+            old = getattr(self, name)
+            if old is None:
+                continue
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._count] = old[: self._count]
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def append(self, g, s, file_ids=None):
+        """
+        Appends a batch of points.
+
+        Args:
+            g (array-like): The G values of the batch.
+            s (array-like): The S values of the batch.
+            file_ids (array-like | int, optional): The file id of every point, or one id
+                                                   for the whole batch. Defaults to None.
+        """
+        g = np.asarray(g, dtype=np.float64).ravel()
+        s = np.asarray(s, dtype=np.float64).ravel()
+        n = len(g)
+        if n == 0:
+            return
+        start = self._count
+        self._reserve(start + n)
+        self._g[start : start + n] = g
+        self._s[start : start + n] = s
+        if self._file_ids is not None:
+            self._file_ids[start : start + n] = 0 if file_ids is None else file_ids
+        self._count += n
+        self._file_groups = None
+        self._file_means = None
+        g_valid = ~np.isnan(g)
+        s_valid = ~np.isnan(s)
+        self._sum_g += float(g[g_valid].sum())
+        self._sum_s += float(s[s_valid].sum())
+        self._valid_g += int(np.count_nonzero(g_valid))
+        self._valid_s += int(np.count_nonzero(s_valid))
+        if self._density is not None:
+            self._density.add(g, s)
+
+    def extend(self, points):
+        """
+        Appends a batch of (g, s) pairs, as received from the acquisition queue.
+
+        Args:
+            points (list[tuple[float, float]]): The phasor points.
+        """
+        if len(points) == 0:
+            return
+        values = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.append(values[:, 0], values[:, 1])
+
+    def clear(self):
+        """Removes all the points, keeping the allocated capacity."""
+        self._count = 0
+        self.file_names = []
+        self._density = None
+        self._file_groups = None
+        self._file_means = None
+        self._reset_sums()
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def g(self):
+        """np.ndarray: A view of the stored G values."""
+        return self._g[: self._count]
+
+    @property
+    def s(self):
+        """np.ndarray: A view of the stored S values."""
+        return self._s[: self._count]
+
+    @property
+    def file_ids(self):
+        """np.ndarray | None: A view of the file-id column, None if not kept."""
+        if self._file_ids is None:
+            return None
+        return self._file_ids[: self._count]
+
+    def mean(self):
+        """
+        Returns:
+            tuple[float | None, float | None]: The NaN-ignoring mean of G and S,
+                                               (None, None) if either has no values.
+        """
+        if self._valid_g == 0 or self._valid_s == 0:
+            return None, None
+        return self._sum_g / self._valid_g, self._sum_s / self._valid_s
+
+    def density(self, bins):
+        """
+        Returns the density grid of the stored points at the given resolution.
+
+        The grid is built from the stored points the first time (or when the
+        resolution changes), then kept up to date by every append.
+
+        Args:
+            bins (int): The phasors resolution (see settings.PHASORS_RESOLUTIONS).
+
+        Returns:
+            np.ndarray: The int64 counts, shape (bins * 4, bins * 4), indexed [g, s].
+        """
+        if self._density is None or self._density.bins != int(bins):
+            self._density = PhasorDensityGrid(bins)
+            self._density.add(self.g, self.s)
+        return self._density.counts
+
+    def file_groups(self):
+        """
+        Groups the points by source file.
+
+        If the file ids are not in order, the points are stably reordered by
+        file id, so the points of each file are contiguous. The offsets are kept
+        until the next append, so grouping again is free.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: (file_ids, starts, ends) of every
+                file with points, in file-id order. A store without a file-id column
+                is a single group with id 0.
+        """
+        if self._file_groups is not None:
+            return self._file_groups
+        count = self._count
+        file_ids = self.file_ids
+        if count == 0:
+            empty = np.empty(0, dtype=np.int64)
+            self._file_groups = (empty.astype(np.int32), empty, empty)
+        elif file_ids is None:
+            self._file_groups = (
+                np.zeros(1, dtype=np.int32),
+                np.zeros(1, dtype=np.int64),
+                np.full(1, count, dtype=np.int64),
+            )
+        else:
+            if np.any(file_ids[1:] < file_ids[:-1]):
+                order = np.argsort(file_ids, kind="stable")
+                for name in ("_g", "_s", "_file_ids"):
+                    values = getattr(self, name)
+                    values[:count] = values[:count][order]
+                file_ids = self.file_ids
+            unique_ids, starts = np.unique(file_ids, return_index=True)
+            starts = starts.astype(np.int64)
+            ends = np.append(starts[1:], count)
+            self._file_groups = (unique_ids, starts, ends)
+        return self._file_groups
+
+    def file_name(self, file_id):
+        """
+        Args:
+            file_id (int): The id of a source file.
+
+        Returns:
+            str: The file name, "" if unknown.
+        """
+        return self.file_names[file_id] if 0 <= file_id < len(self.file_names) else ""
+
+    def file_means(self):
+        """
+        Returns the NaN-ignoring mean G and S of every source file.
+
+        Returns:
+            list[tuple[str, float, float]]: (file_name, mean_g, mean_s) for each file,
+                                            in file-id order; the means are NaN if the
+                                            file has no valid values.
+        """
+        if self._file_means is not None:
+            return self._file_means
+        file_ids, starts, _ = self.file_groups()
+        if len(file_ids) == 0:
+            self._file_means = []
+            return self._file_means
+        means = []
+        for values in (self.g, self.s):
+            valid = ~np.isnan(values)
+            sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+            counts = np.add.reduceat(valid.astype(np.int64), starts)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means.append(np.where(counts > 0, sums / np.maximum(counts, 1), np.nan))
+        self._file_means = [
+            (self.file_name(int(file_id)), float(mean_g), float(mean_s))
+            for file_id, mean_g, mean_s in zip(file_ids, means[0], means[1])
+        ]
+        return self._file_means
+
+    def split_by_file(self):
+        """
+        Splits the points per source file, the points of each file being contiguous.
+
+        Returns:
+            list[tuple[str, np.ndarray, np.ndarray]]: (file_name, g, s) for each file,
+                                                      in file-id order.
+        """
+        file_ids, starts, ends = self.file_groups()
+        return [
+            (self.file_name(int(file_id)), self.g[start:end], self.s[start:end])
+            for file_id, start, end in zip(file_ids, starts, ends)
+        ]
@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class TraceRingBuffer:
+    """
+    Preallocated (x, y) buffer for a scrolling time trace.
+
+    Points are written into a storage twice as large as the capacity and the
+    live window is moved back to the front only when the end of the storage is
+    reached, so appending and trimming are amortized O(1) and the live window
+    is always a contiguous view (no reallocation per point).
+    """
+
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity (int): The expected maximum number of points in the window.
+                            The buffer grows if more points need to be kept.
+        """
+        self._capacity = max(2, int(capacity))
+        self._x = np.empty(2 * self._capacity, dtype=np.float64)
+        self._y = np.empty(2 * self._capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+    @staticmethod
+    def capacity_for(time_span_seconds, bin_width_micros):
+        """
+        Args:
+            time_span_seconds (float): The time window shown by the trace.
+            bin_width_micros (int): The interval between two points.
+
+        Returns:
+            int: The number of points needed to hold the time window.
+        """
+        return int(np.ceil(time_span_seconds * 1_000_000 / max(1, bin_width_micros))) + 2
+
+    def __len__(self):
+        return self._end - self._start
+
+    def _make_room(self, incoming=1):
+        count = len(self)
+        if count + incoming > self._capacity:
+            self._capacity *= 2
+            x = np.empty(2 * self._capacity, dtype=np.float64)
+            y = np.empty(2 * self._capacity, dtype=np.float64)
+        else:
+            x, y = self._x, self._y
+        x[:count] = self._x[self._start : self._end]
+        y[:count] = self._y[self._start : self._end]
+        self._x, self._y = x, y
+        self._start, self._end = 0, count
+
+    def append(self, x, y):
+        """
+        Appends a point to the trace.
+
+        Args:
+            x (float): The x value (time).
+            y (float): The y value.
+        """
+        if self._end == len(self._x):
+            self._make_room()
+        self._x[self._end] = x
+        self._y[self._end] = y
+        self._end += 1
+
+    def extend(self, x, y):
+        """
+        Appends a batch of points to the trace.
+
+        Args:
+            x (np.ndarray): The x values (time).
+            y (np.ndarray): The y values.
+        """
+        n = len(x)
+        while self._end + n > len(self._x):
+            self._make_room(n)
+        self._x[self._end : self._end + n] = x
+        self._y[self._end : self._end + n] = y
+        self._end += n
+
+    def trim(self, span):
+        """
+        Drops the oldest points until the trace covers at most `span` on the x axis.
+
+        Args:
+            span (float): The maximum x distance between the first and last point.
+        """
+        if len(self) <= 2:
+            return
+        x = self._x[self._start : self._end]
+        first = int(np.searchsorted(x, x[-1] - span, side="left"))
+        # Settle rounding at the boundary so the test is exactly x[-1] - x[0] > span
+        while first > 0 and x[-1] - x[first - 1] <= span:
+            first -= 1
+        while first < len(x) - 1 and x[-1] - x[first] > span:
+            first += 1
+        self._start += first
+
+    def view(self):
+        """
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Contiguous views of the x and y values.
+        """
+        return self._x[self._start : self._end], self._y[self._start : self._end]
@@ -0,0 +1,142 @@
+import os
+
+import numpy as np
+
+import settings.settings as s
+from utils.bin_readers import read_spectroscopy_records
+
+
+# Bump when the summary layout changes, so older summaries are ignored
+SPECTROSCOPY_SUMMARY_VERSION = 1
+
+
+def spectroscopy_summary_path(file_path):
+    """
+    Args:
+        file_path (str): The path to the spectroscopy (SP01) file.
+
+    Returns:
+        str: The path of the summary index stored next to the file.
+    """
+    return f"{os.path.splitext(file_path)[0]}.summary.npz"
+
+
+def build_spectroscopy_summary(file_path):
+    """
+    Computes the summary of a spectroscopy (SP01) file in a single pass.
+
+    The records are walked in chunks of s.SPECTROSCOPY_SUMMARY_CHUNK_RECORDS,
+    so the memory used does not depend on the file size.
+
+    Args:
+        file_path (str): The path to the spectroscopy data file.
+
+    Returns:
+        dict: The summary arrays:
+            - summed_curves: uint64 [n_channels, 256] decay summed over all the records
+            - times: float64 [n_records] record timestamps in seconds
+            - record_count: the number of complete records
+            - time_range_ns: float64 [2] first and last record timestamps in ns
+            - intensity_per_second: uint64 [n_channels, n_seconds] photon counts
+              of each channel in each second from the first record
+    """
+    _, records = read_spectroscopy_records(file_path)
+    number_of_channels = records.dtype["curves"].shape[0]
+    record_count = len(records)
+    summed_curves = np.zeros((number_of_channels, 256), dtype=np.uint64)
+    times_ns = np.empty(record_count, dtype=np.float64)
+    if record_count == 0:
+        return {
+            "summed_curves": summed_curves,
+            "times": times_ns,
+            "record_count": np.int64(0),
+            "time_range_ns": np.zeros(2, dtype=np.float64),
+            "intensity_per_second": np.zeros((number_of_channels, 0), dtype=np.uint64),
+        }
+    first_ns = float(records["times"][0])
+    last_ns = float(records["times"][-1])
+    number_of_seconds = int((last_ns - first_ns) // 1_000_000_000) + 1
+    intensity = np.zeros((number_of_channels, number_of_seconds), dtype=np.uint64)
+    for start in range(0, record_count, s.SPECTROSCOPY_SUMMARY_CHUNK_RECORDS):
+        chunk = records[start : start + s.SPECTROSCOPY_SUMMARY_CHUNK_RECORDS]
+        times_ns[start : start + len(chunk)] = chunk["times"]
+        curves = chunk["curves"]
+        summed_curves += curves.sum(axis=0, dtype=np.uint64)
+        seconds = ((chunk["times"] - first_ns) // 1_000_000_000).astype(np.int64)
+        seconds = np.clip(seconds, 0, number_of_seconds - 1)
+        counts = curves.sum(axis=2, dtype=np.uint64)
+        for channel in range(number_of_channels):
+            intensity[channel] += np.bincount(
+                seconds, weights=counts[:, channel], minlength=number_of_seconds
+            ).astype(np.uint64)
+    return {
+        "summed_curves": summed_curves,
+        "times": times_ns / 1_000_000_000,
+        "record_count": np.int64(record_count),
+        "time_range_ns": np.array([first_ns, last_ns], dtype=np.float64),
+        "intensity_per_second": intensity,
+    }
+
+
+def write_spectroscopy_summary(file_path):
+    """
+    Builds the summary of a spectroscopy file and stores it next to the file.
+
+    The summary records the size and modification time of the file, so it is
+    ignored if the file is modified afterwards.
+
+    Args:
+        file_path (str): The path to the spectroscopy data file.
+
+    Returns:
+        str: The path of the summary index.
+    """
+    summary = build_spectroscopy_summary(file_path)
+    stat = os.stat(file_path)
+    summary_path = spectroscopy_summary_path(file_path)
+    temporary_path = f"{summary_path}.tmp"
+    with open(temporary_path, "wb") as f:
+        np.savez(
+            f,
+            version=np.int64(SPECTROSCOPY_SUMMARY_VERSION),
+            source_size=np.int64(stat.st_size),
+            source_mtime_ns=np.int64(stat.st_mtime_ns),
+            **summary,
+        )
+    os.replace(temporary_path, summary_path)
+    return summary_path
+
+
+def read_spectroscopy_summary(file_path):
+    """
+    Opens the summary index of a spectroscopy file, if present and up to date.
+
+    The arrays are read lazily: only the fields accessed are loaded.
+
+    Args:
+        file_path (str): The path to the spectroscopy data file.
+
+    Returns:
+        NpzFile | None: The summary (see build_spectroscopy_summary), None if there
+            is no valid summary for the current content of the file.
+    """
+    summary_path = spectroscopy_summary_path(file_path)
+    if not os.path.exists(summary_path):
+        return None
+    try:
+        stat = os.stat(file_path)
+        summary = np.load(summary_path)
+    except (OSError, ValueError):
+        return None
+    try:
+        up_to_date = (
+            int(summary["version"]) == SPECTROSCOPY_SUMMARY_VERSION
+            and int(summary["source_size"]) == stat.st_size
+            and int(summary["source_mtime_ns"]) == stat.st_mtime_ns
+        )
+    except (OSError, ValueError, KeyError):
+        up_to_date = False
+    if not up_to_date:
+        summary.close()
+        return None
+    return summary